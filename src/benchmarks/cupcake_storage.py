@@ -0,0 +1,69 @@
+import argparse
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+from random import randint
+from src.logic.cupcake_storage import create_cupcake_storage
+from src.settings import SCREEN_WIDTH, SCREEN_HEIGHT, SIM_STEP_MS
+
+CUPCAKE_SIZE = (60, 80)
+
+
+def benchmark_storage(kind, count, ticks):
+    """
+        Mierzy osobno czas aktualizacji (spadanie, kolizje, usuwanie) i rysowania magazynu babeczek.
+        Przed każdym krokiem magazyn jest uzupełniany do `count` babeczek; uzupełnianie nie jest wliczane do pomiaru.
+
+        Args:
+            kind (str): Rodzaj magazynu: `"list"` lub `"pool"`.
+            count (int): Liczba babeczek na ekranie.
+            ticks (int): Liczba kroków.
+
+        Returns:
+            tuple[float, float]: Średni czas aktualizacji i średni czas rysowania w sekundach.
+    """
+    screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    image = pygame.Surface(CUPCAKE_SIZE, pygame.SRCALPHA)
+    character = pygame.Rect(SCREEN_WIDTH // 2 - 75, SCREEN_HEIGHT // 2 - 75, 150, 150)
+    storage = create_cupcake_storage(kind, CUPCAKE_SIZE)
+    update_time = draw_time = 0.0
+    for _ in range(ticks):
+        for _ in range(count - len(storage)):
+            storage.spawn([randint(0, SCREEN_WIDTH - CUPCAKE_SIZE[0])], randint(-CUPCAKE_SIZE[1], SCREEN_HEIGHT))
+        start = time.perf_counter()
+        storage.update(200 * SIM_STEP_MS / 1000, character, SCREEN_HEIGHT)
+        update_time += time.perf_counter() - start
+        start = time.perf_counter()
+        storage.draw(screen, image)
+        draw_time += time.perf_counter() - start
+    return update_time / ticks, draw_time / ticks
+
+
+def main(argv=None):
+    """
+        Porównuje czasy aktualizacji i rysowania `CupcakeList` i `CupcakePool` i wypisuje wyniki.
+
+        Args:
+            argv (list[str], optional): Argumenty wiersza poleceń. Domyślnie `sys.argv[1:]`.
+    """
+    parser = argparse.ArgumentParser(prog="python -m src.benchmarks.cupcake_storage",
+                                     description="Porównanie magazynów babeczek CupcakeList i CupcakePool.")
+    parser.add_argument("--cupcakes", type=int, default=5000, help="liczba babeczek na ekranie")
+    parser.add_argument("--ticks", type=int, default=120, help="liczba kroków")
+    args = parser.parse_args(argv)
+
+    pygame.display.init()
+    try:
+        for kind in ("list", "pool"):
+            update_time, draw_time = benchmark_storage(kind, args.cupcakes, args.ticks)
+            print(f"{kind:5} update {update_time * 1000:8.3f} ms/tick   draw {draw_time * 1000:8.3f} ms/tick")
+    finally:
+        pygame.quit()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
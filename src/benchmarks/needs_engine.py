@@ -0,0 +1,77 @@
+import argparse
+import sys
+import time
+from src.entities.animal import Animal
+from src.logic.game_logic import GameLogic
+from src.logic.needs_engine import NeedsEngine
+from src.settings import SIM_STEP_MS
+
+
+def benchmark_game_logic(count, ticks, dt=SIM_STEP_MS, playtime=30):
+    """
+        Mierzy czas aktualizacji `count` osobnych obiektów `GameLogic` w pętli.
+
+        Args:
+            count (int): Liczba zwierząt.
+            ticks (int): Liczba kroków symulacji.
+            dt (float, optional): Długość kroku w milisekundach. Domyślnie `SIM_STEP_MS`.
+            playtime (float, optional): Czas zabawy w sekundach. Domyślnie `30`.
+
+        Returns:
+            tuple[float, float]: Średni czas jednego kroku w sekundach oraz średni poziom głodu po symulacji.
+    """
+    logics = [GameLogic(Animal(static_asset=None), playtime) for _ in range(count)]
+    start = time.perf_counter()
+    for _ in range(ticks):
+        for logic in logics:
+            logic.update(dt, False)
+    elapsed = time.perf_counter() - start
+    return elapsed / ticks, sum(logic.animal.hunger_level for logic in logics) / count
+
+
+def benchmark_needs_engine(count, ticks, dt=SIM_STEP_MS, playtime=30):
+    """
+        Mierzy czas aktualizacji `count` zwierząt przez `NeedsEngine`.
+
+        Args:
+            count (int): Liczba zwierząt.
+            ticks (int): Liczba kroków symulacji.
+            dt (float, optional): Długość kroku w milisekundach. Domyślnie `SIM_STEP_MS`.
+            playtime (float, optional): Czas zabawy w sekundach. Domyślnie `30`.
+
+        Returns:
+            tuple[float, float]: Średni czas jednego kroku w sekundach oraz średni poziom głodu po symulacji.
+    """
+    engine = NeedsEngine(count, playtime, seed=0)
+    start = time.perf_counter()
+    for _ in range(ticks):
+        engine.update(dt)
+    elapsed = time.perf_counter() - start
+    return elapsed / ticks, float(engine.hunger.mean())
+
+
+def main(argv=None):
+    """
+        Porównuje czas kroku `NeedsEngine` z pętlą po obiektach `GameLogic` i wypisuje wyniki.
+
+        Args:
+            argv (list[str], optional): Argumenty wiersza poleceń. Domyślnie `sys.argv[1:]`.
+    """
+    parser = argparse.ArgumentParser(prog="python -m src.benchmarks.needs_engine",
+                                     description="Porównanie NeedsEngine z pętlą po obiektach GameLogic.")
+    parser.add_argument("--pets", type=int, default=100_000, help="liczba zwierząt")
+    parser.add_argument("--ticks", type=int, default=120, help="liczba kroków symulacji")
+    args = parser.parse_args(argv)
+
+    results = {
+        "GameLogic loop": benchmark_game_logic(args.pets, args.ticks),
+        "NeedsEngine": benchmark_needs_engine(args.pets, args.ticks),
+    }
+    for name, (tick_time, mean_hunger) in results.items():
+        print(f"{name:15} {tick_time * 1000:10.3f} ms/tick   mean hunger {mean_hunger:.3f}")
+    speedup = results["GameLogic loop"][0] / results["NeedsEngine"][0]
+    print(f"speedup: {speedup:.1f}x")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
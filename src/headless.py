@@ -0,0 +1,198 @@
+import argparse
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from src.entities.animal import Animal
+from src.logic.cupcake_mode import CupcakeMode
+from src.logic.food_manager import FoodManager
+from src.logic.game_logic import GameLogic
+from src.logic.game_step import step_game
+from src.logic.launch_logic import LaunchLogic
+from src.settings import SCREEN_WIDTH, SCREEN_HEIGHT, SIM_STEP_MS
+
+CHARACTER_SIZE = (150, 150)
+FEED_THRESHOLD = 50
+PLAY_THRESHOLD = 50
+
+
+class HeadlessSimulation:
+    """
+    Symulacja logiki gry bez okna i bez odtwarzania dźwięku, przeznaczona do szybkich testów długich rozgrywek.
+
+    Kroki symulacji wykonują te same reguły gry co `GameScene.update` (`step_game`), ale nie są związane z czasem
+    rzeczywistym.
+
+    Atrybuty:
+        animal (Animal): Symulowane zwierzę.
+        game_logic (GameLogic): Logika stanu zwierzęcia.
+        launch_logic (LaunchLogic): Logika wystrzeliwania zwierzęcia.
+        food_manager (FoodManager): Menedżer jedzenia.
+        cupcake_mode (CupcakeMode): Tryb gry z babeczkami.
+        autoplay (bool): Flaga wskazująca, czy symulacja karmi zwierzę i bawi się z nim automatycznie.
+        cupcakes (bool): Flaga wskazująca, czy automatyczna zabawa używa trybu babeczek zamiast wystrzeliwania.
+        elapsed (float): Zasymulowany czas w milisekundach.
+        steps (int): Liczba wykonanych kroków symulacji.
+        feedings (int): Liczba karmień wykonanych przez automatyczną zabawę.
+        play_sessions (int): Liczba rozpoczętych sesji zabawy.
+        rng (Random): Generator liczb losowych przekazywany logice gry.
+    """
+    def __init__(self, food_quantity=3, playtime=30, autoplay=False, cupcakes=False, storm=False, rng=random):
+        """
+            Inicjalizuje symulację. Wymaga zainicjalizowanego modułu `pygame.display`.
+
+            Args:
+                food_quantity (int, optional): Ilość jedzenia dostępnego w grze. Domyślnie `3`.
+                playtime (int, optional): Czas zabawy w sekundach. Domyślnie `30`.
+                autoplay (bool, optional): Czy automatycznie karmić zwierzę i bawić się z nim. Domyślnie `False`.
+                cupcakes (bool, optional): Czy automatyczna zabawa ma używać trybu babeczek. Domyślnie `False`.
+                storm (bool, optional): Czy tryb babeczek ma działać jako bezkońcowy "cupcake storm". Domyślnie `False`.
+                rng (Random, optional): Generator liczb losowych. Domyślnie moduł `random`.
+        """
+        self.rng = rng
+        self.animal = Animal(static_asset=None, name="headless")
+        self.game_logic = GameLogic(self.animal, playtime, rng=rng)
+        self.launch_logic = LaunchLogic(SCREEN_WIDTH, SCREEN_HEIGHT, rng=rng)
+        self.launch_logic.set_position(pygame.Rect((0, 0), CHARACTER_SIZE))
+        self.launch_logic.position.center = (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
+        self.launch_logic.set_animal(self.animal)
+        self.food_manager = FoodManager(food_quantity, self.animal, rng=rng)
+        self.cupcake_mode = CupcakeMode(storm, rng=rng)
+        self.autoplay = autoplay
+        self.cupcakes = cupcakes
+        self.elapsed = 0.0
+        self.steps = 0
+        self.feedings = 0
+        self.play_sessions = 0
+
+    def step(self, dt):
+        """
+            Wykonuje jeden krok symulacji.
+
+            Args:
+                dt (float): Długość kroku w milisekundach.
+        """
+        step_game(dt, self.game_logic, self.launch_logic, self.food_manager, self.cupcake_mode)
+        if self.cupcake_mode.is_active:
+            if self.cupcake_mode.game_over:
+                self.cupcake_mode.toggle(self.launch_logic.position)
+        elif self.autoplay:
+            self._autoplay()
+        self.elapsed += dt
+        self.steps += 1
+
+    def _autoplay(self):
+        if self.animal.hunger_level >= FEED_THRESHOLD and self.food_manager.feed():
+            self.feedings += 1
+
+        if self.animal.boredom_level >= PLAY_THRESHOLD and self.game_logic.can_enter_cupcake_mode():
+            if self.cupcakes:
+                self.cupcake_mode.toggle(self.launch_logic.position)
+            else:
+                self.game_logic.toggle_launch_mode()
+            self.play_sessions += 1
+
+        if self.game_logic.launch_mode and not self.launch_logic.is_moving():
+            self.launch_logic.launch()
+
+    def run(self, duration, dt=SIM_STEP_MS):
+        """
+            Symuluje grę przez podany czas.
+
+            Args:
+                duration (float): Czas do zasymulowania w milisekundach.
+                dt (float, optional): Długość kroku w milisekundach. Domyślnie `SIM_STEP_MS`.
+
+            Returns:
+                dict: Raport ze stanem zwierzęcia po symulacji i przepustowością symulacji.
+        """
+        start = time.perf_counter()
+        end = self.elapsed + duration
+        while self.elapsed < end:
+            self.step(min(dt, end - self.elapsed))
+        wall_time = time.perf_counter() - start
+        return self.report(duration, wall_time)
+
+    def report(self, duration, wall_time):
+        """
+            Zwraca raport ze stanem symulacji.
+
+            Args:
+                duration (float): Zasymulowany czas w milisekundach.
+                wall_time (float): Rzeczywisty czas trwania symulacji w sekundach.
+
+            Returns:
+                dict: Stan zwierzęcia, liczniki symulacji oraz liczba zasymulowanych sekund na sekundę rzeczywistą.
+        """
+        return {
+            "simulated_seconds": duration / 1000,
+            "wall_seconds": wall_time,
+            "sim_seconds_per_wall_second": duration / 1000 / wall_time if wall_time > 0 else float("inf"),
+            "steps": self.steps,
+            "age": self.animal.age,
+            "hunger": self.animal.hunger_level,
+            "boredom": self.animal.boredom_level,
+            "remaining_food": self.food_manager.remaining_food,
+            "feedings": self.feedings,
+            "play_sessions": self.play_sessions,
+            "cupcakes_collected": self.cupcake_mode.highest_score,
+            "cupcakes_on_screen": len(self.cupcake_mode.cupcakes),
+        }
+
+
+def format_report(report):
+    """
+        Formatuje raport symulacji do wyświetlenia w konsoli.
+
+        Args:
+            report (dict): Raport zwrócony przez `HeadlessSimulation.run`.
+
+        Returns:
+            str: Raport w postaci wierszy `klucz: wartość`.
+    """
+    lines = []
+    for key, value in report.items():
+        if isinstance(value, float):
+            value = f"{value:.2f}"
+        lines.append(f"{key}: {value}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    """
+        Uruchamia symulację bez okna gry z parametrami podanymi w wierszu poleceń.
+
+        Args:
+            argv (list[str], optional): Argumenty wiersza poleceń. Domyślnie `sys.argv[1:]`.
+    """
+    parser = argparse.ArgumentParser(prog="python -m src.headless",
+                                     description="Symulacja gry bez okna, szybsza niż czas rzeczywisty.")
+    parser.add_argument("--duration", type=float, default=24 * 60 * 60,
+                        help="czas do zasymulowania w sekundach (domyślnie jedna doba)")
+    parser.add_argument("--step", type=float, default=SIM_STEP_MS,
+                        help="krok symulacji w milisekundach; fizyka wystrzeliwania odpowiada grze tylko dla "
+                             "domyślnego kroku")
+    parser.add_argument("--food", type=int, default=3, help="ilość jedzenia")
+    parser.add_argument("--playtime", type=int, default=30, help="czas zabawy w sekundach")
+    parser.add_argument("--autoplay", action="store_true", help="automatycznie karm zwierzę i baw się z nim")
+    parser.add_argument("--cupcakes", action="store_true", help="baw się w trybie babeczek zamiast wystrzeliwania")
+    parser.add_argument("--storm", action="store_true", help="tryb babeczek jako bezkońcowy \"cupcake storm\"")
+    parser.add_argument("--seed", type=int, default=None, help="ziarno generatora liczb losowych")
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed) if args.seed is not None else random
+    pygame.display.init()
+    try:
+        simulation = HeadlessSimulation(args.food, args.playtime, args.autoplay, args.cupcakes, args.storm, rng)
+        print(format_report(simulation.run(args.duration * 1000, args.step)))
+    finally:
+        pygame.quit()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,118 @@
+import math
+from datetime import datetime
+from src.logic.game_logic import NEED_INTERVAL, NEED_INCREASE_RANGE
+from src.managers.save_codec import TIMESTAMP_FORMAT
+
+EXACT_SAMPLE_LIMIT = 32
+
+
+def elapsed_since(timestamp, now=None):
+    """
+        Oblicza czas, który upłynął od zapisania gry.
+
+        Args:
+            timestamp (str | float | int | None): Znacznik czasu zapisu w formacie `TIMESTAMP_FORMAT` lub jako
+                liczba sekund od epoki Uniksa.
+            now (datetime, optional): Bieżący czas. Domyślnie `datetime.now()`.
+
+        Returns:
+            float: Czas w milisekundach; `0` dla brakującego lub niepoprawnego znacznika oraz dla znacznika z przyszłości.
+    """
+    now = now or datetime.now()
+    try:
+        if isinstance(timestamp, (int, float)):
+            saved = datetime.fromtimestamp(timestamp)
+        else:
+            saved = datetime.strptime(str(timestamp), TIMESTAMP_FORMAT)
+    except (ValueError, OverflowError, OSError):
+        return 0.0
+    return max(0.0, (now - saved).total_seconds() * 1000)
+
+
+def sample_need_increase(level, ticks, rng):
+    """
+        Zwraca poziom potrzeby po `ticks` wzrostach o losową wartość z `NEED_INCREASE_RANGE`, ograniczony do 100.
+
+        Ponieważ każdy wzrost jest dodatni, ograniczanie po każdym kroku daje ten sam wynik co ograniczenie sumy.
+        Dla niewielu kroków suma jest losowana dokładnie, a dla wielu z rozkładu normalnego o tej samej średniej
+        i wariancji (centralne twierdzenie graniczne), przyciętego do możliwego zakresu sumy. Jeśli nawet najmniejsze
+        możliwe przyrosty osiągają 100, wynik jest deterministyczny.
+
+        Args:
+            level (float): Poziom początkowy.
+            ticks (int): Liczba wzrostów.
+            rng (Random): Generator liczb losowych, np. `GameLogic.rng`.
+
+        Returns:
+            float: Poziom po wszystkich wzrostach.
+    """
+    if ticks <= 0:
+        return level
+    low, high = NEED_INCREASE_RANGE
+    if level + ticks * low >= 100:
+        return 100
+    if ticks <= EXACT_SAMPLE_LIMIT:
+        total = sum(rng.uniform(low, high) for _ in range(ticks))
+    else:
+        mean = ticks * (low + high) / 2
+        deviation = (high - low) * math.sqrt(ticks / 12)
+        total = min(max(rng.gauss(mean, deviation), ticks * low), ticks * high)
+    return min(100, level + total)
+
+
+def fast_forward(game_logic, food_manager, elapsed, rng=None):
+    """
+        Przesuwa stan gry o podany czas bez symulowania kolejnych kroków, według tych samych reguł co `GameLogic`.
+
+        Kolejno zużywany jest pozostały czas zabawy, okres odnowienia i czas bezczynności. Głód i znudzenie rosną
+        poza trybem zabawy, wiek tylko poza trybem zabawy i okresem odnowienia. Fazy timerów są zachowywane,
+        a okres odnowienia karmienia jest skracany o cały czas nieobecności.
+
+        Args:
+            game_logic (GameLogic): Logika gry do przesunięcia.
+            food_manager (FoodManager): Menedżer jedzenia do przesunięcia.
+            elapsed (float): Czas w milisekundach.
+            rng (Random, optional): Generator liczb losowych. Domyślnie generator logiki gry (`game_logic.rng`).
+    """
+    rng = game_logic.rng if rng is None else rng
+    remaining = max(0.0, elapsed)
+    animal = game_logic.animal
+
+    if game_logic.launch_mode:
+        playtime = game_logic.playtime_remaining
+        if remaining < playtime:
+            game_logic.playtime_remaining = playtime - remaining
+            remaining = 0.0
+        else:
+            remaining -= playtime
+            game_logic.playtime_remaining = 0
+            game_logic.cooldown_timer = game_logic.cooldown_duration
+            game_logic.launch_mode = False
+            game_logic.in_cooldown = True
+
+    idle = remaining
+    if game_logic.in_cooldown:
+        cooldown = game_logic.cooldown_timer
+        if remaining < cooldown:
+            game_logic.cooldown_timer = cooldown - remaining
+            idle = 0.0
+        else:
+            idle = remaining - cooldown
+            game_logic.cooldown_timer = 0
+            game_logic.in_cooldown = False
+
+    boredom_ticks, game_logic.boredom_timer = divmod(game_logic.boredom_timer + remaining, NEED_INTERVAL)
+    hunger_ticks, game_logic.hunger_timer = divmod(game_logic.hunger_timer + remaining, NEED_INTERVAL)
+    animal.boredom_level = sample_need_increase(animal.boredom_level, int(boredom_ticks), rng)
+    animal.hunger_level = sample_need_increase(animal.hunger_level, int(hunger_ticks), rng)
+
+    age_ticks, game_logic.age_timer = divmod(game_logic.age_timer + idle, game_logic.age_interval)
+    animal.age += int(age_ticks)
+
+    feed_cooldown = food_manager.feed_cooldown
+    if feed_cooldown > 0:
+        if elapsed >= feed_cooldown:
+            food_manager.feed_cooldown = 0
+            food_manager.remaining_food = food_manager.food_quantity
+        else:
+            food_manager.feed_cooldown = feed_cooldown - elapsed
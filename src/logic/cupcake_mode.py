@@ -1,42 +1,71 @@
 import pygame
 from src.settings import SCREEN_WIDTH, SCREEN_HEIGHT, Colors, FALL_SPEED, SPEED_TIMER, SPEED_INTERVAL, SPEED_INCREMENT
-from src.utils.functional_asset import FunctionalAsset
-from random import randint
-from src.settings import CHARACTER_SPEED, CUPCAKE_SPAWN_DELAY
+from src.managers.asset_manager import AssetManager
+from src.managers.input_manager import InputManager
+import random
+from src.logic.cupcake_storage import create_cupcake_storage
+from src.logic.scheduler import Scheduler
+from src.settings import CHARACTER_SPEED, CUPCAKE_SPAWN_DELAY, SIM_STEP_MS
+from src.settings import CUPCAKE_STORAGE, CUPCAKE_STORM, STORM_SPAWN_DELAY
+from src.utils.text_cache import render_text
+
+CUPCAKE_PATH = "assets/cupcake.png"
 
 class CupcakeMode:
     """
         Tryb gry "Cupcake Mode", w którym gracz zbiera spadające babeczki.
 
         Atrybuty:
-            cupcakes (list): Lista obiektów babeczek obecnych na ekranie.
+            storm (bool): Flaga bezkońcowego trybu "cupcake storm", w którym babeczki pojawiają się bez przerwy.
+            cupcakes (CupcakeList | CupcakePool): Magazyn pozycji babeczek obecnych na ekranie.
+            character_exact (Vector2 | None): Zmiennoprzecinkowa pozycja postaci gracza, synchronizowana z jej prostokątem.
+            cupcake_image (Surface): Współdzielony obraz babeczki.
             collected_cupcakes (int): Liczba zebranych babeczek.
             missed_cupcakes (int): Liczba pominiętych babeczek.
             highest_score (int): Najwyższy wynik osiągnięty przez gracza.
-            spawn_timer (float): Timer kontrolujący czas między pojawieniem się kolejnych babeczek.
+            spawn_timer (float): Czas, który upłynął od pojawienia się ostatniej babeczki.
             spawn_delay (float): Opóźnienie między pojawieniem się kolejnych babeczek.
             character_speed (float): Prędkość poruszania się postaci gracza.
             is_active (bool): Flaga wskazująca, czy tryb gry jest aktywny.
             game_over (bool): Flaga wskazująca, czy gra się zakończyła.
             fall_speed (float): Prędkość spadania babeczek.
-            speed_timer (float): Timer kontrolujący wzrost prędkości spadania babeczek.
+            speed_timer (float): Czas, który upłynął od ostatniego wzrostu prędkości spadania babeczek.
             speed_interval (float): Interwał czasu między wzrostami prędkości spadania babeczek.
             speed_increment (float): Wartość, o którą zwiększa się prędkość spadania babeczek.
+            scheduler (Scheduler): Zegar gry odmierzający pojawianie się babeczek i wzrost ich prędkości.
+            owns_scheduler (bool): Flaga wskazująca, czy tryb sam przesuwa zegar w metodzie `update`.
+            rng (Random): Generator liczb losowych używany do rozmieszczania babeczek.
     """
-    def __init__(self):
-        self.cupcakes = []
+    def __init__(self, storm=CUPCAKE_STORM, scheduler=None, rng=random):
+        """
+            Inicjalizuje tryb gry.
+
+            Args:
+                storm (bool, optional): Czy włączyć bezkońcowy tryb "cupcake storm". Tryb ten zawsze używa puli
+                    `CupcakePool`. Domyślnie `CUPCAKE_STORM`.
+                scheduler (Scheduler, optional): Współdzielony zegar gry. Domyślnie `None` - tryb tworzy własny zegar.
+                rng (Random, optional): Generator liczb losowych. Domyślnie moduł `random`.
+        """
+        self.rng = rng
+        self.cupcake_size = (60, int(60 * (466 / 348)))
+        self.storm = storm
+        self.cupcakes = create_cupcake_storage("pool" if storm else CUPCAKE_STORAGE, self.cupcake_size)
+        self.character_exact = None
         self.collected_cupcakes = 0
         self.missed_cupcakes = 0
         self.highest_score = 0
-        self.spawn_timer = 0
-        self.spawn_delay = CUPCAKE_SPAWN_DELAY
+        self.owns_scheduler = scheduler is None
+        self.scheduler = Scheduler() if scheduler is None else scheduler
+        self._spawn_task = None
+        self._speed_task = None
+        self.spawn_delay = STORM_SPAWN_DELAY if storm else CUPCAKE_SPAWN_DELAY
         self.character_speed = CHARACTER_SPEED
         self.is_active = False
         self.game_over = False
         self.fall_speed = FALL_SPEED
-        self.speed_timer = SPEED_TIMER
         self.speed_interval = SPEED_INTERVAL
         self.speed_increment = SPEED_INCREMENT
+        self.cupcake_image = AssetManager.acquire(CUPCAKE_PATH, self.cupcake_size)
 
     def toggle(self, character_position=None):
         """
@@ -50,12 +79,40 @@ class CupcakeMode:
         """
         self.is_active = not self.is_active
         self.game_over = False
-        if not self.is_active:
+        if self.is_active:
+            self._start_timers()
+        else:
             self.reset()
             if character_position:
                 character_position.center = (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
         return self.is_active
 
+    @property
+    def spawn_timer(self):
+        return self.scheduler.elapsed(self._spawn_task) if self._spawn_task else 0
+
+    @property
+    def speed_timer(self):
+        return self.scheduler.elapsed(self._speed_task) if self._speed_task else SPEED_TIMER
+
+    def _start_timers(self):
+        self._stop_timers()
+        self._spawn_task = self.scheduler.call_every(self.spawn_delay, self._spawn_cupcakes)
+        self._speed_task = self.scheduler.call_every(self.speed_interval, self._increase_fall_speed,
+                                                     delay=self.speed_interval - SPEED_TIMER)
+
+    def _stop_timers(self):
+        self.scheduler.cancel(self._spawn_task)
+        self.scheduler.cancel(self._speed_task)
+        self._spawn_task = None
+        self._speed_task = None
+
+    def _increase_fall_speed(self):
+        """
+            Zwiększa prędkość spadania babeczek. Wywoływana przez zegar gry co `speed_interval` milisekund.
+        """
+        self.fall_speed += self.speed_increment
+
     def update(self, dt, character_position, character_rect):
         """
             Aktualizuje stan gry, w tym pozycję postaci, babeczki i logikę kolizji.
@@ -69,90 +126,91 @@ class CupcakeMode:
             return
 
         # Logika poruszania się postaci
-        keys = pygame.key.get_pressed()
-        if keys[pygame.K_w]:
-            character_position.y -= self.character_speed * dt
-        if keys[pygame.K_s]:
-            character_position.y += self.character_speed * dt
-        if keys[pygame.K_a]:
-            character_position.x -= self.character_speed * dt
-        if keys[pygame.K_d]:
-            character_position.x += self.character_speed * dt
+        exact = self.character_exact
+        if exact is None or character_position.topleft != (round(exact.x), round(exact.y)):
+            exact = pygame.math.Vector2(character_position.topleft)
+        if InputManager.is_pressed(pygame.K_w):
+            exact.y -= self.character_speed * dt
+        if InputManager.is_pressed(pygame.K_s):
+            exact.y += self.character_speed * dt
+        if InputManager.is_pressed(pygame.K_a):
+            exact.x -= self.character_speed * dt
+        if InputManager.is_pressed(pygame.K_d):
+            exact.x += self.character_speed * dt
 
         # Ograniczenie ruchu postaci do granic ekranu
-        character_position.x = max(0, min(character_position.x, SCREEN_WIDTH - character_rect.width))
-        character_position.y = max(0, min(character_position.y, SCREEN_HEIGHT - character_rect.height))
+        exact.x = max(0, min(exact.x, SCREEN_WIDTH - character_rect.width))
+        exact.y = max(0, min(exact.y, SCREEN_HEIGHT - character_rect.height))
+        character_position.topleft = (round(exact.x), round(exact.y))
+        self.character_exact = exact
 
-        # Logika pojawiania się babeczek
-        self.spawn_timer += dt
-        if self.spawn_timer >= self.spawn_delay:
-            self._spawn_cupcake()
-            self.spawn_timer = 0
-
-        # Logika zwiększania prędkości spadania babeczek
-        self.speed_timer += dt
-        if self.speed_timer >= self.speed_interval:
-            self.fall_speed += self.speed_increment
-            self.speed_timer = 0
+        # Pojawianie się babeczek i wzrost ich prędkości są odmierzane przez zegar gry
+        if self.owns_scheduler:
+            self.scheduler.advance(dt)
 
         # Aktualizacja pozycji babeczek i logika kolizji
-        for cupcake in self.cupcakes[:]:
-            cupcake.rect.y += self.fall_speed * (dt / 1000)
-
-            if cupcake.rect.colliderect(character_rect):
-                self.cupcakes.remove(cupcake)
-                self.collected_cupcakes += 1
-                if self.collected_cupcakes > self.highest_score:
-                    self.highest_score = self.collected_cupcakes
-            elif cupcake.rect.top > SCREEN_HEIGHT:
-                self.cupcakes.remove(cupcake)
-                self.missed_cupcakes += 1
-                if self.missed_cupcakes >= 5:
-                    self.game_over = True
-
-    def _spawn_cupcake(self):
+        collected, missed = self.cupcakes.update(self.fall_speed * (dt / 1000), character_rect, SCREEN_HEIGHT)
+        self.collected_cupcakes += collected
+        self.highest_score = max(self.highest_score, self.collected_cupcakes)
+        self.missed_cupcakes += missed
+        if self.missed_cupcakes >= 5 and not self.storm:
+            self.game_over = True
+            self._stop_timers()
+
+    def _spawn_cupcakes(self, count=1):
         """
-            Tworzy nową babeczkę i dodaje ją do listy babeczek.
+            Dodaje nowe babeczki nad górną krawędzią ekranu. Obraz babeczki jest współdzielony, więc zapamiętywana jest tylko jej pozycja.
+
+            Args:
+                count (int, optional): Liczba babeczek do dodania. Domyślnie `1`.
         """
         margin = 50
-        width = 60
-        height = int(width * (466 / 348))
-        x = randint(margin, SCREEN_WIDTH - margin - width)
-        y = -height
-        cupcake = FunctionalAsset("assets/cupcake.png", (width, height), (x, y))
-        self.cupcakes.append(cupcake)
+        width, height = self.cupcake_size
+        xs = [self.rng.randint(margin, SCREEN_WIDTH - margin - width) for _ in range(count)]
+        self.cupcakes.spawn(xs, -height)
 
-    def draw(self, screen, font):
+    def draw(self, screen, font, alpha=1.0):
         """
             Rysuje babeczki oraz informacje o stanie gry na ekranie.
 
             Args:
                 screen (Surface): Powierzchnia Pygame, na której elementy mają być narysowane.
                 font (Font): Czcionka używana do wyświetlania tekstu.
+                alpha (float, optional): Współczynnik interpolacji pomiędzy poprzednim a bieżącym krokiem symulacji. Domyślnie `1.0`.
+
+            Returns:
+                list[Rect]: Obszary ekranu zajmowane przez babeczki i napisy.
         """
         if not self.is_active:
-            return
+            return []
 
-        for cupcake in self.cupcakes:
-            cupcake.draw(screen)
+        lag = 0 if self.game_over else (1 - alpha) * self.fall_speed * (SIM_STEP_MS / 1000)
+        rects = self.cupcakes.draw(screen, self.cupcake_image, lag)
 
         counter_text = f"Cupcakes: {self.collected_cupcakes} | Missed: {self.missed_cupcakes} | High Score: {self.highest_score}"
-        counter_surface = font.render(counter_text, True, Colors.DARK_VIOLET_BUTTON.value)
-        screen.blit(counter_surface, (SCREEN_WIDTH - counter_surface.get_width() - 20, 20))
+        counter_surface = render_text(font, counter_text, True, Colors.DARK_VIOLET_BUTTON.value)
+        rects.append(screen.blit(counter_surface, (SCREEN_WIDTH - counter_surface.get_width() - 20, 20)))
 
         if self.game_over:
-            game_over_text = font.render("GAME OVER - YOU'VE LOST 5 CUPCAKES!", True, (255, 0, 0))
-            screen.blit(game_over_text, (SCREEN_WIDTH // 2 - game_over_text.get_width() // 2, SCREEN_HEIGHT // 2))
+            game_over_text = render_text(font, "GAME OVER - YOU'VE LOST 5 CUPCAKES!", True, (255, 0, 0))
+            rects.append(screen.blit(game_over_text, (SCREEN_WIDTH // 2 - game_over_text.get_width() // 2, SCREEN_HEIGHT // 2)))
+        return rects
 
     def reset(self):
         """
            Resetuje stan gry do wartości początkowych.
         """
         self.cupcakes.clear()
+        self.character_exact = None
         self.collected_cupcakes = 0
         self.missed_cupcakes = 0
-        self.spawn_timer = 0
+        self._stop_timers()
         self.fall_speed = 200
-        self.speed_timer = 0
         self.is_active = False
-        self.game_over = False
\ No newline at end of file
+        self.game_over = False
+
+    def release(self):
+        """
+           Zwalnia odwołanie do współdzielonego obrazu babeczki w menedżerze zasobów.
+        """
+        AssetManager.release(CUPCAKE_PATH, self.cupcake_size)
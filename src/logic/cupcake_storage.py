@@ -0,0 +1,188 @@
+import numpy as np
+import pygame
+
+
+class CupcakeList:
+    """
+    Przechowuje babeczki jako listę pozycji. Wystarcza dla zwykłego trybu gry z kilkoma babeczkami na ekranie.
+
+    Atrybuty:
+        size (tuple[int, int]): Rozmiar babeczki.
+        positions (list[Vector2]): Zmiennoprzecinkowe pozycje lewych górnych rogów babeczek.
+    """
+    def __init__(self, size):
+        self.size = size
+        self.positions = []
+
+    def __len__(self):
+        return len(self.positions)
+
+    def spawn(self, xs, y):
+        """
+            Dodaje babeczki na podanej wysokości.
+
+            Args:
+                xs (Iterable[float]): Współrzędne x nowych babeczek.
+                y (float): Współrzędna y nowych babeczek.
+        """
+        self.positions.extend(pygame.math.Vector2(x, y) for x in xs)
+
+    def update(self, dy, character_rect, bottom):
+        """
+            Przesuwa babeczki w dół i usuwa złapane oraz te, które spadły poza ekran.
+
+            Args:
+                dy (float): Przesunięcie babeczek w pionie.
+                character_rect (Rect): Prostokąt postaci gracza.
+                bottom (float): Wysokość, poniżej której babeczka jest uznawana za pominiętą.
+
+            Returns:
+                tuple[int, int]: Liczba złapanych i pominiętych babeczek.
+        """
+        collected = missed = 0
+        remaining = []
+        for position in self.positions:
+            position.y += dy
+            if character_rect.colliderect(pygame.Rect(position, self.size)):
+                collected += 1
+            elif position.y > bottom:
+                missed += 1
+            else:
+                remaining.append(position)
+        self.positions = remaining
+        return collected, missed
+
+    def draw(self, screen, image, lag=0):
+        """
+            Rysuje babeczki jednym wywołaniem `Surface.blits`.
+
+            Args:
+                screen (Surface): Powierzchnia, na której babeczki mają być narysowane.
+                image (Surface): Współdzielony obraz babeczki.
+                lag (float, optional): Przesunięcie w górę wynikające z interpolacji. Domyślnie `0`.
+
+            Returns:
+                list[Rect]: Obszary ekranu zajmowane przez babeczki.
+        """
+        return screen.blits([(image, (round(p.x), round(p.y - lag))) for p in self.positions])
+
+    def clear(self):
+        """
+            Usuwa wszystkie babeczki.
+        """
+        self.positions.clear()
+
+
+class CupcakePool:
+    """
+    Przechowuje babeczki w zaalokowanych z góry tablicach NumPy z maską aktywnych miejsc.
+
+    Spadanie, usuwanie babeczek spoza ekranu i test kolizji z postacią są wykonywane jedną operacją na tablicach,
+    dzięki czemu pula obsługuje tysiące babeczek naraz. Zwolnione miejsca są używane ponownie, a gdy pula się zapełni,
+    jej pojemność jest podwajana.
+
+    Atrybuty:
+        size (tuple[int, int]): Rozmiar babeczki.
+        x (ndarray): Współrzędne x babeczek.
+        y (ndarray): Współrzędne y babeczek.
+        alive (ndarray): Maska miejsc zajętych przez babeczki.
+        free (list[int]): Indeksy wolnych miejsc.
+    """
+    def __init__(self, size, capacity=1024):
+        self.size = size
+        self.x = np.zeros(capacity)
+        self.y = np.zeros(capacity)
+        self.alive = np.zeros(capacity, dtype=bool)
+        self.free = list(range(capacity - 1, -1, -1))
+
+    def __len__(self):
+        return int(np.count_nonzero(self.alive))
+
+    def _grow(self, needed):
+        capacity = len(self.alive)
+        new_capacity = max(capacity * 2, capacity + needed)
+        self.x = np.resize(self.x, new_capacity)
+        self.y = np.resize(self.y, new_capacity)
+        self.alive = np.concatenate([self.alive, np.zeros(new_capacity - capacity, dtype=bool)])
+        self.free[:0] = range(new_capacity - 1, capacity - 1, -1)
+
+    def spawn(self, xs, y):
+        """
+            Dodaje babeczki na podanej wysokości, zajmując wolne miejsca w puli.
+
+            Args:
+                xs (Iterable[float]): Współrzędne x nowych babeczek.
+                y (float): Współrzędna y nowych babeczek.
+        """
+        xs = np.fromiter(xs, dtype=float)
+        if len(xs) > len(self.free):
+            self._grow(len(xs) - len(self.free))
+        slots = [self.free.pop() for _ in range(len(xs))]
+        self.x[slots] = xs
+        self.y[slots] = y
+        self.alive[slots] = True
+
+    def update(self, dy, character_rect, bottom):
+        """
+            Przesuwa babeczki w dół i usuwa złapane oraz te, które spadły poza ekran.
+
+            Args:
+                dy (float): Przesunięcie babeczek w pionie.
+                character_rect (Rect): Prostokąt postaci gracza.
+                bottom (float): Wysokość, poniżej której babeczka jest uznawana za pominiętą.
+
+            Returns:
+                tuple[int, int]: Liczba złapanych i pominiętych babeczek.
+        """
+        alive = self.alive
+        self.y[alive] += dy
+        width, height = self.size
+        hit = alive & (self.x < character_rect.right) & (self.x + width > character_rect.left) \
+            & (self.y < character_rect.bottom) & (self.y + height > character_rect.top)
+        out = alive & ~hit & (self.y > bottom)
+        removed = np.flatnonzero(hit | out)
+        alive[removed] = False
+        self.free.extend(removed.tolist())
+        return int(np.count_nonzero(hit)), int(np.count_nonzero(out))
+
+    def draw(self, screen, image, lag=0):
+        """
+            Rysuje babeczki jednym wywołaniem `Surface.blits`.
+
+            Args:
+                screen (Surface): Powierzchnia, na której babeczki mają być narysowane.
+                image (Surface): Współdzielony obraz babeczki.
+                lag (float, optional): Przesunięcie w górę wynikające z interpolacji. Domyślnie `0`.
+
+            Returns:
+                list[Rect]: Obszary ekranu zajmowane przez babeczki.
+        """
+        alive = self.alive
+        xs = np.rint(self.x[alive]).astype(int).tolist()
+        ys = np.rint(self.y[alive] - lag).astype(int).tolist()
+        return screen.blits([(image, position) for position in zip(xs, ys)])
+
+    def clear(self):
+        """
+            Usuwa wszystkie babeczki.
+        """
+        self.alive[:] = False
+        self.free = list(range(len(self.alive) - 1, -1, -1))
+
+
+def create_cupcake_storage(kind, size):
+    """
+        Tworzy magazyn babeczek podanego rodzaju.
+
+        Args:
+            kind (str): `"list"` dla `CupcakeList` lub `"pool"` dla `CupcakePool`.
+            size (tuple[int, int]): Rozmiar babeczki.
+
+        Returns:
+            CupcakeList | CupcakePool: Pusty magazyn babeczek.
+    """
+    if kind == "pool":
+        return CupcakePool(size)
+    if kind == "list":
+        return CupcakeList(size)
+    raise ValueError(f"Unknown cupcake storage: {kind}")
@@ -1,12 +1,15 @@
 import pygame
-from random import randint
+import random
 from src.settings import SCREEN_WIDTH, SCREEN_HEIGHT
 from src.utils.functional_asset import FunctionalAsset
 from src.settings import FOOD_COOLDOWN_DURATION
 from src.managers.audio_manager import AudioManager
+from src.logic.scheduler import Scheduler
+
+FEEDING_SOUND_PATH = "assets/audio/feeding_sound.mp3"
 
 class FoodManager:
-    def __init__(self, food_quantity, animal):
+    def __init__(self, food_quantity, animal, scheduler=None, rng=random):
         """
         Zarządza jedzeniem w grze, w tym jego pojawianiem się, interakcją z postacią oraz karmieniem zwierzęcia.
 
@@ -19,10 +22,22 @@ class FoodManager:
             animal (Animal): Zwierzę, które jest karmione.
             hunger_decrease (int): Wartość, o którą zmniejsza się poziom głodu zwierzęcia po karmieniu.
             audio_manager (AudioManager): Menedżer audio odpowiedzialny za odtwarzanie efektów dźwiękowych
+            scheduler (Scheduler): Zegar gry odmierzający okres odnowienia karmienia.
+            owns_scheduler (bool): Flaga wskazująca, czy menedżer sam przesuwa zegar w metodzie `update`.
+            rng (Random): Generator liczb losowych używany do rozmieszczania jedzenia.
+
+        Args:
+            food_quantity (int): Początkowa liczba porcji jedzenia.
+            animal (Animal): Zwierzę, które jest karmione.
+            scheduler (Scheduler, optional): Współdzielony zegar gry. Domyślnie `None` - menedżer tworzy własny zegar.
+            rng (Random, optional): Generator liczb losowych. Domyślnie moduł `random`.
         """
+        self.rng = rng
         self.food_quantity = food_quantity
         self.remaining_food = food_quantity
-        self.feed_cooldown = 0
+        self.owns_scheduler = scheduler is None
+        self.scheduler = Scheduler() if scheduler is None else scheduler
+        self._cooldown_task = None
         self.feed_cooldown_duration = FOOD_COOLDOWN_DURATION
         self.food_item = None
         self.animal = animal
@@ -36,11 +51,26 @@ class FoodManager:
            Args:
                dt (float): Czas, który upłynął od ostatniej aktualizacji.
         """
-        if self.feed_cooldown > 0:
-            self.feed_cooldown -= dt
-            if self.feed_cooldown <= 0:
-                self.feed_cooldown = 0
-                self.remaining_food = self.food_quantity
+        if self.owns_scheduler:
+            self.scheduler.advance(dt)
+
+    @property
+    def feed_cooldown(self):
+        return self.scheduler.remaining(self._cooldown_task)
+
+    @feed_cooldown.setter
+    def feed_cooldown(self, value):
+        self.scheduler.cancel(self._cooldown_task)
+        self._cooldown_task = None
+        if value > 0:
+            self._cooldown_task = self.scheduler.call_later(value, self._end_cooldown)
+
+    def _end_cooldown(self):
+        """
+            Kończy okres odnowienia karmienia i uzupełnia jedzenie. Wywoływana przez zegar gry.
+        """
+        self._cooldown_task = None
+        self.remaining_food = self.food_quantity
 
     def spawn_food(self):
         """
@@ -49,12 +79,24 @@ class FoodManager:
         if not self.food_item and self.feed_cooldown <= 0 < self.remaining_food:
             margin = 50
             food_size = (64, 64)
-            x = randint(margin, SCREEN_WIDTH - margin - food_size[0])
-            y = randint(margin, SCREEN_HEIGHT - margin - food_size[1])
-            food_number = randint(1, 4)
+            x = self.rng.randint(margin, SCREEN_WIDTH - margin - food_size[0])
+            y = self.rng.randint(margin, SCREEN_HEIGHT - margin - food_size[1])
+            food_number = self.rng.randint(1, 4)
             food_image_path = f"assets/food{food_number}.png"
             self.food_item = FunctionalAsset(food_image_path, food_size, (x, y), label=None)
 
+    def feed(self):
+        """
+            Karmi zwierzę bez przeciągania jedzenia, np. w symulacji bez okna gry.
+
+            Returns:
+                bool: Zwraca `True`, jeśli zwierzę zostało nakarmione, w przeciwnym razie `False`.
+        """
+        if self.feed_cooldown <= 0 < self.remaining_food:
+            self._feed_animal()
+            return True
+        return False
+
     def handle_food_event(self, event, character_rect):
         """
             Obsługuje zdarzenia związane z interakcją z jedzeniem.
@@ -79,9 +121,11 @@ class FoodManager:
             Karmi zwierzę, zmniejszając jego poziom głodu.
         """
         self.animal.hunger_level = max(0, self.animal.hunger_level - self.hunger_decrease)
+        if self.food_item:
+            self.food_item.release()
         self.food_item = None
         self.remaining_food -= 1
-        self.audio_manager.play_sound_effect("assets/audio/feeding_sound.mp3")
+        self.audio_manager.play_sound_effect(FEEDING_SOUND_PATH)
         if self.remaining_food <= 0:
             self.feed_cooldown = self.feed_cooldown_duration
 
@@ -91,14 +135,20 @@ class FoodManager:
 
             Args:
                 screen (Surface): Powierzchnia Pygame, na której element ma być narysowany.
+
+            Returns:
+                Rect | None: Obszar ekranu zajmowany przez jedzenie lub `None`, jeśli nie ma go na ekranie.
         """
         if self.food_item:
-            self.food_item.draw(screen)
+            return self.food_item.draw(screen)
+        return None
 
     def reset(self):
         """
             Resetuje stan menedżera jedzenia do wartości początkowych.
         """
+        if self.food_item:
+            self.food_item.release()
         self.food_item = None
         self.feed_cooldown = 0
         self.remaining_food = self.food_quantity 
\ No newline at end of file
@@ -1,40 +1,160 @@
-from random import uniform
+import random
 from src.settings import AGE_INTERVAL
 from src.settings import PLAYTIME_COOLDOWN_DURATION
+from src.logic.scheduler import Scheduler
+
+NEED_INTERVAL = 1000
+NEED_INCREASE_RANGE = (0.25, 1.25)
 
 
 class GameLogic:
     """
     Logika gry, zarządzająca stanem zwierzęcia, czasem zabawy oraz trybem gry.
 
+    Upływ czasu jest odmierzany przez zadania zarejestrowane w `Scheduler`. Zadania potrzeb i wieku są wstrzymywane
+    i wznawiane przy każdej zmianie trybu, dlatego pozostały czas nie przepada przy przejściu między trybami.
+
     Atrybuty:
         animal (Animal): Obiekt zwierzęcia, którego stan jest zarządzany.
-        playtime (float): Czas zabawy w milisekundach.
+        playtime (float): Czas zabawy w sekundach.
         playtime_remaining (float): Pozostały czas zabawy w milisekundach.
         cooldown_duration (float): Czas trwania okresu odnowienia po zabawie.
         age_interval (float): Interwał czasu, po którym zwierzę się starzeje.
         launch_mode (bool): Flaga wskazująca, czy tryb zabawy jest aktywny.
         in_cooldown (bool): Flaga wskazująca, czy okres odnowienia jest aktywny.
-        cooldown_timer (float): Timer kontrolujący czas pozostały do zakończenia okresu odnowienia.
-        age_timer (float): Timer kontrolujący czas do starzenia się zwierzęcia.
-        boredom_timer (float): Timer kontrolujący wzrost poziomu znudzenia zwierzęcia.
-        hunger_timer (float): Timer kontrolujący wzrost poziomu głodu zwierzęcia.
+        cooldown_timer (float): Czas pozostały do zakończenia okresu odnowienia.
+        age_timer (float): Czas, który upłynął od ostatniego starzenia się zwierzęcia.
+        boredom_timer (float): Czas, który upłynął od ostatniego wzrostu poziomu znudzenia.
+        hunger_timer (float): Czas, który upłynął od ostatniego wzrostu poziomu głodu.
+        scheduler (Scheduler): Zegar gry, w którym zarejestrowane są zadania logiki.
+        owns_scheduler (bool): Flaga wskazująca, czy logika sama przesuwa zegar w metodzie `update`.
+        rng (Random): Generator liczb losowych używany do wzrostu potrzeb.
     """
-    def __init__(self, animal, playtime):
+    def __init__(self, animal, playtime, scheduler=None, rng=random):
+        """
+            Inicjalizuje logikę gry i rejestruje zadania wzrostu potrzeb oraz starzenia się zwierzęcia.
+
+            Args:
+                animal (Animal): Obiekt zwierzęcia, którego stan jest zarządzany.
+                playtime (float): Czas zabawy w sekundach.
+                scheduler (Scheduler, optional): Współdzielony zegar gry. Domyślnie `None` - logika tworzy własny
+                    zegar i przesuwa go w metodzie `update`.
+                rng (Random, optional): Generator liczb losowych. Domyślnie moduł `random`.
+        """
         self.animal = animal
+        self.rng = rng
         self.playtime = playtime
-        self.playtime_remaining = playtime
         self.cooldown_duration = PLAYTIME_COOLDOWN_DURATION
         self.age_interval = AGE_INTERVAL
-        self.launch_mode = False
-        self.in_cooldown = False
-        self.cooldown_timer = 0
-        self.age_timer = 0
-        self.boredom_timer = 0
-        self.hunger_timer = 0
+        self.owns_scheduler = scheduler is None
+        self.scheduler = Scheduler() if scheduler is None else scheduler
+        self._launch_mode = False
+        self._in_cooldown = False
+        self._playtime_remaining = playtime
+        self._cooldown_timer = 0
+        self._playtime_task = None
+        self._cooldown_task = None
+        self._boredom_task = self.scheduler.call_every(NEED_INTERVAL, self._increase_boredom)
+        self._hunger_task = self.scheduler.call_every(NEED_INTERVAL, self._increase_hunger)
+        self._age_task = self.scheduler.call_every(self.age_interval, self._increase_age)
         self.animal.hunger_level = 0
         self.animal.boredom_level = 0
 
+    @property
+    def launch_mode(self):
+        return self._launch_mode
+
+    @launch_mode.setter
+    def launch_mode(self, value):
+        self._launch_mode = bool(value)
+        self._sync_timers()
+
+    @property
+    def in_cooldown(self):
+        return self._in_cooldown
+
+    @in_cooldown.setter
+    def in_cooldown(self, value):
+        self._in_cooldown = bool(value)
+        self._sync_timers()
+
+    @property
+    def playtime_remaining(self):
+        if self._playtime_task is not None:
+            return self.scheduler.remaining(self._playtime_task)
+        return self._playtime_remaining
+
+    @playtime_remaining.setter
+    def playtime_remaining(self, value):
+        self._playtime_remaining = value
+        if self._playtime_task is not None:
+            self.scheduler.reschedule(self._playtime_task, value)
+
+    @property
+    def cooldown_timer(self):
+        if self._cooldown_task is not None:
+            return self.scheduler.remaining(self._cooldown_task)
+        return self._cooldown_timer
+
+    @cooldown_timer.setter
+    def cooldown_timer(self, value):
+        self._cooldown_timer = value
+        if self._cooldown_task is not None:
+            self.scheduler.reschedule(self._cooldown_task, value)
+
+    @property
+    def age_timer(self):
+        return self.scheduler.elapsed(self._age_task)
+
+    @age_timer.setter
+    def age_timer(self, value):
+        self.scheduler.set_remaining(self._age_task, self.age_interval - value)
+
+    @property
+    def boredom_timer(self):
+        return self.scheduler.elapsed(self._boredom_task)
+
+    @boredom_timer.setter
+    def boredom_timer(self, value):
+        self.scheduler.set_remaining(self._boredom_task, NEED_INTERVAL - value)
+
+    @property
+    def hunger_timer(self):
+        return self.scheduler.elapsed(self._hunger_task)
+
+    @hunger_timer.setter
+    def hunger_timer(self, value):
+        self.scheduler.set_remaining(self._hunger_task, NEED_INTERVAL - value)
+
+    def _sync_timers(self):
+        """
+            Wstrzymuje lub wznawia zadania zgodnie z bieżącym trybem gry: potrzeby rosną poza trybem zabawy,
+            a zwierzę starzeje się tylko poza trybem zabawy i okresem odnowienia.
+        """
+        scheduler = self.scheduler
+        idle = not self._launch_mode and not self._in_cooldown
+        for task, running in ((self._boredom_task, not self._launch_mode),
+                              (self._hunger_task, not self._launch_mode),
+                              (self._age_task, idle)):
+            if running:
+                scheduler.resume(task)
+            else:
+                scheduler.pause(task)
+
+        if self._launch_mode and self._playtime_task is None:
+            self._playtime_task = scheduler.call_later(self._playtime_remaining, self._end_playtime)
+        elif not self._launch_mode and self._playtime_task is not None:
+            self._playtime_remaining = scheduler.remaining(self._playtime_task)
+            scheduler.cancel(self._playtime_task)
+            self._playtime_task = None
+
+        if self._in_cooldown and self._cooldown_task is None:
+            self._cooldown_task = scheduler.call_later(self._cooldown_timer, self._end_cooldown)
+        elif not self._in_cooldown and self._cooldown_task is not None:
+            self._cooldown_timer = scheduler.remaining(self._cooldown_task)
+            scheduler.cancel(self._cooldown_task)
+            self._cooldown_task = None
+
     def toggle_launch_mode(self):
         """
             Przełącza tryb zabawy.
@@ -66,41 +186,22 @@ class GameLogic:
                 dt (float): Czas, który upłynął od ostatniej aktualizacji.
                 is_moving (bool): Flaga wskazująca, czy postać gracza się porusza.
         """
-        if self.launch_mode:
-            self._update_playtime(dt)
-        elif self.in_cooldown:
-            self._update_cooldown(dt)
-            self._update_boredom(dt)
-            self._update_hunger(dt)
-        else:
-            self._update_boredom(dt)
-            self._update_hunger(dt)
+        if self.owns_scheduler:
+            self.scheduler.advance(dt)
+        if not self.launch_mode and not self.in_cooldown:
             self._reduce_boredom_if_moving(dt, is_moving)
-            self._update_age(dt)
 
-    def _update_boredom(self, dt):
+    def _increase_boredom(self):
         """
-            Aktualizuje poziom znudzenia zwierzęcia.
-
-            Args:
-                dt (float): Czas, który upłynął od ostatniej aktualizacji.
+            Zwiększa poziom znudzenia zwierzęcia. Wywoływana przez zegar gry co `NEED_INTERVAL` milisekund.
         """
-        self.boredom_timer += dt
-        if self.boredom_timer >= 1000:
-            self.animal.boredom_level = min(100, self.animal.boredom_level + uniform(0.25, 1.25))
-            self.boredom_timer = 0
+        self.animal.boredom_level = min(100, self.animal.boredom_level + self.rng.uniform(*NEED_INCREASE_RANGE))
 
-    def _update_hunger(self, dt):
+    def _increase_hunger(self):
         """
-            Aktualizuje poziom głodu zwierzęcia.
-
-            Args:
-                dt (float): Czas, który upłynął od ostatniej aktualizacji.
+            Zwiększa poziom głodu zwierzęcia. Wywoływana przez zegar gry co `NEED_INTERVAL` milisekund.
         """
-        self.hunger_timer += dt
-        if self.hunger_timer >= 1000:
-            self.animal.hunger_level = min(100, self.animal.hunger_level + uniform(0.25, 1.25))
-            self.hunger_timer = 0
+        self.animal.hunger_level = min(100, self.animal.hunger_level + self.rng.uniform(*NEED_INCREASE_RANGE))
 
     def _reduce_boredom_if_moving(self, dt, is_moving):
         """
@@ -113,39 +214,28 @@ class GameLogic:
         if is_moving:
             self.animal.boredom_level = max(0, self.animal.boredom_level - 0.2 * dt / 1000)
 
-    def _update_playtime(self, dt):
+    def _end_playtime(self):
         """
-            Aktualizuje czas zabawy zwierzęcia.
-
-            Args:
-                dt (float): Czas, który upłynął od ostatniej aktualizacji.
+            Kończy tryb zabawy i rozpoczyna okres odnowienia. Wywoływana przez zegar gry.
         """
-        self.playtime_remaining -= dt
-        if self.playtime_remaining <= 0:
-            self.launch_mode = False
-            self.in_cooldown = True
-            self.cooldown_timer = self.cooldown_duration
+        self._playtime_task = None
+        self._playtime_remaining = 0
+        self._launch_mode = False
+        self._in_cooldown = True
+        self._cooldown_timer = self.cooldown_duration
+        self._sync_timers()
 
-    def _update_cooldown(self, dt):
+    def _end_cooldown(self):
         """
-            Aktualizuje czas odnowienia po zabawie.
-
-            Args:
-                dt (float): Czas, który upłynął od ostatniej aktualizacji.
+            Kończy okres odnowienia po zabawie. Wywoływana przez zegar gry.
         """
-        self.cooldown_timer -= dt
-        if self.cooldown_timer <= 0:
-            self.in_cooldown = False
-            self.cooldown_timer = 0
+        self._cooldown_task = None
+        self._cooldown_timer = 0
+        self._in_cooldown = False
+        self._sync_timers()
 
-    def _update_age(self, dt):
+    def _increase_age(self):
         """
-            Aktualizuje wiek zwierzęcia.
-
-            Args:
-                dt (float): Czas, który upłynął od ostatniej aktualizacji.
+            Zwiększa wiek zwierzęcia. Wywoływana przez zegar gry co `age_interval` milisekund.
         """
-        self.age_timer += dt
-        if self.age_timer >= self.age_interval:
-            self.animal.age += 1
-            self.age_timer = 0
+        self.animal.age += 1
@@ -0,0 +1,34 @@
+import pygame
+from src.settings import SCREEN_WIDTH, SCREEN_HEIGHT
+
+
+def step_game(dt, game_logic, launch_logic, food_manager, cupcake_mode):
+    """
+        Wykonuje jeden krok reguł gry, wspólny dla `GameScene` i symulacji bez okna.
+
+        W trybie babeczek aktualizowany jest tylko ten tryb, a logika gry i jedzenie są wstrzymane. W pozostałych
+        trybach krok przesuwa zwierzę, aktualizuje logikę gry i jedzenie, a po zakończeniu trybu zabawy przywraca
+        zwierzę na środek ekranu.
+
+        Args:
+            dt (float): Długość kroku w milisekundach.
+            game_logic (GameLogic): Logika stanu zwierzęcia.
+            launch_logic (LaunchLogic): Logika wystrzeliwania zwierzęcia.
+            food_manager (FoodManager): Menedżer jedzenia.
+            cupcake_mode (CupcakeMode): Tryb gry z babeczkami.
+    """
+    position = launch_logic.position
+    if cupcake_mode.is_active:
+        cupcake_mode.update(dt, position, position)
+        return
+
+    # `update` przesuwa prostokąt `position` w miejscu; ponowne `set_position` zaokrągliłoby pozycję do pikseli
+    launch_logic.update()
+
+    was_launch_mode = game_logic.launch_mode
+    game_logic.update(dt, launch_logic.is_moving())
+    if was_launch_mode and not game_logic.launch_mode:
+        launch_logic.position.center = (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
+        launch_logic.velocity = pygame.math.Vector2(0, 0)
+
+    food_manager.update(dt)
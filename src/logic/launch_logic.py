@@ -1,5 +1,5 @@
 import pygame
-from random import uniform
+import random
 
 class LaunchLogic:
     """
@@ -11,15 +11,20 @@ class LaunchLogic:
         margin (int): Margines od krawędzi ekranu, w którym obiekt odbija się.
         velocity (Vector2): Prędkość obiektu w przestrzeni 2D.
         position (Rect): Prostokąt określający pozycję obiektu.
+        exact_position (Vector2): Zmiennoprzecinkowa pozycja lewego górnego rogu obiektu, synchronizowana z `position`,
+            gdy prostokąt zostanie przesunięty poza tą klasą.
         animal (Animal): Obiekt zwierzęcia, którego poziom znudzenia może być zmniejszany.
+        rng (Random): Generator liczb losowych używany do losowania kierunku i prędkości.
     """
-    def __init__(self, screen_width, screen_height, margin=20):
+    def __init__(self, screen_width, screen_height, margin=20, rng=random):
         self.screen_width = screen_width
         self.screen_height = screen_height
         self.margin = margin
         self.velocity = pygame.math.Vector2(0, 0)
         self.position = None
+        self.exact_position = pygame.math.Vector2(0, 0)
         self.animal = None
+        self.rng = rng
 
     def set_position(self, rect):
         """
@@ -29,6 +34,7 @@ class LaunchLogic:
             rect (Rect): Prostokąt określający pozycję obiektu.
         """
         self.position = rect
+        self.exact_position = pygame.math.Vector2(rect.topleft)
 
     def set_animal(self, animal):
         """
@@ -43,61 +49,64 @@ class LaunchLogic:
         """
            Wystrzeliwuje zwierzaka z losowym kątem i prędkością.
         """
-        angle = uniform(0, 360)
-        speed = uniform(20, 30)
+        angle = self.rng.uniform(0, 360)
+        speed = self.rng.uniform(20, 30)
         self.velocity = pygame.math.Vector2(speed, 0).rotate(angle)
 
     def update(self):
         """
-            Aktualizuje pozycję zwierzaka oraz obsługuje odbicia od krawędzi ekranu.
+            Wykonuje jeden krok symulacji: aktualizuje pozycję zwierzaka oraz obsługuje odbicia od krawędzi ekranu.
+            Prędkość jest wyrażona w pikselach na krok, dlatego metoda musi być wywoływana ze stałą częstotliwością.
 
             Returns:
                 tuple: Zaktualizowana pozycja (`Rect`) oraz prędkość (`Vector2`) obiektu.
         """
         if self.position is None:
             raise ValueError("Position must be set before update")
-        self.position.x += self.velocity.x
-        self.position.y += self.velocity.y
+        if self.position.topleft != (round(self.exact_position.x), round(self.exact_position.y)):
+            self.exact_position = pygame.math.Vector2(self.position.topleft)
+        self.exact_position += self.velocity
+        self.position.topleft = (round(self.exact_position.x), round(self.exact_position.y))
 
         bounced = False
 
         if self.position.left <= self.margin:
             self.position.left = self.margin
             self.velocity.x *= -1
-            self.velocity.rotate_ip(uniform(-20, 20))
+            self.velocity.rotate_ip(self.rng.uniform(-20, 20))
             bounced = True
             if self.animal and self.animal.boredom_level > 0:
-                reduction = uniform(0.75, 1.25)
+                reduction = self.rng.uniform(0.75, 1.25)
                 self.animal.boredom_level = max(0.0, self.animal.boredom_level - reduction)
 
         if self.position.right >= self.screen_width - self.margin:
             self.position.right = self.screen_width - self.margin
             self.velocity.x *= -1
-            self.velocity.rotate_ip(uniform(-20, 20))
+            self.velocity.rotate_ip(self.rng.uniform(-20, 20))
             bounced = True
             if self.animal and self.animal.boredom_level > 0:
-                reduction = uniform(0.75, 1.25)
+                reduction = self.rng.uniform(0.75, 1.25)
                 self.animal.boredom_level = max(0.0, self.animal.boredom_level - reduction)
 
         if self.position.top <= self.margin:
             self.position.top = self.margin
             self.velocity.y *= -1
-            self.velocity.rotate_ip(uniform(-20, 20))
+            self.velocity.rotate_ip(self.rng.uniform(-20, 20))
             bounced = True
             if self.animal and self.animal.boredom_level > 0:
-                reduction = uniform(0.75, 1.25)
+                reduction = self.rng.uniform(0.75, 1.25)
                 self.animal.boredom_level = max(0.0, self.animal.boredom_level - reduction)
 
         if self.position.bottom >= self.screen_height - self.margin:
             self.position.bottom = self.screen_height - self.margin
             self.velocity.y *= -1
-            self.velocity.rotate_ip(uniform(-20, 20))
+            self.velocity.rotate_ip(self.rng.uniform(-20, 20))
             bounced = True
             if self.animal and self.animal.boredom_level > 0:
-                reduction = uniform(0.75, 1.25)
+                reduction = self.rng.uniform(0.75, 1.25)
                 self.animal.boredom_level = max(0.0, self.animal.boredom_level - reduction)
 
-        drift = pygame.math.Vector2(uniform(-0.2, 0.2), uniform(-0.2, 0.2))
+        drift = pygame.math.Vector2(self.rng.uniform(-0.2, 0.2), self.rng.uniform(-0.2, 0.2))
         self.velocity += drift
 
         if not bounced:
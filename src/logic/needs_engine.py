@@ -0,0 +1,131 @@
+import numpy as np
+from src.logic.game_logic import NEED_INTERVAL, NEED_INCREASE_RANGE
+from src.settings import AGE_INTERVAL, PLAYTIME_COOLDOWN_DURATION
+
+MOVING_BOREDOM_DECREASE = 0.2
+
+
+class NeedsEngine:
+    """
+    Wektorowy odpowiednik `GameLogic` aktualizujący potrzeby wielu zwierząt naraz.
+
+    Stan jest przechowywany jako struktura tablic: każda cecha zwierzęcia to osobna tablica NumPy o długości `count`,
+    a losowe przyrosty głodu i znudzenia są losowane jednym wywołaniem dla wszystkich zwierząt, których timer minął.
+    Reguły aktualizacji są takie same jak w `GameLogic.update`.
+
+    Atrybuty:
+        count (int): Liczba zwierząt.
+        playtime (float): Czas zabawy w sekundach.
+        cooldown_duration (float): Czas trwania okresu odnowienia po zabawie.
+        age_interval (float): Interwał czasu, po którym zwierzę się starzeje.
+        rng (Generator): Generator liczb losowych.
+        hunger (ndarray): Poziomy głodu zwierząt.
+        boredom (ndarray): Poziomy znudzenia zwierząt.
+        age (ndarray): Wiek zwierząt.
+        launch_mode (ndarray): Flagi trybu zabawy.
+        in_cooldown (ndarray): Flagi okresu odnowienia.
+        playtime_remaining (ndarray): Pozostały czas zabawy w milisekundach.
+        cooldown_timer (ndarray): Czas pozostały do zakończenia okresu odnowienia.
+        age_timer (ndarray): Timery starzenia się zwierząt.
+        boredom_timer (ndarray): Timery wzrostu znudzenia.
+        hunger_timer (ndarray): Timery wzrostu głodu.
+    """
+    def __init__(self, count, playtime, seed=None):
+        """
+            Inicjalizuje silnik dla `count` zwierząt w stanie początkowym `GameLogic`.
+
+            Args:
+                count (int): Liczba zwierząt.
+                playtime (float): Czas zabawy w sekundach.
+                seed (int, optional): Ziarno generatora liczb losowych. Domyślnie `None`.
+        """
+        self.count = count
+        self.playtime = playtime
+        self.cooldown_duration = PLAYTIME_COOLDOWN_DURATION
+        self.age_interval = AGE_INTERVAL
+        self.rng = np.random.default_rng(seed)
+        self.hunger = np.zeros(count)
+        self.boredom = np.zeros(count)
+        self.age = np.zeros(count, dtype=np.int64)
+        self.launch_mode = np.zeros(count, dtype=bool)
+        self.in_cooldown = np.zeros(count, dtype=bool)
+        self.playtime_remaining = np.full(count, playtime, dtype=float)
+        self.cooldown_timer = np.zeros(count)
+        self.age_timer = np.zeros(count)
+        self.boredom_timer = np.zeros(count)
+        self.hunger_timer = np.zeros(count)
+
+    def toggle_launch_mode(self, indices):
+        """
+            Przełącza tryb zabawy wybranych zwierząt, pomijając te w okresie odnowienia.
+
+            Args:
+                indices (array_like): Indeksy zwierząt.
+
+            Returns:
+                ndarray: Flagi trybu zabawy wybranych zwierząt po przełączeniu.
+        """
+        indices = np.asarray(indices)
+        allowed = indices[~self.in_cooldown[indices]]
+        self.launch_mode[allowed] = ~self.launch_mode[allowed]
+        started = allowed[self.launch_mode[allowed]]
+        self.playtime_remaining[started] = self.playtime * 1000
+        return self.launch_mode[indices]
+
+    def can_enter_cupcake_mode(self):
+        """
+            Sprawdza, które zwierzęta mogą wejść w tryb "Cupcake Mode".
+
+            Returns:
+                ndarray: Flagi dostępności trybu dla każdego zwierzęcia.
+        """
+        return ~self.launch_mode & ~self.in_cooldown
+
+    def update(self, dt, is_moving=False):
+        """
+            Aktualizuje stan wszystkich zwierząt o jeden krok.
+
+            Args:
+                dt (float): Czas, który upłynął od ostatniej aktualizacji.
+                is_moving (bool | ndarray, optional): Flaga lub tablica flag wskazujących, czy zwierzę się porusza.
+                    Domyślnie `False`.
+        """
+        playing = self.launch_mode.copy()
+        cooling = ~playing & self.in_cooldown
+        idle = ~playing & ~cooling
+        needs = ~playing
+
+        self._update_playtime(dt, playing)
+        self._update_cooldown(dt, cooling)
+        self._update_need(dt, needs, self.boredom_timer, self.boredom)
+        self._update_need(dt, needs, self.hunger_timer, self.hunger)
+        moving = idle & is_moving
+        self.boredom[moving] = np.maximum(0, self.boredom[moving] - MOVING_BOREDOM_DECREASE * dt / 1000)
+        self._update_age(dt, idle)
+
+    def _update_playtime(self, dt, mask):
+        self.playtime_remaining[mask] -= dt
+        ended = mask & (self.playtime_remaining <= 0)
+        self.launch_mode[ended] = False
+        self.in_cooldown[ended] = True
+        self.cooldown_timer[ended] = self.cooldown_duration
+
+    def _update_cooldown(self, dt, mask):
+        self.cooldown_timer[mask] -= dt
+        ended = mask & (self.cooldown_timer <= 0)
+        self.in_cooldown[ended] = False
+        self.cooldown_timer[ended] = 0
+
+    def _update_need(self, dt, mask, timer, level):
+        timer[mask] += dt
+        due = np.flatnonzero(mask & (timer >= NEED_INTERVAL))
+        if due.size:
+            increase = self.rng.uniform(*NEED_INCREASE_RANGE, size=due.size)
+            level[due] = np.minimum(100, level[due] + increase)
+            timer[due] -= NEED_INTERVAL
+
+    def _update_age(self, dt, mask):
+        self.age_timer[mask] += dt
+        due = mask & (self.age_timer >= self.age_interval)
+        self.age[due] += 1
+        self.age_timer[due] -= self.age_interval
@@ -0,0 +1,216 @@
+import heapq
+import itertools
+
+
+class Timer:
+    """
+    Zadanie zarejestrowane w `Scheduler`. Obiekt służy jako uchwyt do anulowania, wstrzymywania i wznawiania zadania.
+
+    Atrybuty:
+        due (float): Czas zegara gry, w którym zadanie ma zostać wykonane.
+        interval (float | None): Okres powtarzania w milisekundach lub `None` dla zadania jednorazowego.
+        callback (callable): Funkcja wywoływana, gdy zadanie jest wykonywane.
+        active (bool): Flaga wskazująca, czy zadanie czeka w kolejce.
+        paused_remaining (float | None): Czas pozostały do wykonania zapamiętany przy wstrzymaniu lub `None`.
+        entry (int | None): Numer aktualnego wpisu zadania w kolejce; starsze wpisy są pomijane.
+    """
+    def __init__(self, due, interval, callback):
+        self.due = due
+        self.interval = interval
+        self.callback = callback
+        self.active = True
+        self.paused_remaining = None
+        self.entry = None
+
+
+class Scheduler:
+    """
+    Zegar gry z kolejką priorytetową zadań jednorazowych i powtarzalnych.
+
+    Zegar przesuwa się tylko w metodzie `advance`, dlatego zatrzymanie aktualizacji obiektu, który go posiada,
+    zatrzymuje również jego zadania. Zadania powtarzalne są planowane względem poprzedniego terminu, a nie chwili
+    wykonania, więc nadwyżka czasu przechodzi na kolejny okres, a przy dużym `dt` zadanie wykonuje się wielokrotnie.
+
+    Atrybuty:
+        now (float): Bieżący czas zegara gry w milisekundach.
+        _queue (list): Kopiec krotek `(termin, numer kolejny, Timer)`.
+        _counter (Iterator[int]): Licznik numerujący wpisy kolejki; zapewnia kolejność FIFO zadań o tym samym terminie.
+    """
+    def __init__(self):
+        self.now = 0.0
+        self._queue = []
+        self._counter = itertools.count()
+
+    def _push(self, timer):
+        timer.entry = next(self._counter)
+        heapq.heappush(self._queue, (timer.due, timer.entry, timer))
+
+    def call_later(self, delay, callback):
+        """
+            Rejestruje zadanie jednorazowe.
+
+            Args:
+                delay (float): Opóźnienie w milisekundach.
+                callback (callable): Funkcja bez argumentów wywoływana po upływie opóźnienia.
+
+            Returns:
+                Timer: Uchwyt zadania.
+        """
+        timer = Timer(self.now + delay, None, callback)
+        self._push(timer)
+        return timer
+
+    def call_every(self, interval, callback, delay=None):
+        """
+            Rejestruje zadanie powtarzalne.
+
+            Args:
+                interval (float): Okres powtarzania w milisekundach, większy od zera.
+                callback (callable): Funkcja bez argumentów wywoływana co `interval` milisekund.
+                delay (float, optional): Opóźnienie pierwszego wykonania. Domyślnie równe `interval`.
+
+            Returns:
+                Timer: Uchwyt zadania.
+        """
+        if interval <= 0:
+            raise ValueError("Interval must be positive")
+        timer = Timer(self.now + (interval if delay is None else delay), interval, callback)
+        self._push(timer)
+        return timer
+
+    def cancel(self, timer):
+        """
+            Anuluje zadanie. Wpis pozostaje w kopcu i jest pomijany przy zdejmowaniu.
+
+            Args:
+                timer (Timer | None): Uchwyt zadania.
+        """
+        if timer is not None:
+            timer.active = False
+            timer.paused_remaining = None
+
+    def pause(self, timer):
+        """
+            Wstrzymuje zadanie, zapamiętując czas pozostały do jego wykonania.
+
+            Args:
+                timer (Timer): Uchwyt zadania.
+        """
+        if timer.active:
+            timer.active = False
+            timer.paused_remaining = max(0.0, timer.due - self.now)
+
+    def resume(self, timer):
+        """
+            Wznawia wstrzymane zadanie z zapamiętanym czasem pozostałym do wykonania.
+
+            Args:
+                timer (Timer): Uchwyt zadania.
+        """
+        if timer.paused_remaining is not None:
+            timer.due = self.now + timer.paused_remaining
+            timer.paused_remaining = None
+            timer.active = True
+            self._push(timer)
+
+    def reschedule(self, timer, delay):
+        """
+            Ustawia nowy termin zadania, także wstrzymanego lub już wykonanego, i ponownie umieszcza je w kolejce.
+
+            Args:
+                timer (Timer): Uchwyt zadania.
+                delay (float): Czas w milisekundach do wykonania zadania.
+        """
+        timer.due = self.now + delay
+        timer.paused_remaining = None
+        timer.active = True
+        self._push(timer)
+
+    def set_remaining(self, timer, remaining):
+        """
+            Ustawia czas pozostały do wykonania zadania, zachowując jego wstrzymanie, jeśli zadanie jest wstrzymane.
+
+            Args:
+                timer (Timer): Uchwyt zadania.
+                remaining (float): Czas w milisekundach do wykonania zadania.
+        """
+        if timer.paused_remaining is not None:
+            timer.paused_remaining = remaining
+        else:
+            self.reschedule(timer, remaining)
+
+    def remaining(self, timer):
+        """
+            Zwraca czas pozostały do wykonania zadania.
+
+            Args:
+                timer (Timer | None): Uchwyt zadania.
+
+            Returns:
+                float: Czas w milisekundach; `0` dla zadania wykonanego lub anulowanego.
+        """
+        if timer is None:
+            return 0.0
+        if timer.paused_remaining is not None:
+            return timer.paused_remaining
+        if not timer.active:
+            return 0.0
+        return max(0.0, timer.due - self.now)
+
+    def elapsed(self, timer):
+        """
+            Zwraca czas, który upłynął w bieżącym okresie zadania powtarzalnego.
+
+            Args:
+                timer (Timer): Uchwyt zadania powtarzalnego.
+
+            Returns:
+                float: Czas w milisekundach od poprzedniego wykonania (lub od rejestracji).
+        """
+        return timer.interval - self.remaining(timer)
+
+    def time_until_next(self):
+        """
+            Zwraca czas do najbliższego zadania, np. aby pętla gry wiedziała, jak długo może spać.
+
+            Returns:
+                float | None: Czas w milisekundach lub `None`, jeśli żadne zadanie nie czeka.
+        """
+        self._drop_inactive()
+        if not self._queue:
+            return None
+        return max(0.0, self._queue[0][0] - self.now)
+
+    def advance(self, dt):
+        """
+            Przesuwa zegar o `dt` i wykonuje zadania, których termin minął, w kolejności terminów.
+            Podczas wykonywania zadania `now` jest równe jego terminowi.
+
+            Args:
+                dt (float): Czas, który upłynął od ostatniej aktualizacji.
+
+            Returns:
+                int: Liczba wykonanych zadań.
+        """
+        target = self.now + dt
+        fired = 0
+        while True:
+            self._drop_inactive()
+            if not self._queue or self._queue[0][0] > target:
+                break
+            due, _, timer = heapq.heappop(self._queue)
+            self.now = due
+            if timer.interval is None:
+                timer.active = False
+            else:
+                timer.due = due + timer.interval
+                self._push(timer)
+            timer.callback()
+            fired += 1
+        self.now = target
+        return fired
+
+    def _drop_inactive(self):
+        queue = self._queue
+        while queue and (not queue[0][2].active or queue[0][1] != queue[0][2].entry):
+            heapq.heappop(queue)
@@ -1,39 +1,89 @@
+from src.utils.startup_trace import StartupTrace
+StartupTrace.install()
+
+import argparse
 import pygame
+import random
 import sys
-from src.settings import SCREEN_WIDTH, SCREEN_HEIGHT, FPS
+from src.settings import SCREEN_WIDTH, SCREEN_HEIGHT, DIRTY_RECT_RENDERING
 from src.scenes.menu_scene import MenuScene
+from src.scenes.loading_scene import LoadingScene
+from src.managers.autosave import get_autosave_worker
+from src.managers.frame_pacer import FramePacer
 from src.managers.scene_manager import SceneManager
-from src.managers.font_manager import FontManager
+from src.managers.font_manager import FontManager, DEFAULT_FONT
+from src.scenes.scene_registry import SceneRegistry
+
+# Czcionki używane przez sceny i przyciski; wczytywane razem przy starcie zamiast w konstruktorach scen
+PRELOADED_FONTS = [("Boldins", None), (DEFAULT_FONT, 24), (DEFAULT_FONT, 32), (DEFAULT_FONT, 48)]
+# Maksymalny czas w sekundach, przez który zamykana gra czeka na dokończenie zapisu automatycznego
+AUTOSAVE_FLUSH_TIMEOUT = 2.0
+
 
 def load_fonts():
-    FontManager.load_font("Boldins", "assets/fonts/Boldins.ttf", 35)
+    FontManager.register("Boldins", "assets/fonts/Boldins.ttf", 35)
+    FontManager.preload(PRELOADED_FONTS)
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(prog="python -m src.main", description="Be My Kitty!")
+    parser.add_argument("--record", metavar="PATH", help="zapisz sesję do pliku, aby odtworzyć ją poleceniem "
+                                                         "python -m src.replay")
+    parser.add_argument("--seed", type=int, default=None, help="ziarno generatora liczb losowych")
+    return parser.parse_args(argv)
+
 
+def main(argv=None):
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    recorder = None
+    if args.record:
+        seed = args.seed if args.seed is not None else random.randrange(2 ** 63)
+        random.seed(seed)
+        LoadingScene.blocking = True
+        from src.utils.session_log import SessionRecorder
+        recorder = SessionRecorder(args.record, seed)
+    elif args.seed is not None:
+        random.seed(args.seed)
 
-def main():
     pygame.init()
     load_fonts()
     screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
     pygame.display.set_caption("Be My Kitty!")
-    clock = pygame.time.Clock()
+    pacer = FramePacer()
 
-    scene_manager = SceneManager(MenuScene())
+    scene_manager = SceneManager(SceneRegistry.get(MenuScene))
 
     running = True
-    while running:
-        dt = clock.tick(FPS)
-        events = pygame.event.get()
+    try:
+        while running:
+            dt, events, planned_wait = pacer.wait_for_frame(scene_manager)
+            if recorder:
+                recorder.record(dt, events, planned_wait)
 
-        for event in events:
-            if event.type == pygame.QUIT:
-                running = False
+            for event in events:
+                if event.type == pygame.QUIT:
+                    running = False
 
-        scene_manager.handle_events(events)
-        scene_manager.update(dt)
-        scene_manager.draw(screen)
-        pygame.display.flip()
+            scene_manager.handle_events(events)
+            scene_manager.update(dt, planned_wait)
+            if not pacer.should_draw():
+                continue
+            if pacer.needs_redraw:
+                scene_manager.full_redraw = True
+                pacer.needs_redraw = False
+            dirty_rects = scene_manager.draw(screen)
+            if DIRTY_RECT_RENDERING and dirty_rects is not None:
+                pygame.display.update(dirty_rects)
+            else:
+                pygame.display.flip()
+            StartupTrace.first_frame()
+    finally:
+        if recorder:
+            recorder.close(scene_manager.current_scene)
+        get_autosave_worker().flush(AUTOSAVE_FLUSH_TIMEOUT)
 
     pygame.quit()
     sys.exit()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,132 @@
+from concurrent.futures import ThreadPoolExecutor, wait
+from src.managers.asset_manager import AssetManager, load_image
+from src.managers.sound_bank import SoundBank
+from src.settings import ASSET_LOADER_WORKERS
+
+_executor = None
+
+
+def get_executor():
+    """
+        Zwraca współdzieloną pulę wątków do wczytywania zasobów, tworząc ją przy pierwszym użyciu.
+
+        Returns:
+            ThreadPoolExecutor: Pula wątków roboczych.
+    """
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=ASSET_LOADER_WORKERS, thread_name_prefix="asset-loader")
+    return _executor
+
+
+class LoadBatch:
+    """
+    Grupa zadań wczytywania zasobów wykonywanych w tle, z informacją o postępie.
+
+    Zadania dekodują dane w wątkach roboczych; obrazy są konwertowane i rejestrowane w `AssetManager`
+    dopiero w wątku głównym, w metodzie `finish`.
+
+    Atrybuty:
+        futures (dict[Hashable, Future]): Zadania, gdzie klucz to nazwa zadania.
+        images (list[tuple[str, tuple[int, int]]]): Obrazy wczytywane do menedżera zasobów.
+        sounds (list[str]): Dźwięki wczytywane do banku dźwięków.
+    """
+    def __init__(self):
+        self.futures = {}
+        self.images = []
+        self.sounds = []
+
+    def submit(self, name, fn, *args, **kwargs):
+        """
+            Zleca wykonanie funkcji w wątku roboczym.
+
+            Args:
+                name (Hashable): Nazwa zadania, pod którą będzie dostępny jego wynik.
+                fn (callable): Funkcja do wykonania.
+                *args: Argumenty pozycyjne funkcji.
+                **kwargs: Argumenty nazwane funkcji.
+
+            Returns:
+                Future: Obiekt reprezentujący wynik zadania.
+        """
+        future = get_executor().submit(fn, *args, **kwargs)
+        self.futures[name] = future
+        return future
+
+    def submit_image(self, path, size=None):
+        """
+            Zleca wczytanie obrazu, który po zakończeniu trafi do `AssetManager`.
+
+            Args:
+                path (str): Ścieżka do pliku graficznego.
+                size (tuple[int, int], optional): Docelowy rozmiar obrazu. Domyślnie `None`.
+
+            Returns:
+                Future: Obiekt reprezentujący wynik zadania.
+        """
+        size = tuple(size) if size is not None else None
+        self.images.append((path, size))
+        return self.submit(("image", path, size), load_image, path, size, None)
+
+    def submit_sound(self, path):
+        """
+            Zleca zdekodowanie dźwięku, który po zakończeniu trafi do `SoundBank`.
+
+            Args:
+                path (str): Ścieżka do pliku dźwiękowego.
+
+            Returns:
+                Future: Obiekt reprezentujący wynik zadania.
+        """
+        self.sounds.append(path)
+        return self.submit(("sound", path), SoundBank.decode, path)
+
+    def progress(self):
+        """
+            Zwraca postęp wczytywania.
+
+            Returns:
+                float: Ułamek zakończonych zadań w zakresie od 0 do 1.
+        """
+        if not self.futures:
+            return 1.0
+        return sum(1 for future in self.futures.values() if future.done()) / len(self.futures)
+
+    def done(self):
+        """
+            Sprawdza, czy wszystkie zadania zostały zakończone.
+
+            Returns:
+                bool: `True`, jeśli wszystkie zadania są zakończone, w przeciwnym razie `False`.
+        """
+        return all(future.done() for future in self.futures.values())
+
+    def wait(self):
+        """
+            Blokuje wątek główny do zakończenia wszystkich zadań.
+        """
+        wait(list(self.futures.values()))
+
+    def finish(self):
+        """
+            Rejestruje wczytane obrazy w `AssetManager` i dźwięki w `SoundBank`, a następnie zwraca wyniki
+            pozostałych zadań. Wywoływana w wątku głównym.
+
+            Returns:
+                dict: Wyniki zadań według nazw; zadania zakończone błędem mają wartość `None`.
+        """
+        results = {}
+        for name, future in self.futures.items():
+            try:
+                results[name] = future.result()
+            except Exception as e:
+                print(f"Error preloading asset {name}: {e}")
+                results[name] = None
+
+        for path, size in self.images:
+            surface = results.pop(("image", path, size))
+            if surface is not None:
+                AssetManager.put(path, size, surface)
+        for path in self.sounds:
+            SoundBank.put(path, results.pop(("sound", path)))
+        return results
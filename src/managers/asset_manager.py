@@ -0,0 +1,145 @@
+import pygame
+from src.settings import BAKED_ASSET_CACHE
+from src.utils.baked_cache import load_scaled_image
+from src.utils.startup_trace import StartupTrace
+
+
+def load_image(path, size=None, convert="alpha"):
+    """
+        Wczytuje obraz z dysku, opcjonalnie skaluje go i konwertuje do formatu ekranu.
+
+        Jeśli `BAKED_ASSET_CACHE` jest włączone, przeskalowane piksele są brane z katalogu wypieczonych zasobów.
+
+        Args:
+            path (str): Ścieżka do pliku graficznego.
+            size (tuple[int, int], optional): Docelowy rozmiar obrazu. Domyślnie `None` (rozmiar oryginalny).
+            convert (str, optional): Tryb konwersji: `"alpha"`, `"opaque"` lub `None`. Domyślnie `"alpha"`.
+
+        Returns:
+            Surface: Wczytana powierzchnia.
+    """
+    with StartupTrace.span("asset", path):
+        if BAKED_ASSET_CACHE:
+            return convert_surface(load_scaled_image(path, size), convert)
+        image = pygame.image.load(path)
+        if size is not None:
+            image = pygame.transform.scale(image, size)
+        return convert_surface(image, convert)
+
+
+def convert_surface(surface, convert):
+    """
+        Konwertuje powierzchnię do formatu ekranu, jeśli okno gry zostało już utworzone.
+
+        Args:
+            surface (Surface): Powierzchnia do konwersji.
+            convert (str): Tryb konwersji: `"alpha"`, `"opaque"` lub `None`.
+
+        Returns:
+            Surface: Skonwertowana powierzchnia lub oryginalna, jeśli konwersja nie jest możliwa.
+    """
+    if convert is None or pygame.display.get_surface() is None:
+        return surface
+    if convert == "alpha":
+        return surface.convert_alpha()
+    return surface.convert()
+
+
+class AssetManager:
+    """
+    Menedżer zasobów graficznych współdzielący wczytane obrazy pomiędzy wszystkimi obiektami gry.
+
+    Wpisy są kluczowane ścieżką, docelowym rozmiarem i trybem konwersji oraz zliczają odwołania,
+    dzięki czemu nieużywane obrazy można zwolnić, a używane nigdy nie są wczytywane ponownie.
+
+    Atrybuty:
+        _entries (dict): Słownik, gdzie klucz to `(ścieżka, rozmiar, tryb konwersji)`, a wartość to lista `[Surface, liczba odwołań]`.
+        loads (int): Liczba obrazów wczytanych z dysku.
+    """
+
+    _entries = {}
+    loads = 0
+
+    @staticmethod
+    def _key(path, size, convert):
+        return path, tuple(size) if size is not None else None, convert
+
+    @staticmethod
+    def acquire(path, size=None, convert="alpha"):
+        """
+            Pobiera obraz z menedżera, wczytując go z dysku tylko przy pierwszym użyciu, i zwiększa licznik odwołań.
+
+            Args:
+                path (str): Ścieżka do pliku graficznego.
+                size (tuple[int, int], optional): Docelowy rozmiar obrazu. Domyślnie `None`.
+                convert (str, optional): Tryb konwersji: `"alpha"`, `"opaque"` lub `None`. Domyślnie `"alpha"`.
+
+            Returns:
+                Surface: Współdzielona powierzchnia obrazu.
+        """
+        key = AssetManager._key(path, size, convert)
+        entry = AssetManager._entries.get(key)
+        if entry is None:
+            entry = [load_image(path, key[1], convert), 0]
+            AssetManager._entries[key] = entry
+            AssetManager.loads += 1
+        entry[1] += 1
+        return entry[0]
+
+    @staticmethod
+    def put(path, size, surface, convert="alpha"):
+        """
+            Rejestruje obraz wczytany poza menedżerem (np. w tle), konwertując go do formatu ekranu.
+            Istniejący wpis nie jest nadpisywany.
+
+            Args:
+                path (str): Ścieżka do pliku graficznego.
+                size (tuple[int, int]): Rozmiar obrazu użyty przy wczytywaniu.
+                surface (Surface): Wczytana, nieskonwertowana powierzchnia.
+                convert (str, optional): Tryb konwersji. Domyślnie `"alpha"`.
+        """
+        key = AssetManager._key(path, size, convert)
+        if key not in AssetManager._entries:
+            AssetManager._entries[key] = [convert_surface(surface, convert), 0]
+            AssetManager.loads += 1
+
+    @staticmethod
+    def release(path, size=None, convert="alpha"):
+        """
+            Zmniejsza licznik odwołań do obrazu. Obraz pozostaje w pamięci do czasu wywołania `evict_unused`.
+
+            Args:
+                path (str): Ścieżka do pliku graficznego.
+                size (tuple[int, int], optional): Docelowy rozmiar obrazu. Domyślnie `None`.
+                convert (str, optional): Tryb konwersji. Domyślnie `"alpha"`.
+        """
+        entry = AssetManager._entries.get(AssetManager._key(path, size, convert))
+        if entry is not None and entry[1] > 0:
+            entry[1] -= 1
+
+    @staticmethod
+    def evict_unused():
+        """
+            Usuwa z pamięci obrazy, do których nie ma już żadnych odwołań.
+
+            Returns:
+                int: Liczba usuniętych obrazów.
+        """
+        unused = [key for key, entry in AssetManager._entries.items() if entry[1] == 0]
+        for key in unused:
+            del AssetManager._entries[key]
+        return len(unused)
+
+    @staticmethod
+    def stats():
+        """
+            Zwraca statystyki menedżera zasobów.
+
+            Returns:
+                dict: Liczba wpisów, liczba wpisów bez odwołań oraz liczba wczytań z dysku.
+        """
+        return {
+            "entries": len(AssetManager._entries),
+            "unused": sum(1 for entry in AssetManager._entries.values() if entry[1] == 0),
+            "loads": AssetManager.loads,
+        }
@@ -1,6 +1,37 @@
+import io
+import os
 import pygame
 import random
-import os
+from src.managers.asset_loader import get_executor
+from src.managers.sound_bank import SoundBank
+from src.settings import MAX_DROPPED_AUDIO_BYTES
+
+SOUND_DIR = "assets/audio/sound"
+AUDIO_EXTENSIONS = ('.mp3', '.wav', '.ogg')
+
+
+def read_audio_file(file_path):
+    """
+        Sprawdza plik audio i wczytuje jego zawartość do pamięci. Wywoływana w wątku roboczym.
+
+        Args:
+            file_path (str): Ścieżka do pliku audio.
+
+        Returns:
+            BytesIO: Zawartość pliku gotowa do przekazania do `pygame.mixer.music.load`.
+
+        Raises:
+            ValueError: Jeśli plik ma nieobsługiwane rozszerzenie, jest pusty lub za duży.
+            OSError: Jeśli pliku nie można odczytać.
+    """
+    if not file_path.lower().endswith(AUDIO_EXTENSIONS):
+        raise ValueError(f"Unsupported audio file: {file_path}")
+    size = os.path.getsize(file_path)
+    if size == 0 or size > MAX_DROPPED_AUDIO_BYTES:
+        raise ValueError(f"Invalid audio file size ({size} bytes): {file_path}")
+    with open(file_path, 'rb') as f:
+        return io.BytesIO(f.read())
+
 
 class AudioManager:
     """
@@ -8,26 +39,50 @@ class AudioManager:
 
     Atrybuty:
         current_audio (str): Ścieżka do aktualnie odtwarzanego pliku audio.
+        current_channel (Channel, optional): Kanał banku dźwięków odtwarzający aktualny dźwięk lub `None`, jeśli gra muzyka.
+        current_sound (Sound, optional): Dźwięk odtwarzany na kanale `current_channel`; kanał mógł zostać przejęty przez
+            inny dźwięk o wyższym priorytecie, więc jest zatrzymywany tylko wtedy, gdy nadal odtwarza ten dźwięk.
         is_animation (bool): Flaga wskazująca, czy animacja zwierzęcia jest aktywna.
         sound_dir (str): Ścieżka do katalogu z efektami dźwiękowymi.
+        pending_audio (str, optional): Ścieżka do pliku audio wczytywanego w tle lub `None`.
+        pending_future (Future, optional): Zadanie wczytujące plik `pending_audio`.
+        rng (Random): Generator liczb losowych używany do wyboru dźwięku.
     """
-    def __init__(self):
+    def __init__(self, rng=random):
         self.current_audio = None
+        self.current_channel = None
+        self.current_sound = None
         self.is_animation = False
-        self.sound_dir = "assets/audio/sound"
+        self.sound_dir = SOUND_DIR
+        self.pending_audio = None
+        self.pending_future = None
+        self.rng = rng
+
+    @property
+    def is_loading(self):
+        """
+            Sprawdza, czy plik audio jest wczytywany w tle.
+
+            Returns:
+                bool: `True`, jeśli trwa wczytywanie pliku, w przeciwnym razie `False`.
+        """
+        return self.pending_future is not None
     
-    def play_audio(self, file_path, animal):
+    def play_audio(self, file_path, animal, data=None):
         """
         Odtwarza plik audio i aktywuje animację zwierzęcia.
 
         Args:
             file_path (str): Ścieżka do pliku audio.
             animal (Animal): Obiekt zwierzęcia, którego animacja ma być aktywowana.
+            data (BytesIO, optional): Zawartość pliku wczytana wcześniej do pamięci. Domyślnie `None`.
         """
-        if self.current_audio:
-            pygame.mixer.music.stop()
+        self._stop_current()
         try:
-            pygame.mixer.music.load(file_path)
+            if data is not None:
+                pygame.mixer.music.load(data, os.path.splitext(file_path)[1][1:])
+            else:
+                pygame.mixer.music.load(file_path)
             pygame.mixer.music.play()
             self.current_audio = file_path
             self.is_animation = True
@@ -35,31 +90,83 @@ class AudioManager:
         except Exception as e:
             print(f"Error loading audio file: {e}")
     
+    def load_audio_async(self, file_path):
+        """
+            Zleca sprawdzenie i wczytanie pliku audio w tle. Odtwarzanie rozpoczyna `poll_pending`, gdy dane są gotowe.
+            Wcześniej zlecony, jeszcze niewczytany plik jest pomijany.
+
+            Args:
+                file_path (str): Ścieżka do pliku audio.
+        """
+        self.pending_audio = file_path
+        self.pending_future = get_executor().submit(read_audio_file, file_path)
+
+    def poll_pending(self, animal):
+        """
+            Rozpoczyna odtwarzanie pliku wczytanego w tle, jeśli wczytywanie zostało zakończone.
+
+            Args:
+                animal (Animal): Obiekt zwierzęcia, którego animacja ma być aktywowana.
+        """
+        if self.pending_future is None or not self.pending_future.done():
+            return
+        future, file_path = self.pending_future, self.pending_audio
+        self.pending_future = None
+        self.pending_audio = None
+        try:
+            data = future.result()
+        except (OSError, ValueError) as e:
+            print(f"Error loading audio file: {e}")
+            return
+        self.play_audio(file_path, animal, data)
+
     def play_random_sound(self, animal):
         """
-            Odtwarza losowy plik audio z katalogu efektów dźwiękowych.
+            Odtwarza losowy plik audio z katalogu efektów dźwiękowych przez bank zdekodowanych dźwięków.
 
             Args:
                 animal (Animal): Obiekt zwierzęcia, którego animacja ma być aktywowana.
         """
-        sound_files = [f for f in os.listdir(self.sound_dir) if f.endswith('.mp3')]
+        sound_files = SoundBank.list_sounds(self.sound_dir)
         if sound_files:
-            random_sound = os.path.join(self.sound_dir, random.choice(sound_files))
-            self.play_audio(random_sound, animal)
+            random_sound = self.rng.choice(sound_files)
+            self._stop_current()
+            channel = SoundBank.play(random_sound, SoundBank.PRIORITY_VOICE)
+            if channel is None:
+                return
+            self.current_audio = random_sound
+            self.current_channel = channel
+            self.current_sound = channel.get_sound()
+            self.is_animation = True
+            animal.use_animated_asset()
     
-    def play_sound_effect(self, file_path):
+    def play_sound_effect(self, file_path, priority=SoundBank.PRIORITY_EFFECT):
         """
-            Odtwarza efekt dźwiękowy.
+            Odtwarza efekt dźwiękowy z banku zdekodowanych dźwięków.
 
             Args:
                 file_path (str): Ścieżka do pliku efektu dźwiękowego.
+                priority (int, optional): Priorytet efektu w puli kanałów. Domyślnie `SoundBank.PRIORITY_EFFECT`.
         """
-        try:
-            sound = pygame.mixer.Sound(file_path)
-            sound.play()
-        except Exception as e:
-            print(f"Error loading sound effect: {e}")
-    
+        SoundBank.play(file_path, priority)
+
+    def _owned_channel(self):
+        # Kanał z puli mógł zostać przydzielony innemu dźwiękowi; wtedy aktualny dźwięk już nie gra
+        channel = self.current_channel
+        if channel is not None and channel.get_sound() is self.current_sound:
+            return channel
+        return None
+
+    def _stop_current(self):
+        if self.current_channel:
+            channel = self._owned_channel()
+            if channel is not None:
+                channel.stop()
+            self.current_channel = None
+            self.current_sound = None
+        elif self.current_audio:
+            pygame.mixer.music.stop()
+
     def stop_audio(self, animal):
         """
           Zatrzymuje odtwarzanie audio i dezaktywuje animację zwierzęcia.
@@ -68,7 +175,7 @@ class AudioManager:
               animal (Animal): Obiekt zwierzęcia, którego animacja ma być dezaktywowana.
           """
         if self.current_audio:
-            pygame.mixer.music.stop()
+            self._stop_current()
             self.current_audio = None
             self.is_animation = False
             animal.use_static_asset()
@@ -80,5 +187,12 @@ class AudioManager:
            Args:
                animal (Animal): Obiekt zwierzęcia, którego animacja ma być dezaktywowana.
            """
-        if self.current_audio and not pygame.mixer.music.get_busy():
-            self.stop_audio(animal) 
\ No newline at end of file
+        if not self.current_audio:
+            return
+        if self.current_channel:
+            channel = self._owned_channel()
+            playing = channel is not None and channel.get_busy()
+        else:
+            playing = pygame.mixer.music.get_busy()
+        if not playing:
+            self.stop_audio(animal)
@@ -0,0 +1,98 @@
+import threading
+from src.managers.save_manager import SaveManager
+
+_worker = None
+
+
+def get_autosave_worker():
+    """
+        Zwraca współdzielony wątek zapisu automatycznego, tworząc go przy pierwszym użyciu.
+
+        Returns:
+            AutosaveWorker: Wątek zapisu automatycznego.
+    """
+    global _worker
+    if _worker is None:
+        _worker = AutosaveWorker()
+    return _worker
+
+
+class AutosaveWorker:
+    """
+    Zapisuje kopie stanu gry w wątku w tle, aby zapis automatyczny nie dodawał operacji na plikach do klatki.
+
+    Wątek główny przekazuje kopię stanu utworzoną przez `SaveManager.snapshot`, a wątek roboczy koduje ją i zapisuje.
+    Zapis automatyczny nigdy nie usuwa najstarszego zapisu, nawet jeśli menedżer zapisu ma ustawiony limit `max_saves`.
+    Oczekuje co najwyżej jedna kopia na zwierzę: jeśli poprzedni zapis wciąż trwa, nowsza kopia zastępuje starszą,
+    która nie została jeszcze zapisana.
+
+    Atrybuty:
+        written (int): Liczba zapisanych kopii stanu.
+        coalesced (int): Liczba kopii zastąpionych przez nowsze przed zapisem.
+        failed (int): Liczba nieudanych zapisów.
+    """
+    def __init__(self, save_manager_factory=SaveManager):
+        """
+            Inicjalizuje wątek zapisu; wątek jest uruchamiany przy pierwszym zleconym zapisie.
+
+            Args:
+                save_manager_factory (callable, optional): Funkcja tworząca menedżer zapisu w wątku roboczym.
+                    Domyślnie `SaveManager`.
+        """
+        self.written = 0
+        self.coalesced = 0
+        self.failed = 0
+        self._save_manager_factory = save_manager_factory
+        self._pending = {}
+        self._busy = False
+        self._condition = threading.Condition()
+        self._thread = None
+
+    def submit(self, snapshot):
+        """
+            Zleca zapis kopii stanu gry. Metoda nie wykonuje operacji na plikach.
+
+            Args:
+                snapshot (dict): Kopia stanu gry utworzona przez `SaveManager.snapshot`.
+        """
+        with self._condition:
+            if self._pending.pop(snapshot["name"], None) is not None:
+                self.coalesced += 1
+            self._pending[snapshot["name"]] = snapshot
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="autosave", daemon=True)
+                self._thread.start()
+            self._condition.notify()
+
+    def flush(self, timeout=None):
+        """
+            Czeka, aż wszystkie zlecone zapisy zostaną wykonane, np. przed zamknięciem gry.
+
+            Args:
+                timeout (float, optional): Maksymalny czas oczekiwania w sekundach. Domyślnie `None` (bez limitu).
+
+            Returns:
+                bool: `True`, jeśli wszystkie zapisy zostały wykonane, w przeciwnym razie `False`.
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: not self._pending and not self._busy, timeout)
+
+    def _run(self):
+        save_manager = self._save_manager_factory()
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._pending)
+                snapshot = self._pending.pop(next(iter(self._pending)))
+                self._busy = True
+            try:
+                success = save_manager.write_snapshot(snapshot, evict=False)
+            except Exception as e:
+                print(f"Error autosaving game: {e}")
+                success = False
+            with self._condition:
+                self._busy = False
+                if success:
+                    self.written += 1
+                else:
+                    self.failed += 1
+                self._condition.notify_all()
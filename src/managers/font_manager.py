@@ -1,36 +1,82 @@
 import pygame
+from src.utils.startup_trace import StartupTrace
+
+# Rodzina domyślnej czcionki Pygame; w przeciwieństwie do `pygame.font.SysFont` nie wymaga przeszukiwania czcionek
+# systemowych
+DEFAULT_FONT = "default"
+
 
 class FontManager:
     """
-    Menedżer czcionek odpowiedzialny za ładowanie i przechowywanie czcionek w grze.
+    Rejestr czcionek gry. Czcionki są identyfikowane przez rodzinę i rozmiar, ładowane przy pierwszym użyciu
+    i współdzielone przez wszystkie sceny i elementy interfejsu.
 
     Atrybuty:
-        _fonts (dict): Słownik przechowujący załadowane czcionki, gdzie klucz to nazwa czcionki, a wartość to obiekt czcionki Pygame.
-        """
+        _families (dict[str, tuple[str | None, int | None]]): Ścieżka do pliku i domyślny rozmiar każdej
+            zarejestrowanej rodziny czcionek. Ścieżka `None` oznacza domyślną czcionkę Pygame.
+        _fonts (dict[tuple[str, int], Font]): Załadowane czcionki, gdzie klucz to rodzina i rozmiar czcionki.
+        loads (int): Liczba czcionek wczytanych z dysku.
+    """
 
+    _families = {DEFAULT_FONT: (None, None)}
     _fonts = {}
+    loads = 0
 
     @staticmethod
-    def load_font(name, path, size):
+    def register(name, path, default_size=None):
         """
-        Ładuje czcionkę z podanej ścieżki i zapisuje ją w menedżerze czcionek.
+        Rejestruje rodzinę czcionek bez wczytywania jej z dysku.
 
         Args:
-            name (str): Nazwa czcionki, pod którą będzie przechowywana.
-            path (str): Ścieżka do pliku czcionki.
-            size (int): Rozmiar czcionki.
+            name (str): Nazwa rodziny, pod którą czcionka będzie dostępna.
+            path (str | None): Ścieżka do pliku czcionki lub `None` dla domyślnej czcionki Pygame.
+            default_size (int, optional): Rozmiar używany, gdy `get` zostanie wywołane bez rozmiaru. Domyślnie `None`.
         """
-        FontManager._fonts[name] = pygame.font.Font(path, size)
+        FontManager._families[name] = (path, default_size)
 
     @staticmethod
-    def get_font(name):
+    def get(name, size=None):
         """
-        Pobiera załadowaną czcionkę na podstawie jej nazwy.
+        Pobiera czcionkę z rejestru, wczytując ją z dysku tylko przy pierwszym użyciu.
 
         Args:
-            name (str): Nazwa czcionki do pobrania.
+            name (str): Nazwa zarejestrowanej rodziny czcionek.
+            size (int, optional): Rozmiar czcionki. Domyślnie rozmiar podany przy rejestracji rodziny.
 
         Returns:
-            Font: Obiekt czcionki Pygame lub `None`, jeśli czcionka o podanej nazwie nie została załadowana.
+            Font: Współdzielony obiekt czcionki Pygame.
+
+        Raises:
+            KeyError: Jeśli rodzina nie została zarejestrowana.
+            ValueError: Jeśli nie podano rozmiaru, a rodzina nie ma rozmiaru domyślnego.
+        """
+        path, default_size = FontManager._families[name]
+        if size is None:
+            if default_size is None:
+                raise ValueError(f"Font family {name!r} has no default size")
+            size = default_size
+        font = FontManager._fonts.get((name, size))
+        if font is None:
+            with StartupTrace.span("font", path or name):
+                font = pygame.font.Font(path, size)
+            FontManager._fonts[(name, size)] = font
+            FontManager.loads += 1
+        return font
+
+    @staticmethod
+    def preload(fonts):
+        """
+        Wczytuje z góry wiele czcionek, np. przy uruchamianiu gry, aby sceny nie wczytywały ich w trakcie gry.
+
+        Args:
+            fonts (Iterable[tuple[str, int | None]]): Rodziny i rozmiary czcionek do wczytania.
+        """
+        for name, size in fonts:
+            FontManager.get(name, size)
+
+    @staticmethod
+    def clear():
+        """
+        Usuwa wszystkie wczytane czcionki; zarejestrowane rodziny pozostają w rejestrze.
         """
-        return FontManager._fonts.get(name)
+        FontManager._fonts.clear()
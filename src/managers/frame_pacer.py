@@ -0,0 +1,84 @@
+import math
+import pygame
+from src.settings import FPS, SIM_STEP_MS, IDLE_MAX_WAIT, BACKGROUND_FPS
+
+# Zdarzenia okna, po których zawartość ekranu mogła zostać utracona i trzeba narysować całą scenę
+REDRAW_EVENTS = (pygame.WINDOWRESTORED, pygame.WINDOWSHOWN, pygame.WINDOWEXPOSED, pygame.WINDOWFOCUSGAINED)
+
+
+class FramePacer:
+    """
+    Decyduje, jak długo pętla gry czeka na następną klatkę i czy ją rysuje.
+
+    Animowana scena w aktywnym oknie działa z pełną liczbą klatek `FPS`. Na statycznej scenie pętla czeka
+    w `pygame.event.wait` na zdarzenie albo na najbliższy termin sceny. Gdy okno traci fokus, scena jest rysowana
+    z częstotliwością `BACKGROUND_FPS`, a gdy jest zminimalizowane lub ukryte - wcale; logika gry działa dalej.
+
+    Atrybuty:
+        clock (Clock): Zegar mierzący czas trwania klatek.
+        focused (bool): Flaga wskazująca, czy okno gry ma fokus.
+        visible (bool): Flaga wskazująca, czy okno gry jest widoczne.
+        needs_redraw (bool): Flaga wskazująca, że po przywróceniu okna trzeba narysować cały ekran.
+    """
+    def __init__(self):
+        self.clock = pygame.time.Clock()
+        self.focused = True
+        self.visible = True
+        self.needs_redraw = False
+
+    def _idle_timeout(self, scene_manager):
+        limit = IDLE_MAX_WAIT
+        if scene_manager.is_animating():
+            limit = 1000 / BACKGROUND_FPS
+        deadline = scene_manager.next_deadline()
+        if deadline is not None:
+            # Jeden krok symulacji zapasu, aby termin na pewno minął przed aktualizacją sceny
+            limit = min(limit, deadline + SIM_STEP_MS)
+        return max(1, math.ceil(limit))
+
+    def wait_for_frame(self, scene_manager):
+        """
+            Czeka na następną klatkę i zbiera zdarzenia.
+
+            Args:
+                scene_manager (SceneManager): Menedżer scen, którego aktywna scena określa sposób czekania.
+
+            Returns:
+                tuple[int, list[Event], int]: Czas trwania klatki w milisekundach, zdarzenia oraz czas zaplanowanego
+                    oczekiwania, który należy przekazać do `SceneManager.update`.
+        """
+        if self.focused and self.visible and scene_manager.is_animating():
+            dt = self.clock.tick(FPS)
+            events = pygame.event.get()
+            planned_wait = 0
+        else:
+            planned_wait = self._idle_timeout(scene_manager)
+            first = pygame.event.wait(planned_wait)
+            events = pygame.event.get()
+            if first.type != pygame.NOEVENT:
+                events.insert(0, first)
+            dt = self.clock.tick()
+        self._process_window_events(events)
+        return dt, events, planned_wait
+
+    def _process_window_events(self, events):
+        for event in events:
+            if event.type == pygame.WINDOWFOCUSLOST:
+                self.focused = False
+            elif event.type == pygame.WINDOWFOCUSGAINED:
+                self.focused = True
+            elif event.type in (pygame.WINDOWMINIMIZED, pygame.WINDOWHIDDEN):
+                self.visible = False
+            elif event.type in (pygame.WINDOWRESTORED, pygame.WINDOWSHOWN):
+                self.visible = True
+            if event.type in REDRAW_EVENTS:
+                self.needs_redraw = True
+
+    def should_draw(self):
+        """
+            Sprawdza, czy bieżąca klatka powinna zostać narysowana.
+
+            Returns:
+                bool: `True`, jeśli okno jest widoczne, w przeciwnym razie `False`.
+        """
+        return self.visible
@@ -0,0 +1,66 @@
+import pygame
+
+
+class InputManager:
+    """
+    Stan urządzeń wejściowych odtwarzany wyłącznie ze zdarzeń przekazywanych do scen.
+
+    Logika gry odczytuje pozycję myszy i wciśnięte klawisze z tego menedżera zamiast z `pygame.mouse`
+    i `pygame.key`, dzięki czemu stan gry zależy tylko od listy zdarzeń i może zostać odtworzony z zapisu sesji.
+
+    Atrybuty:
+        _mouse_pos (tuple[int, int]): Ostatnia znana pozycja kursora myszy.
+        _pressed_keys (set[int]): Kody wciśniętych klawiszy.
+    """
+
+    _mouse_pos = (0, 0)
+    _pressed_keys = set()
+
+    @staticmethod
+    def process_events(events):
+        """
+            Aktualizuje stan wejścia na podstawie zdarzeń z bieżącej klatki.
+
+            Args:
+                events (list[Event]): Lista zdarzeń.
+        """
+        for event in events:
+            if event.type in (pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP):
+                InputManager._mouse_pos = tuple(event.pos)
+            elif event.type == pygame.KEYDOWN:
+                InputManager._pressed_keys.add(event.key)
+            elif event.type == pygame.KEYUP:
+                InputManager._pressed_keys.discard(event.key)
+            elif event.type == pygame.WINDOWFOCUSLOST:
+                InputManager._pressed_keys.clear()
+
+    @staticmethod
+    def mouse_pos():
+        """
+            Zwraca ostatnią znaną pozycję kursora myszy.
+
+            Returns:
+                tuple[int, int]: Pozycja kursora.
+        """
+        return InputManager._mouse_pos
+
+    @staticmethod
+    def is_pressed(key):
+        """
+            Sprawdza, czy klawisz jest wciśnięty.
+
+            Args:
+                key (int): Kod klawisza, np. `pygame.K_w`.
+
+            Returns:
+                bool: `True`, jeśli klawisz jest wciśnięty, w przeciwnym razie `False`.
+        """
+        return key in InputManager._pressed_keys
+
+    @staticmethod
+    def reset():
+        """
+            Przywraca stan początkowy, np. przed odtworzeniem zapisanej sesji.
+        """
+        InputManager._mouse_pos = (0, 0)
+        InputManager._pressed_keys.clear()
@@ -0,0 +1,184 @@
+import os
+import struct
+from datetime import datetime
+from src.utils.parser import parse_value
+
+MAGIC = b"MEOW"
+VERSION = 1
+HEADER = struct.Struct("<4sB")
+LENGTH = struct.Struct("<H")
+NONE_LENGTH = 0xFFFF
+# Format znacznika czasu w starszych, tekstowych plikach zapisu
+TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# Schemat zapisu w wersji `VERSION`: pola o stałym rozmiarze w kolejności zapisu wraz z formatem `struct`.
+# Zmiana schematu wymaga zwiększenia `VERSION`; `decode_save` musi nadal czytać zapisy w starszych wersjach.
+FIXED_FIELDS = (
+    ("age", "i"),
+    ("hunger_level", "d"),
+    ("boredom_level", "d"),
+    ("quantity", "i"),
+    ("remaining", "i"),
+    ("cooldown", "d"),
+    ("playtime", "i"),
+    ("playtime_remaining", "d"),
+    ("in_cooldown", "?"),
+    ("cooldown_timer", "d"),
+    ("timestamp", "d"),
+    ("static_asset_size", "2i"),
+    ("static_asset_position", "2i"),
+    ("animated_asset_size", "2i"),
+    ("animated_asset_position", "2i"),
+)
+# Pola tekstowe zapisywane po polach stałych jako długość i bajty UTF-8; `None` ma długość `NONE_LENGTH`
+STRING_FIELDS = ("name", "static_asset_path", "animated_asset_path", "label")
+
+FIXED = struct.Struct("<" + "".join(code for _, code in FIXED_FIELDS))
+# Liczba wartości zajmowanych przez każde pole stałe (np. 2 dla rozmiaru)
+FIELD_WIDTHS = tuple(int(code[:-1] or 1) for _, code in FIXED_FIELDS)
+
+
+def encode_save(data):
+    """
+        Koduje dane zapisu gry do formatu binarnego w bieżącej wersji.
+
+        Args:
+            data (dict): Dane zapisu z kluczami z `FIXED_FIELDS` i `STRING_FIELDS`.
+
+        Returns:
+            bytes: Zakodowany zapis.
+    """
+    values = []
+    for (key, _), width in zip(FIXED_FIELDS, FIELD_WIDTHS):
+        if width == 1:
+            values.append(data[key])
+        else:
+            values.extend(data[key])
+    parts = [HEADER.pack(MAGIC, VERSION), FIXED.pack(*values)]
+    for key in STRING_FIELDS:
+        value = data[key]
+        if value is None:
+            parts.append(LENGTH.pack(NONE_LENGTH))
+            continue
+        encoded = str(value).encode("utf-8")
+        if len(encoded) >= NONE_LENGTH:
+            raise ValueError(f"Field {key!r} is too long to save")
+        parts.append(LENGTH.pack(len(encoded)))
+        parts.append(encoded)
+    return b"".join(parts)
+
+
+def decode_save(payload):
+    """
+        Dekoduje zapis gry w formacie binarnym lub w starszym formacie tekstowym `klucz=wartość`.
+
+        Args:
+            payload (bytes): Zawartość pliku zapisu.
+
+        Returns:
+            dict: Dane zapisu w postaci zgodnej z bieżącą wersją formatu.
+
+        Raises:
+            ValueError: Jeśli zapis jest uszkodzony lub ma nieobsługiwaną wersję.
+    """
+    if not payload.startswith(MAGIC):
+        return decode_legacy_save(payload)
+    try:
+        _, version = HEADER.unpack_from(payload, 0)
+        if version != VERSION:
+            raise ValueError(f"Unsupported save version: {version}")
+        values = FIXED.unpack_from(payload, HEADER.size)
+        data = {}
+        index = 0
+        for (key, _), width in zip(FIXED_FIELDS, FIELD_WIDTHS):
+            data[key] = values[index] if width == 1 else values[index:index + width]
+            index += width
+        offset = HEADER.size + FIXED.size
+        for key in STRING_FIELDS:
+            (length,) = LENGTH.unpack_from(payload, offset)
+            offset += LENGTH.size
+            if length == NONE_LENGTH:
+                data[key] = None
+                continue
+            if offset + length > len(payload):
+                raise ValueError("Truncated save file")
+            data[key] = payload[offset:offset + length].decode("utf-8")
+            offset += length
+    except (struct.error, UnicodeDecodeError) as e:
+        raise ValueError(f"Corrupted save file: {e}") from e
+    return data
+
+
+def decode_legacy_save(payload):
+    """
+        Dekoduje zapis w starszym formacie tekstowym, w którym każda linia ma postać `klucz=wartość`.
+
+        Args:
+            payload (bytes): Zawartość pliku zapisu.
+
+        Returns:
+            dict: Dane zapisu ze znacznikiem czasu zamienionym na liczbę sekund od epoki Uniksa; brakujące pola nie
+                są uzupełniane.
+    """
+    data = {}
+    for line in payload.decode("utf-8", errors="replace").splitlines():
+        line = line.strip()
+        if '=' in line:
+            key, val = line.split("=", 1)
+            data[key.strip()] = parse_value(val)
+    # Starsze zapisy przechowują brak etykiety jako tekst "None", a czas zapisu jako datę w czasie lokalnym
+    if data.get("label") == "None":
+        data["label"] = None
+    if isinstance(data.get("timestamp"), str):
+        try:
+            data["timestamp"] = datetime.strptime(data["timestamp"], TIMESTAMP_FORMAT).timestamp()
+        except (ValueError, OverflowError, OSError):
+            data["timestamp"] = None
+    return data
+
+
+def write_atomic(path, payload, sync=True):
+    """
+        Zapisuje dane do pliku tak, aby po awarii w trakcie zapisu na dysku pozostał poprzedni albo nowy plik w całości.
+
+        Dane trafiają najpierw do pliku tymczasowego w tym samym katalogu, który jest synchronizowany z dyskiem
+        i dopiero wtedy podmieniany na plik docelowy.
+
+        Args:
+            path (str): Ścieżka do pliku docelowego.
+            payload (bytes): Dane do zapisania.
+            sync (bool, optional): Flaga wskazująca, czy dane mają zostać zsynchronizowane z dyskiem przed podmianą
+                pliku. Domyślnie `True`; można ją wyłączyć dla plików, które da się odtworzyć.
+    """
+    temp_path = path + ".tmp"
+    try:
+        with open(temp_path, "wb") as f:
+            f.write(payload)
+            if sync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+    if sync:
+        _fsync_directory(os.path.dirname(path) or ".")
+
+
+def _fsync_directory(directory):
+    # Na systemach POSIX zmiana nazwy pliku jest trwała dopiero po synchronizacji katalogu; Windows tego nie obsługuje
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+    try:
+        fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
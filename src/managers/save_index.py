@@ -0,0 +1,260 @@
+import os
+import struct
+import threading
+from src.managers.save_codec import decode_save, write_atomic
+
+INDEX_FILE = "index.bin"
+SAVE_EXTENSION = ".meow"
+MAGIC = b"MEOI"
+VERSION = 1
+HEADER = struct.Struct("<4sBI")
+ENTRY = struct.Struct("<dI")
+LENGTH = struct.Struct("<H")
+
+
+def _pack_text(text):
+    data = ("" if text is None else str(text)).encode("utf-8")[:0xFFFF]
+    return LENGTH.pack(len(data)) + data
+
+
+def _unpack_text(data, offset):
+    (length,) = LENGTH.unpack_from(data, offset)
+    offset += LENGTH.size
+    if offset + length > len(data):
+        raise ValueError("Truncated save index")
+    return data[offset:offset + length].decode("utf-8"), offset + length
+
+
+class SaveSlot:
+    """
+    Wpis indeksu zapisów opisujący jeden plik zapisu bez jego wczytywania.
+
+    Atrybuty:
+        file (str): Nazwa pliku zapisu w katalogu zapisów.
+        name (str): Imię zwierzęcia.
+        character (str): Nazwa postaci (etykieta obrazu zwierzęcia).
+        age (int): Wiek zwierzęcia.
+        timestamp (float): Czas zapisu w sekundach od epoki Uniksa.
+    """
+    __slots__ = ("file", "name", "character", "age", "timestamp")
+
+    def __init__(self, file, name, character, age, timestamp):
+        self.file = file
+        self.name = name
+        self.character = character
+        self.age = age
+        self.timestamp = timestamp
+
+    @staticmethod
+    def from_save(file, data, timestamp=0.0):
+        """
+            Tworzy wpis indeksu na podstawie danych zapisu.
+
+            Args:
+                file (str): Nazwa pliku zapisu.
+                data (dict): Dane zapisu zwrócone przez `decode_save`.
+                timestamp (float, optional): Czas zapisu używany, gdy dane go nie zawierają. Domyślnie `0.0`.
+
+            Returns:
+                SaveSlot: Wpis indeksu.
+        """
+        return SaveSlot(
+            file,
+            str(data.get("name") or os.path.splitext(file)[0]),
+            data.get("label") or "",
+            int(data.get("age") or 0),
+            float(data.get("timestamp") or timestamp),
+        )
+
+
+class SaveIndex:
+    """
+    Indeks plików zapisu przechowywany w pliku `INDEX_FILE` w katalogu zapisów, dzięki któremu lista zapisów jest
+    pobierana jednym odczytem niewielkiego pliku zamiast przeglądania katalogu i odczytu każdego zapisu.
+
+    Indeks jest aktualizowany przy każdym zapisie i usunięciu. Po zapisaniu indeksu jego czas modyfikacji jest
+    ustawiany na czas modyfikacji katalogu; jeśli się różnią, pliki w katalogu zmieniły się poza indeksem (np. zostały
+    skopiowane ręcznie) i indeks jest odbudowywany. Uszkodzony lub brakujący indeks również jest odbudowywany.
+
+    Odczyty, zmiany i odbudowy indeksu są wykonywane pod blokadą `lock`, wspólną dla wszystkich obiektów `SaveIndex`,
+    ponieważ wątek główny i wątek zapisu automatycznego używają osobnych obiektów dla tego samego katalogu.
+
+    Atrybuty:
+        lock (RLock): Blokada klasy, pod którą należy też zapisywać i usuwać pliki zapisu, aby indeks nie uznał
+            ich zmiany za zmianę spoza indeksu.
+        save_dir (str): Katalog zapisów.
+        path (str): Ścieżka do pliku indeksu.
+        slots (dict[str, SaveSlot]): Wpisy indeksu według nazwy pliku zapisu.
+        rebuilds (int): Liczba odbudowań indeksu z plików zapisu.
+    """
+    lock = threading.RLock()
+    # Liczba zapisów indeksu w tym procesie według ścieżki; czas modyfikacji katalogu ma ograniczoną rozdzielczość,
+    # więc nie wystarcza, aby zauważyć zapis wykonany chwilę wcześniej przez inny obiekt `SaveIndex`
+    _generations = {}
+
+    def __init__(self, save_dir):
+        """
+            Inicjalizuje indeks katalogu zapisów; indeks jest wczytywany przy pierwszym użyciu.
+
+            Args:
+                save_dir (str): Katalog zapisów.
+        """
+        self.save_dir = save_dir
+        self.path = os.path.join(save_dir, INDEX_FILE)
+        self.slots = {}
+        self.rebuilds = 0
+        self._stamp = None
+        self._generation = None
+        self._recent = None
+
+    def recent(self):
+        """
+            Zwraca wpisy indeksu od najnowszego do najstarszego zapisu.
+
+            Returns:
+                list[SaveSlot]: Posortowane wpisy indeksu; lista jest współdzielona do następnej zmiany indeksu
+                    i nie powinna być modyfikowana.
+        """
+        with SaveIndex.lock:
+            self._refresh()
+            if self._recent is None:
+                self._recent = sorted(self.slots.values(), key=lambda slot: slot.timestamp, reverse=True)
+            return self._recent
+
+    def get(self, file):
+        """
+            Zwraca wpis indeksu dla pliku zapisu.
+
+            Args:
+                file (str): Nazwa pliku zapisu.
+
+            Returns:
+                SaveSlot | None: Wpis indeksu lub `None`, jeśli plik nie jest w indeksie.
+        """
+        with SaveIndex.lock:
+            self._refresh()
+            return self.slots.get(file)
+
+    def update(self, slot):
+        """
+            Dodaje lub zastępuje wpis indeksu po zapisaniu pliku zapisu.
+
+            Args:
+                slot (SaveSlot): Wpis zapisanego pliku.
+        """
+        with SaveIndex.lock:
+            self._reload()
+            self.slots[slot.file] = slot
+            self._write()
+
+    def remove(self, file):
+        """
+            Usuwa wpis indeksu po usunięciu pliku zapisu.
+
+            Args:
+                file (str): Nazwa usuniętego pliku zapisu.
+        """
+        with SaveIndex.lock:
+            self._reload()
+            if self.slots.pop(file, None) is not None:
+                self._write()
+
+    def rebuild(self):
+        """
+            Odbudowuje indeks, odczytując wszystkie pliki zapisu w katalogu. Pliki, których nie da się odczytać,
+            są pomijane.
+        """
+        with SaveIndex.lock:
+            slots = {}
+            try:
+                files = os.listdir(self.save_dir)
+            except OSError as e:
+                print(f"Error indexing saves: {e}")
+                files = []
+            for file in files:
+                if not file.endswith(SAVE_EXTENSION):
+                    continue
+                path = os.path.join(self.save_dir, file)
+                try:
+                    with open(path, "rb") as f:
+                        data = decode_save(f.read())
+                    slots[file] = SaveSlot.from_save(file, data, os.path.getmtime(path))
+                except (OSError, ValueError) as e:
+                    print(f"Error indexing save {file}: {e}")
+            self.slots = slots
+            self.rebuilds += 1
+            self._write()
+
+    def _directory_stamp(self):
+        try:
+            return os.stat(self.save_dir).st_mtime_ns
+        except OSError:
+            return None
+
+    def _current_generation(self):
+        return SaveIndex._generations.get(self.path, 0)
+
+    def _refresh(self):
+        stamp = self._directory_stamp()
+        if stamp is not None and stamp == self._stamp and self._generation == self._current_generation():
+            return
+        try:
+            if os.stat(self.path).st_mtime_ns != stamp:
+                raise ValueError("Save index is stale")
+            with open(self.path, "rb") as f:
+                self.slots = self._decode(f.read())
+            self._recent = None
+            self._stamp = stamp
+            self._generation = self._current_generation()
+        except (OSError, ValueError, struct.error, UnicodeDecodeError):
+            self.rebuild()
+
+    def _reload(self):
+        # Przed zmianą wpisu katalog zmienił się już przez zapis lub usunięcie pliku, więc nie da się sprawdzić
+        # aktualności indeksu; wczytywany jest tylko indeks zmieniony przez inny obiekt `SaveIndex`
+        try:
+            if os.stat(self.path).st_mtime_ns != self._stamp or self._generation != self._current_generation():
+                with open(self.path, "rb") as f:
+                    self.slots = self._decode(f.read())
+                self._recent = None
+                self._generation = self._current_generation()
+        except (OSError, ValueError, struct.error, UnicodeDecodeError):
+            self.rebuild()
+
+    def _write(self):
+        self._recent = None
+        try:
+            write_atomic(self.path, self._encode(), sync=False)
+            # Zapis indeksu zmienia czas modyfikacji katalogu; od teraz wskazuje on, czy indeks jest aktualny
+            stamp = self._directory_stamp()
+            os.utime(self.path, ns=(stamp, stamp))
+            self._stamp = stamp
+            self._generation = SaveIndex._generations[self.path] = self._current_generation() + 1
+        except (OSError, TypeError) as e:
+            print(f"Error writing save index: {e}")
+            self._stamp = None
+
+    def _encode(self):
+        parts = [HEADER.pack(MAGIC, VERSION, len(self.slots))]
+        for slot in self.slots.values():
+            parts.append(ENTRY.pack(slot.timestamp, slot.age))
+            parts.append(_pack_text(slot.file))
+            parts.append(_pack_text(slot.name))
+            parts.append(_pack_text(slot.character))
+        return b"".join(parts)
+
+    @staticmethod
+    def _decode(data):
+        magic, version, count = HEADER.unpack_from(data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("Not a save index")
+        offset = HEADER.size
+        slots = {}
+        for _ in range(count):
+            timestamp, age = ENTRY.unpack_from(data, offset)
+            offset += ENTRY.size
+            file, offset = _unpack_text(data, offset)
+            name, offset = _unpack_text(data, offset)
+            character, offset = _unpack_text(data, offset)
+            slots[file] = SaveSlot(file, name, character, age, timestamp)
+        return slots
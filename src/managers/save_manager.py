@@ -1,6 +1,7 @@
 import os
-from datetime import datetime
-from src.utils.parser import parse_value
+import time
+from src.managers.save_codec import decode_save, encode_save, write_atomic
+from src.managers.save_index import SaveIndex, SaveSlot
 
 class SaveManager:
     """
@@ -8,12 +9,16 @@ class SaveManager:
 
     Atrybuty:
         save_dir (str): Ścieżka do katalogu, w którym przechowywane są pliki zapisu.
-        max_saves (int): Maksymalna liczba plików zapisu, które mogą być przechowywane.
+        max_saves (int | None): Maksymalna liczba plików zapisu, które mogą być przechowywane; `None` oznacza brak
+            limitu.
+        index (SaveIndex): Indeks plików zapisu w katalogu zapisów.
     """
+
     def __init__(self):
         self.save_dir = "saves"
-        self.max_saves = 5
+        self.max_saves = None
         self._ensure_save_directory()
+        self.index = SaveIndex(self.save_dir)
 
     def _ensure_save_directory(self):
         """
@@ -24,34 +29,71 @@ class SaveManager:
 
     def _get_save_files(self):
         """
-            Pobiera listę plików zapisu w katalogu zapisu.
+            Pobiera listę plików zapisu z indeksu zapisów.
 
             Returns:
-                list: Lista nazw plików zapisu posortowana według daty modyfikacji (od najnowszych do najstarszych).
+                list: Lista nazw plików zapisu posortowana według czasu zapisu (od najnowszych do najstarszych).
         """
-        try:
-            save_files = [f for f in os.listdir(self.save_dir) if f.endswith('.meow')]
-            save_files.sort(key=lambda x: os.path.getmtime(os.path.join(self.save_dir, x)), reverse=True)
-            return save_files
-        except Exception as e:
-            print(f"Error getting save files: {e}")
-            return []
+        return [slot.file for slot in self.index.recent()]
 
-    def _remove_oldest_save(self):
+    def _remove_oldest_save(self, save_files):
         """
             Usuwa najstarszy plik zapisu, jeśli liczba zapisów przekracza maksymalną wartość.
+
+            Args:
+                save_files (list[str]): Nazwy plików zapisu od najnowszego do najstarszego.
         """
-        save_files = self._get_save_files()
-        if len(save_files) >= self.max_saves:
+        if self.max_saves is not None and len(save_files) >= self.max_saves:
             oldest_save = save_files[-1]
             try:
                 os.remove(os.path.join(self.save_dir, oldest_save))
+            except FileNotFoundError:
+                pass
             except Exception as e:
                 print(f"Error removing oldest save: {e}")
+                return
+            self.index.remove(oldest_save)
+
+    @staticmethod
+    def snapshot(animal, food_manager, game_logic):
+        """
+            Kopiuje stan gry potrzebny do zapisu. Kopia zawiera tylko liczby, napisy i krotki, więc można ją zapisać
+            w innym wątku, podczas gdy gra zmienia dalej swój stan.
+
+            Args:
+                animal (Animal): Obiekt zwierzęcia, którego stan jest zapisywany.
+                food_manager (FoodManager): Menedżer jedzenia, którego stan jest zapisywany.
+                game_logic (GameLogic): Logika gry, której stan jest zapisywany.
+
+            Returns:
+                dict: Dane zapisu w postaci przyjmowanej przez `encode_save`.
+        """
+        return {
+            "name": animal.name,
+            "age": animal.age,
+            "hunger_level": animal.hunger_level,
+            "boredom_level": animal.boredom_level,
+            "quantity": food_manager.food_quantity,
+            "remaining": food_manager.remaining_food,
+            "cooldown": food_manager.feed_cooldown,
+            "playtime": game_logic.playtime,
+            "playtime_remaining": game_logic.playtime_remaining,
+            "in_cooldown": game_logic.in_cooldown,
+            "cooldown_timer": game_logic.cooldown_timer,
+            "timestamp": time.time(),
+            "static_asset_path": animal.static_asset.path,
+            "static_asset_size": tuple(animal.static_asset.size),
+            "static_asset_position": tuple(animal.static_asset.position),
+            "animated_asset_path": animal.animated_asset.folder,
+            "animated_asset_size": tuple(animal.animated_asset.size),
+            "animated_asset_position": tuple(animal.animated_asset.pos),
+            "label": animal.static_asset.label,
+        }
 
     def save_game(self, animal, food_manager, game_logic):
         """
-            Zapisuje stan gry do pliku zapisu.
+            Zapisuje stan gry do pliku zapisu w formacie binarnym `encode_save`. Plik jest podmieniany atomowo,
+            więc przerwany zapis nie uszkadza poprzedniej wersji.
 
             Args:
                 animal (Animal): Obiekt zwierzęcia, którego stan jest zapisywany.
@@ -61,43 +103,39 @@ class SaveManager:
             Returns:
                 bool: Zwraca `True`, jeśli zapis zakończył się sukcesem, w przeciwnym razie `False`.
         """
-        save_name = animal.name.replace(" ", "_")
+        return self.write_snapshot(SaveManager.snapshot(animal, food_manager, game_logic))
+
+    def write_snapshot(self, data, evict=True):
+        """
+            Zapisuje kopię stanu gry utworzoną przez `snapshot`. Może być wywołana z wątku w tle; zapisy z różnych
+            wątków oraz odczyty indeksu zapisów są wykonywane po kolei pod blokadą `SaveIndex.lock`.
+
+            Args:
+                data (dict): Dane zapisu.
+                evict (bool, optional): Flaga wskazująca, czy nowy plik zapisu może usunąć najstarszy zapis po
+                    przekroczeniu `max_saves`. Domyślnie `True`; zapis automatyczny jej nie ustawia, aby nie usuwać
+                    zapisów bez udziału gracza.
+
+            Returns:
+                bool: Zwraca `True`, jeśli zapis zakończył się sukcesem, w przeciwnym razie `False`.
+        """
+        save_name = data["name"].replace(" ", "_")
         filename = f"{save_name}.meow"
         filepath = os.path.join(self.save_dir, filename)
-        save_files = self._get_save_files()
-        if not os.path.exists(filepath):
-            if len(save_files) >= self.max_saves:
-                self._remove_oldest_save()
-
-        try:
-            with open(filepath, 'w') as f:
-                f.write(f"name={animal.name}\n")
-                f.write(f"age={animal.age}\n")
-                f.write(f"hunger_level={animal.hunger_level}\n")
-                f.write(f"boredom_level={animal.boredom_level}\n")
-                f.write(f"quantity={food_manager.food_quantity}\n")
-                f.write(f"remaining={food_manager.remaining_food}\n")
-                f.write(f"cooldown={food_manager.feed_cooldown}\n")
-                f.write(f"playtime={game_logic.playtime}\n")
-                f.write(f"playtime_remaining={game_logic.playtime_remaining}\n")
-                f.write(f"in_cooldown={int(game_logic.in_cooldown)}\n")
-                f.write(f"cooldown_timer={game_logic.cooldown_timer}\n")
-                f.write(f"\ntimestamp={datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                f.write(f"static_asset_path={animal.static_asset.path}\n")
-                f.write(f"static_asset_size={animal.static_asset.size[0]},{animal.static_asset.size[1]}\n")
-                f.write(f"static_asset_position={animal.static_asset.position[0]},{animal.static_asset.position[1]}\n")
-                f.write(f"animated_asset_path={animal.animated_asset.folder}\n")
-                f.write(f"animated_asset_size={animal.animated_asset.size[0]},{animal.animated_asset.size[1]}\n")
-                f.write(f"animated_asset_position={animal.animated_asset.pos[0]},{animal.animated_asset.pos[1]}\n")
-                f.write(f"label={animal.static_asset.label}\n")
-            return True
-        except Exception as e:
-            print(f"Error saving game: {e}")
-            return False
+        with SaveIndex.lock:
+            try:
+                if evict and self.max_saves is not None and self.index.get(filename) is None:
+                    self._remove_oldest_save(self._get_save_files())
+                write_atomic(filepath, encode_save(data))
+                self.index.update(SaveSlot.from_save(filename, data))
+                return True
+            except Exception as e:
+                print(f"Error saving game: {e}")
+                return False
 
     def load_game(self, save_file):
         """
-            Ładuje dane gry z podanego pliku zapisu.
+            Ładuje dane gry z podanego pliku zapisu w formacie binarnym lub starszym formacie tekstowym.
 
             Args:
                 save_file (str): Nazwa pliku zapisu do załadowania.
@@ -105,16 +143,9 @@ class SaveManager:
             Returns:
                 dict: Słownik zawierający dane gry lub `None`, jeśli wystąpił błąd.
         """
-        data = {}
         try:
-            with open(os.path.join(self.save_dir, save_file), 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if '=' in line:
-                        key, val = line.split("=", 1)
-                        key, val = key.strip(), parse_value(val)
-                        data[key] = val
-            return data
+            with open(os.path.join(self.save_dir, save_file), 'rb') as f:
+                return decode_save(f.read())
         except Exception as e:
             print(f"Error loading game: {e}")
             return None
@@ -124,6 +155,16 @@ class SaveManager:
             Pobiera listę najnowszych plików zapisu.
 
             Returns:
-                list: Lista nazw najnowszych plików zapisu (maksymalnie `max_saves`).
+                list: Lista nazw najnowszych plików zapisu (maksymalnie `max_saves`, jeśli limit jest ustawiony).
         """
         return self._get_save_files()[:self.max_saves]
+
+    def get_recent_slots(self):
+        """
+            Pobiera wpisy indeksu najnowszych zapisów, zawierające imię, postać i wiek zwierzęcia bez odczytu plików
+            zapisu.
+
+            Returns:
+                list[SaveSlot]: Wpisy najnowszych zapisów (maksymalnie `max_saves`, jeśli limit jest ustawiony).
+        """
+        return self.index.recent()[:self.max_saves]
@@ -1,47 +1,178 @@
+from src.managers.asset_manager import AssetManager
+from src.managers.input_manager import InputManager
+from src.scenes.base_scene import PushScene, PopScene, ReplaceScene
+from src.settings import SIM_STEP_MS, MAX_SIM_STEPS
+
+
 class SceneManager:
     """
     Menedżer scen odpowiedzialny za przełączanie między scenami, obsługę zdarzeń, aktualizację logiki oraz rysowanie scen.
 
+    Sceny tworzą stos: zdarzenia i aktualizacje trafiają tylko do sceny na szczycie, a sceny pod nią są wstrzymane.
+    Jeśli scena na szczycie jest nakładką (`is_overlay`), pod nią rysowane są sceny niżej na stosie.
+
+    Logika scen jest aktualizowana stałymi krokami `SIM_STEP_MS`, niezależnie od liczby klatek na sekundę.
+    Czas pozostały po ostatnim kroku jest przekazywany scenie jako współczynnik interpolacji przy rysowaniu.
+
     Atrybuty:
-        current_scene (Scene): Aktualnie aktywna scena.
+        stack (list[Scene]): Stos scen; ostatnia scena jest aktywna.
+        full_redraw (bool): Flaga wymuszająca odświeżenie całego ekranu w następnej klatce.
+        accumulator (float): Czas w milisekundach, który nie został jeszcze zasymulowany.
     """
     def __init__(self, initial_scene):
-        self.current_scene = initial_scene
+        self.stack = [initial_scene]
+        self.full_redraw = True
+        self.accumulator = 0.0
+        initial_scene.on_enter()
+
+    @property
+    def current_scene(self):
+        return self.stack[-1]
 
     def switch_scene(self, new_scene):
         """
-            Przełącza na nową scenę.
+            Przełącza na nową scenę, zdejmując ze stosu wszystkie dotychczasowe sceny. Obrazy zwolnione przez zdjęte
+            sceny i niepobrane przez nową scenę są usuwane z pamięci.
 
             Args:
                 new_scene (Scene): Scena, na którą należy przełączyć.
         """
-        self.current_scene = new_scene
+        while self.stack:
+            self.stack.pop().on_exit()
+        self.stack.append(new_scene)
+        new_scene.on_enter()
+        AssetManager.evict_unused()
+        self.full_redraw = True
+
+    def push_scene(self, scene):
+        """
+            Odkłada scenę na stos, wstrzymując dotychczasową scenę.
+
+            Args:
+                scene (Scene): Nowa aktywna scena.
+        """
+        self.current_scene.on_suspend()
+        self.stack.append(scene)
+        scene.on_enter()
+        self.full_redraw = True
+
+    def pop_scene(self, count=1):
+        """
+            Zdejmuje sceny ze stosu i wznawia scenę, która znajdzie się na jego szczycie. Ostatnia scena nigdy nie jest
+            zdejmowana.
+
+            Args:
+                count (int, optional): Liczba zdejmowanych scen. Domyślnie `1`.
+        """
+        count = min(count, len(self.stack) - 1)
+        if count <= 0:
+            return
+        for _ in range(count):
+            self.stack.pop().on_exit()
+        self.current_scene.on_resume()
+        self.full_redraw = True
+
+    def replace_scene(self, scene):
+        """
+            Zastępuje scenę na szczycie stosu.
+
+            Args:
+                scene (Scene): Nowa aktywna scena.
+        """
+        self.stack.pop().on_exit()
+        self.stack.append(scene)
+        scene.on_enter()
+        self.full_redraw = True
+
+    def apply(self, transition):
+        """
+            Wykonuje przejście zwrócone przez scenę.
+
+            Args:
+                transition (Scene | PushScene | PopScene | ReplaceScene | None): Przejście lub scena, na którą należy
+                    przełączyć grę.
+        """
+        if not transition:
+            return
+        if isinstance(transition, PushScene):
+            self.push_scene(transition.scene)
+        elif isinstance(transition, PopScene):
+            self.pop_scene(transition.count)
+        elif isinstance(transition, ReplaceScene):
+            self.replace_scene(transition.scene)
+        else:
+            self.switch_scene(transition)
 
     def handle_events(self, events):
         """
-            Obsługuje zdarzenia w aktywnej scenie i przełącza scenę, jeśli jest to wymagane.
+            Aktualizuje stan wejścia, obsługuje zdarzenia w aktywnej scenie i wykonuje zwrócone przejście.
 
             Args:
                 events (list): Lista zdarzeń do obsłużenia.
         """
-        next_scene = self.current_scene.handle_events(events)
-        if next_scene:
-            self.switch_scene(next_scene)
+        InputManager.process_events(events)
+        self.apply(self.current_scene.handle_events(events))
+
+    def is_animating(self):
+        """
+            Sprawdza, czy aktywna scena wymaga pełnej liczby klatek.
 
-    def update(self, dt):
+            Returns:
+                bool: Wynik `is_animating` aktywnej sceny.
         """
-            Aktualizuje logikę aktywnej sceny.
+        return self.current_scene.is_animating()
+
+    def next_deadline(self):
+        """
+            Zwraca czas do najbliższej zmiany aktywnej sceny, która nie wynika ze zdarzeń.
+
+            Returns:
+                float | None: Czas w milisekundach lub `None`.
+        """
+        return self.current_scene.next_deadline()
+
+    def update(self, dt, planned_wait=0):
+        """
+            Aktualizuje logikę aktywnej sceny stałymi krokami symulacji.
+
+            Jeśli od ostatniej klatki upłynęło więcej niż `MAX_SIM_STEPS` kroków ponad zaplanowane oczekiwanie,
+            nadmiarowy czas jest pomijany, aby po dłuższym zatrzymaniu gra nie próbowała nadrobić całego opóźnienia naraz.
 
             Args:
                 dt (float): Czas, który upłynął od ostatniej aktualizacji.
+                planned_wait (float, optional): Czas w milisekundach, przez który pętla gry celowo czekała na zdarzenia
+                    zamiast rysować klatki; ten czas jest symulowany w całości. Domyślnie `0`.
+
+            Returns:
+                int: Liczba wykonanych kroków symulacji.
         """
-        self.current_scene.update(dt)
+        self.accumulator = min(self.accumulator + dt, SIM_STEP_MS * MAX_SIM_STEPS + planned_wait)
+        steps = 0
+        while self.accumulator >= SIM_STEP_MS:
+            self.current_scene.update(SIM_STEP_MS)
+            self.accumulator -= SIM_STEP_MS
+            steps += 1
+        self.current_scene.set_interpolation(self.accumulator / SIM_STEP_MS)
+        return steps
 
     def draw(self, screen):
         """
-            Rysuje aktywną scenę na ekranie.
+            Rysuje aktywną scenę na ekranie, a jeśli jest nakładką - najpierw sceny pod nią.
 
             Args:
                 screen (Surface): Powierzchnia ekranu, na której scena ma być narysowana.
+
+            Returns:
+                list[Rect] | None: Obszary ekranu zmienione przez sceny lub `None`, jeśli należy odświeżyć cały ekran.
         """
-        self.current_scene.draw(screen)
\ No newline at end of file
+        bottom = len(self.stack) - 1
+        while bottom > 0 and self.stack[bottom].is_overlay:
+            bottom -= 1
+        dirty_rects = []
+        for scene in self.stack[bottom:]:
+            rects = scene.draw(screen)
+            dirty_rects = None if rects is None or dirty_rects is None else dirty_rects + rects
+        if self.full_redraw:
+            self.full_redraw = False
+            return None
+        return dirty_rects
@@ -0,0 +1,169 @@
+import os
+import pygame
+from src.settings import SOUND_BANK_MAX_BYTES, SOUND_CHANNELS
+from src.utils.lru_cache import LRUCache
+
+
+def sound_bytes(sound):
+    """
+        Szacuje rozmiar zdekodowanego dźwięku w pamięci.
+
+        Args:
+            sound (Sound): Zdekodowany dźwięk.
+
+        Returns:
+            int: Przybliżony rozmiar próbek w bajtach.
+    """
+    mixer_format = pygame.mixer.get_init()
+    if not mixer_format:
+        return 0
+    frequency, bits, channels = mixer_format
+    return int(sound.get_length() * frequency) * channels * (abs(bits) // 8)
+
+
+class SoundBank:
+    """
+    Bank zdekodowanych efektów dźwiękowych odtwarzanych przez pulę zarezerwowanych kanałów z priorytetami.
+
+    Każdy plik jest dekodowany raz i przechowywany w pamięci w granicach limitu `SOUND_BANK_MAX_BYTES`.
+    Gdy wszystkie kanały są zajęte, nowy dźwięk zastępuje odtwarzany dźwięk o niższym priorytecie.
+
+    Atrybuty:
+        PRIORITY_EFFECT (int): Priorytet krótkich efektów, np. karmienia.
+        PRIORITY_VOICE (int): Priorytet odgłosów zwierzęcia.
+        _sounds (LRUCache): Zdekodowane dźwięki według ścieżki pliku.
+        _listings (dict[str, list[str]]): Zapamiętane listy plików dźwiękowych według katalogu.
+        _channel_priorities (dict[int, int]): Priorytet dźwięku odtwarzanego na każdym zarezerwowanym kanale.
+        _channels_ready (bool): Flaga wskazująca, czy kanały zostały już zarezerwowane.
+    """
+
+    PRIORITY_EFFECT = 1
+    PRIORITY_VOICE = 2
+
+    _sounds = LRUCache(max_bytes=SOUND_BANK_MAX_BYTES, size_of=sound_bytes)
+    _listings = {}
+    _channel_priorities = {}
+    _channels_ready = False
+
+    @staticmethod
+    def list_sounds(directory, extension='.mp3'):
+        """
+            Zwraca listę plików dźwiękowych w katalogu, skanując go tylko przy pierwszym wywołaniu.
+
+            Args:
+                directory (str): Katalog z plikami dźwiękowymi.
+                extension (str, optional): Rozszerzenie plików. Domyślnie `'.mp3'`.
+
+            Returns:
+                list[str]: Ścieżki do plików dźwiękowych.
+        """
+        key = (directory, extension)
+        if key not in SoundBank._listings:
+            try:
+                SoundBank._listings[key] = sorted(
+                    os.path.join(directory, f) for f in os.listdir(directory) if f.endswith(extension))
+            except OSError as e:
+                print(f"Error listing sounds: {e}")
+                return []
+        return SoundBank._listings[key]
+
+    @staticmethod
+    def decode(path):
+        """
+            Dekoduje plik dźwiękowy bez zapisywania go w banku. Może być wywoływana w wątku roboczym.
+
+            Args:
+                path (str): Ścieżka do pliku dźwiękowego.
+
+            Returns:
+                Sound | None: Zdekodowany dźwięk lub `None`, jeśli mikser nie działa lub plik jest niepoprawny.
+        """
+        if not pygame.mixer.get_init():
+            return None
+        try:
+            return pygame.mixer.Sound(path)
+        except Exception as e:
+            print(f"Error loading sound effect: {e}")
+            return None
+
+    @staticmethod
+    def put(path, sound):
+        """
+            Zapisuje zdekodowany dźwięk w banku.
+
+            Args:
+                path (str): Ścieżka do pliku dźwiękowego.
+                sound (Sound): Zdekodowany dźwięk.
+        """
+        if sound is not None:
+            SoundBank._sounds.put(path, sound)
+
+    @staticmethod
+    def get(path):
+        """
+            Zwraca zdekodowany dźwięk, dekodując plik tylko przy pierwszym użyciu.
+
+            Args:
+                path (str): Ścieżka do pliku dźwiękowego.
+
+            Returns:
+                Sound | None: Zdekodowany dźwięk lub `None`, jeśli nie udało się go wczytać.
+        """
+        sound = SoundBank._sounds.get(path)
+        if sound is None:
+            sound = SoundBank.decode(path)
+            SoundBank.put(path, sound)
+        return sound
+
+    @staticmethod
+    def play(path, priority=PRIORITY_EFFECT):
+        """
+            Odtwarza dźwięk na wolnym zarezerwowanym kanale lub na kanale z dźwiękiem o niższym priorytecie.
+
+            Args:
+                path (str): Ścieżka do pliku dźwiękowego.
+                priority (int, optional): Priorytet dźwięku. Domyślnie `PRIORITY_EFFECT`.
+
+            Returns:
+                Channel | None: Kanał odtwarzający dźwięk lub `None`, jeśli dźwięk nie został odtworzony.
+        """
+        sound = SoundBank.get(path)
+        if sound is None:
+            return None
+        channel_id = SoundBank._pick_channel(priority)
+        if channel_id is None:
+            return None
+        channel = pygame.mixer.Channel(channel_id)
+        channel.play(sound)
+        SoundBank._channel_priorities[channel_id] = priority
+        return channel
+
+    @staticmethod
+    def stats():
+        """
+            Zwraca statystyki banku dźwięków.
+
+            Returns:
+                dict: Liczba dźwięków, ich rozmiar w bajtach oraz liczniki trafień, chybień i usunięć.
+        """
+        return SoundBank._sounds.stats()
+
+    @staticmethod
+    def _reserve_channels():
+        if not SoundBank._channels_ready:
+            if pygame.mixer.get_num_channels() < SOUND_CHANNELS:
+                pygame.mixer.set_num_channels(SOUND_CHANNELS)
+            pygame.mixer.set_reserved(SOUND_CHANNELS)
+            SoundBank._channels_ready = True
+
+    @staticmethod
+    def _pick_channel(priority):
+        SoundBank._reserve_channels()
+        lowest_id, lowest_priority = None, priority
+        for channel_id in range(SOUND_CHANNELS):
+            if not pygame.mixer.Channel(channel_id).get_busy():
+                return channel_id
+            channel_priority = SoundBank._channel_priorities.get(channel_id, 0)
+            if channel_priority < lowest_priority:
+                lowest_id, lowest_priority = channel_id, channel_priority
+        return lowest_id
@@ -0,0 +1,98 @@
+import argparse
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from src.main import load_fonts
+from src.managers.input_manager import InputManager
+from src.managers.scene_manager import SceneManager
+from src.scenes.game_scene import GameScene
+from src.scenes.loading_scene import LoadingScene
+from src.scenes.menu_scene import MenuScene
+from src.scenes.scene_registry import SceneRegistry
+from src.settings import SCREEN_WIDTH, SCREEN_HEIGHT
+from src.utils.session_log import SessionLog, describe_state, state_digest
+
+
+def replay(log, screen=None):
+    """
+        Odtwarza zapisaną sesję na `SceneManager` tak szybko, jak to możliwe, bez czekania na kolejne klatki.
+
+        Args:
+            log (SessionLog): Wczytana sesja.
+            screen (Surface, optional): Powierzchnia, na której rysowane są sceny. Domyślnie `None` - sceny nie są
+                rysowane.
+
+        Returns:
+            tuple[SceneManager, int]: Menedżer scen po odtworzeniu sesji oraz liczba odtworzonych klatek.
+    """
+    random.seed(log.seed)
+    InputManager.reset()
+    LoadingScene.blocking = True
+    # Odtwarzanie nie nadpisuje zapisów gracza
+    GameScene.autosave_interval = 0
+    SceneRegistry.clear()
+    scene_manager = SceneManager(SceneRegistry.get(MenuScene))
+    frames = 0
+    for dt, planned_wait, events in log.frames:
+        frames += 1
+        try:
+            scene_manager.handle_events(events)
+        except SystemExit:
+            # Wyjście z gry przyciskiem w menu kończy również nagraną sesję
+            break
+        scene_manager.update(dt, planned_wait)
+        if screen is not None:
+            scene_manager.draw(screen)
+    return scene_manager, frames
+
+
+def main(argv=None):
+    """
+        Odtwarza sesję zapisaną przez `python -m src.main --record` i sprawdza, czy stan gry jest taki sam.
+
+        Args:
+            argv (list[str], optional): Argumenty wiersza poleceń. Domyślnie `sys.argv[1:]`.
+
+        Returns:
+            int: Kod wyjścia: `0`, jeśli stan gry zgadza się z zapisanym, `1` w przeciwnym razie.
+    """
+    parser = argparse.ArgumentParser(prog="python -m src.replay",
+                                     description="Odtwarzanie zapisanej sesji gry bez okna.")
+    parser.add_argument("path", help="plik zapisu sesji")
+    parser.add_argument("--no-draw", action="store_true", help="nie rysuj scen (szybciej, tylko logika gry)")
+    args = parser.parse_args(argv)
+
+    log = SessionLog.load(args.path)
+    pygame.init()
+    try:
+        load_fonts()
+        screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        start = time.perf_counter()
+        scene_manager, frames = replay(log, None if args.no_draw else screen)
+        wall_time = time.perf_counter() - start
+        state = describe_state(scene_manager.current_scene)
+    finally:
+        pygame.quit()
+
+    recorded_seconds = sum(frame[0] for frame in log.frames[:frames]) / 1000
+    print(f"frames: {frames}")
+    print(f"recorded_seconds: {recorded_seconds:.2f}")
+    print(f"wall_seconds: {wall_time:.2f}")
+    for key, value in state.items():
+        print(f"{key}: {value}")
+    if log.digest is None:
+        print("digest: missing (session was not closed cleanly)")
+        return 0
+    matches = state_digest(state) == log.digest
+    print(f"digest: {'match' if matches else 'MISMATCH'}")
+    return 0 if matches else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
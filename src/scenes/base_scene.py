@@ -1,13 +1,87 @@
+class PushScene:
+    """
+    Przejście odkładające nową scenę na stos nad bieżącą, która zostaje wstrzymana.
+
+    Atrybuty:
+        scene (Scene): Scena odkładana na stos.
+    """
+    def __init__(self, scene):
+        self.scene = scene
+
+
+class PopScene:
+    """
+    Przejście zdejmujące sceny ze stosu i wznawiające scenę, która znajdzie się na jego szczycie.
+
+    Atrybuty:
+        count (int): Liczba zdejmowanych scen.
+    """
+    def __init__(self, count=1):
+        self.count = count
+
+
+class ReplaceScene:
+    """
+    Przejście zastępujące scenę na szczycie stosu, bez wznawiania sceny pod nią.
+
+    Atrybuty:
+        scene (Scene): Nowa scena na szczycie stosu.
+    """
+    def __init__(self, scene):
+        self.scene = scene
+
+
 class BaseScene:
     """
     Podstawowa klasa sceny, definiująca interfejs dla obsługi zdarzeń, aktualizacji logiki oraz rysowania.
+
+    Atrybuty:
+        is_overlay (bool): Flaga klasy wskazująca, czy pod sceną należy narysować sceny niżej na stosie.
     """
+
+    is_overlay = False
+
     def handle_events(self, events):
         """
             Obsługuje zdarzenia przekazane do sceny.
 
             Args:
                 events (list): Lista zdarzeń do obsłużenia.
+
+            Returns:
+                Scene | PushScene | PopScene | ReplaceScene | None: Scena, na którą należy przełączyć grę (czyszcząc
+                    stos scen), przejście na stosie scen lub `None`.
+        """
+        pass
+
+    def on_enter(self):
+        """
+            Wywoływana, gdy scena trafia na stos scen.
+        """
+        pass
+
+    def on_exit(self):
+        """
+            Wywoływana, gdy scena zostaje zdjęta ze stosu scen.
+        """
+        pass
+
+    def on_discard(self):
+        """
+            Wywoływana, gdy scena zostaje usunięta z rejestru scen `SceneRegistry` i nie będzie już używana ponownie.
+            Zwalnia zasoby, które scena zatrzymuje na cały czas pobytu w rejestrze.
+        """
+        pass
+
+    def on_suspend(self):
+        """
+            Wywoływana, gdy nad sceną zostaje odłożona inna scena.
+        """
+        pass
+
+    def on_resume(self):
+        """
+            Wywoływana, gdy scena ponownie znajdzie się na szczycie stosu.
         """
         pass
 
@@ -20,11 +94,42 @@ class BaseScene:
         """
         pass
 
+    def is_animating(self):
+        """
+            Sprawdza, czy scena zmienia się w każdej klatce i wymaga pętli gry działającej z pełną liczbą klatek.
+
+            Returns:
+                bool: `True`, jeśli scena jest animowana, `False`, jeśli zmienia się tylko po zdarzeniach
+                    i w terminach zwracanych przez `next_deadline`.
+        """
+        return False
+
+    def next_deadline(self):
+        """
+            Zwraca czas do najbliższej zmiany statycznej sceny, która nie wynika ze zdarzeń, np. zadania zegara gry.
+
+            Returns:
+                float | None: Czas w milisekundach lub `None`, jeśli scena zmienia się tylko po zdarzeniach.
+        """
+        return None
+
+    def set_interpolation(self, alpha):
+        """
+            Ustawia współczynnik interpolacji pomiędzy poprzednim a bieżącym krokiem symulacji, używany przy rysowaniu.
+
+            Args:
+                alpha (float): Część kroku symulacji, która upłynęła od ostatniej aktualizacji, w zakresie od 0 do 1.
+        """
+        pass
+
     def draw(self, screen):
         """
             Rysuje scenę na ekranie.
 
             Args:
                 screen (Surface): Powierzchnia ekranu, na której scena ma być narysowana.
+
+            Returns:
+                list[Rect] | None: Obszary ekranu zmienione w tej klatce lub `None`, jeśli zmienił się cały ekran.
         """
-        pass
\ No newline at end of file
+        return None
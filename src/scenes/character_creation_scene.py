@@ -1,7 +1,8 @@
 import pygame
+from src.managers.font_manager import FontManager, DEFAULT_FONT
 from src.scenes.character_settings_scene import CharacterSettingsScene
 from src.settings import Colors, SCREEN_WIDTH, SCREEN_HEIGHT
-from src.scenes.base_scene import BaseScene
+from src.scenes.base_scene import BaseScene, PopScene
 from src.ui.button import Button
 from src.utils.asset import Asset
 
@@ -19,7 +20,7 @@ class CharacterCreationScene(BaseScene):
         """
             Inicjalizuje scenę tworzenia postaci, ustawiając czcionkę, tytuł, przyciski oraz zasoby postaci.
         """
-        self.font = pygame.font.SysFont(None, 48)
+        self.font = FontManager.get(DEFAULT_FONT, 48)
         self.title = self.font.render("Choose Character", True, Colors.WHITE.value)
 
         self.buttons = [
@@ -52,7 +53,8 @@ class CharacterCreationScene(BaseScene):
                 events (list[Event]): Lista zdarzeń do obsłużenia.
 
             Returns:
-                   Scene: Nowa scena, jeśli użytkownik wybrał postać lub kliknął przycisk, w przeciwnym razie `None`.
+                   Scene | PopScene: Scena ustawień wybranej postaci, powrót do menu po kliknięciu przycisku
+                       lub `None`.
         """
         for event in events:
             if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
@@ -63,8 +65,7 @@ class CharacterCreationScene(BaseScene):
                 for button in self.buttons:
                     if button.is_clicked(mouse_pos):
                         if button.label == "Back To Menu":
-                            from src.scenes.menu_scene import MenuScene
-                            return MenuScene()
+                            return PopScene()
 
     def update(self, dt):
         """
@@ -80,6 +81,9 @@ class CharacterCreationScene(BaseScene):
 
             Args:
                 screen (Surface): Powierzchnia ekranu, na której scena ma być narysowana.
+
+            Returns:
+                list[Rect]: Pusta lista, ponieważ zawartość sceny nie zmienia się między klatkami.
         """
         screen.fill(Colors.DARK_GRAY.value)
         screen.blit(self.title, (SCREEN_WIDTH // 2 - self.title.get_width() // 2, 50))
@@ -89,3 +93,4 @@ class CharacterCreationScene(BaseScene):
 
         for button in self.buttons:
             button.draw(screen)
+        return []
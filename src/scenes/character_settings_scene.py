@@ -1,10 +1,16 @@
 import pygame
+from functools import partial
 from src.entities.animal import Animal
+from src.logic.scheduler import Scheduler
+from src.managers.font_manager import FontManager, DEFAULT_FONT
 from src.scenes.base_scene import BaseScene
-from src.scenes.game_scene import GameScene
+from src.scenes.game_scene import GameScene, preload_game_assets
+from src.scenes.loading_scene import LoadingScene
 from src.settings import Colors, SCREEN_WIDTH, SCREEN_HEIGHT
 from src.ui.button import Button
+from src.ui.dirty_rects import DirtyRectTracker
 from src.utils.animated_asset import AnimatedAsset
+from src.utils.text_cache import render_text
 
 
 def format_time(seconds):
@@ -13,14 +19,6 @@ def format_time(seconds):
     return f"{minutes}m {secs}s"
 
 
-def _adjustment_keys():
-    return [
-        "age_up", "age_down",
-        "food_up", "food_down",
-        "playtime_up", "playtime_down"
-    ]
-
-
 class CharacterSettingsScene(BaseScene):
     """
     Scena ustawień postaci, umożliwiająca konfigurację wybranej postaci przed rozpoczęciem gry.
@@ -35,9 +33,11 @@ class CharacterSettingsScene(BaseScene):
         user_inputs (dict): Dane wprowadzone przez użytkownika.
         adjustment_buttons (dict): Słownik przycisków do zmiany wartości danych postaci.
         play_button (Button): Przycisk rozpoczynający grę.
-        holding_flags (dict): Flagi określające, które przyciski są aktualnie wciśnięte.
-        hold_timer (dict): Słownik przechowujący czas ostatniego wciśnięcia przycisków.
+        scheduler (Scheduler): Zegar sceny odmierzający powtarzanie zmian wartości przytrzymanych przycisków.
+        hold_tasks (dict[str, Timer]): Zadania powtarzające zmianę wartości dla aktualnie wciśniętych przycisków.
         hold_delay (int): Opóźnienie między kolejnymi zmianami wartości przytrzymanych przycisków.
+        preload (LoadBatch): Zasoby gry wczytywane w tle, gdy gracz konfiguruje postać.
+        dirty_tracker (DirtyRectTracker): Zbiera obszary pól wejściowych zmieniane w kolejnych klatkach.
     """
     def __init__(self, selected_character):
         """
@@ -47,7 +47,7 @@ class CharacterSettingsScene(BaseScene):
                 selected_character (Asset): Wybrana postać, której ustawienia są konfigurowane.
             """
         self.selected_character = selected_character
-        self.font = pygame.font.SysFont(None, 48)
+        self.font = FontManager.get(DEFAULT_FONT, 48)
         self.title = self.font.render(self.selected_character.label, True, Colors.WHITE.value)
         self.character_data = {
             "Name": "",
@@ -65,9 +65,14 @@ class CharacterSettingsScene(BaseScene):
         self.user_inputs = {k: v for k, v in self.character_data.items()}
         self._create_adjustment_buttons()
         self.play_button = Button(SCREEN_WIDTH // 2 - 100, SCREEN_HEIGHT - 100, 200, 50, "Play")
-        self.holding_flags = {key: False for key in _adjustment_keys()}
-        self.hold_timer = {key: 0 for key in self.holding_flags}
+        self.scheduler = Scheduler()
+        self.hold_tasks = {}
         self.hold_delay = 100
+        self.dirty_tracker = DirtyRectTracker()
+        self.preload = preload_game_assets(self._animation_folder(), self.selected_character.image.get_size())
+
+    def _animation_folder(self):
+        return f"assets/characters/{self.selected_character.name}_frames"
 
     def _create_adjustment_buttons(self):
         button_specs = [
@@ -118,13 +123,14 @@ class CharacterSettingsScene(BaseScene):
             return self._start_game()
 
         for key, button in self.adjustment_buttons.items():
-            if button.is_clicked(mouse_pos):
-                self.holding_flags[key] = True
+            if button.is_clicked(mouse_pos) and key not in self.hold_tasks:
+                self.hold_tasks[key] = self.scheduler.call_every(self.hold_delay, partial(self._adjust_value, key), delay=0)
         return None
 
     def _reset_holding_flags(self):
-        for key in self.holding_flags:
-            self.holding_flags[key] = False
+        for task in self.hold_tasks.values():
+            self.scheduler.cancel(task)
+        self.hold_tasks.clear()
 
     def _handle_text_input(self, event):
         name = self.user_inputs["Name"]
@@ -136,11 +142,17 @@ class CharacterSettingsScene(BaseScene):
             self.user_inputs["Name"] += event.unicode
 
     def _start_game(self):
+        if self.preload.done():
+            return self._create_game_scene(self.preload.finish())
+        return LoadingScene(self.preload, self._create_game_scene)
+
+    def _create_game_scene(self, assets):
         animated_asset = AnimatedAsset(
-            folder=f"assets/characters/{self.selected_character.name}_frames",
+            folder=self._animation_folder(),
             size=self.selected_character.image.get_size(),
             pos=(SCREEN_WIDTH // 2 - self.selected_character.image.get_width() // 2,
-                 SCREEN_HEIGHT // 2 - self.selected_character.image.get_height() // 2)
+                 SCREEN_HEIGHT // 2 - self.selected_character.image.get_height() // 2),
+            animation=assets.get("animation")
         )
         animal = Animal(
             name=self.user_inputs["Name"],
@@ -157,11 +169,16 @@ class CharacterSettingsScene(BaseScene):
             Args:
                 dt (float): Czas, który upłynął od ostatniej aktualizacji.
         """
-        current_time = pygame.time.get_ticks()
-        for key, flag in self.holding_flags.items():
-            if flag and current_time - self.hold_timer[key] >= self.hold_delay:
-                self._adjust_value(key)
-                self.hold_timer[key] = current_time
+        self.scheduler.advance(dt)
+
+    def next_deadline(self):
+        """
+            Zwraca czas do kolejnej zmiany wartości przytrzymanego przycisku.
+
+            Returns:
+                float | None: Czas w milisekundach lub `None`, jeśli żaden przycisk nie jest przytrzymany.
+        """
+        return self.scheduler.time_until_next()
 
     def _adjust_value(self, key):
         if key == "age_up":
@@ -183,6 +200,9 @@ class CharacterSettingsScene(BaseScene):
 
             Args:
                 screen (Surface): Powierzchnia ekranu, na której scena ma być narysowana.
+
+            Returns:
+                list[Rect]: Obszary pól wejściowych zmienione od poprzedniej klatki.
         """
         screen.fill(Colors.DARK_GRAY.value)
         screen.blit(self.title, (SCREEN_WIDTH // 2 - self.title.get_width() // 2, 10))
@@ -190,6 +210,7 @@ class CharacterSettingsScene(BaseScene):
         self._draw_character(screen)
         self._draw_input_fields(screen)
         self._draw_buttons(screen)
+        return self.dirty_tracker.flush()
 
     def _draw_character(self, screen):
         name_box = self.input_boxes["Name"]
@@ -199,12 +220,12 @@ class CharacterSettingsScene(BaseScene):
 
     def _draw_input_fields(self, screen):
         for key, box in self.input_boxes.items():
-            label = self.font.render(f"{key}:", True, Colors.WHITE.value)
+            label = render_text(self.font, f"{key}:", True, Colors.WHITE.value)
             screen.blit(label, (box.x - label.get_width() - 10, box.y + 5))
-            pygame.draw.rect(screen, Colors.BLUE.value if key == self.active_box else Colors.WHITE.value, box, 2)
+            self.dirty_tracker.add(pygame.draw.rect(screen, Colors.BLUE.value if key == self.active_box else Colors.WHITE.value, box, 2))
             text = self._get_display_text(key)
-            text_surf = self.font.render(text, True, Colors.WHITE.value)
-            screen.blit(text_surf, (box.x + 5, box.y + 5))
+            text_surf = render_text(self.font, text, True, Colors.WHITE.value)
+            self.dirty_tracker.add(screen.blit(text_surf, (box.x + 5, box.y + 5)))
 
     def _get_display_text(self, key):
         if key == "Name":
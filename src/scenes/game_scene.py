@@ -1,15 +1,54 @@
 import pygame
+import random
 from src.logic.cupcake_mode import CupcakeMode
-from src.logic.food_manager import FoodManager
+from src.logic.food_manager import FoodManager, FEEDING_SOUND_PATH
 from src.logic.game_logic import GameLogic
+from src.logic.game_step import step_game
 from src.logic.launch_logic import LaunchLogic
-from src.managers.audio_manager import AudioManager
-from src.scenes.base_scene import BaseScene
-from src.settings import ANIMAL_SCALE_FACTOR, MOUSE_PROXIMITY_THRESHOLD, Colors
+from src.managers.asset_loader import LoadBatch
+from src.managers.asset_manager import AssetManager
+from src.managers.audio_manager import AudioManager, AUDIO_EXTENSIONS, SOUND_DIR
+from src.managers.autosave import get_autosave_worker
+from src.managers.font_manager import FontManager, DEFAULT_FONT
+from src.managers.input_manager import InputManager
+from src.managers.save_manager import SaveManager
+from src.managers.sound_bank import SoundBank
+from src.scenes.base_scene import BaseScene, PushScene
+from src.scenes.scene_registry import SceneRegistry
+from src.settings import ANIMAL_SCALE_FACTOR, AUTOSAVE_INTERVAL, MOUSE_PROXIMITY_THRESHOLD, Colors
 from src.settings import SCREEN_WIDTH, SCREEN_HEIGHT
 from src.ui.background_renderer import BackgroundRenderer
+from src.ui.dirty_rects import DirtyRectTracker
 from src.ui.game_ui import GameUI
-from src.utils.animated_asset import AnimatedAsset
+from src.utils.animated_asset import AnimatedAsset, load_animation
+from src.utils.surface_cache import scaled_surface_cache
+from src.utils.text_cache import render_text
+
+PHONE_PATH = "assets/phone.png"
+PHONE_SIZE = (60, int((60 / 362) * 816))
+MAX_INTERPOLATION_DISTANCE = 64
+
+
+def preload_game_assets(animation_folder, frame_size, images=()):
+    """
+        Zleca wczytanie w tle obrazów i efektów dźwiękowych potrzebnych do uruchomienia sceny gry.
+
+        Args:
+            animation_folder (str): Ścieżka do folderu z klatkami animacji zwierzęcia.
+            frame_size (tuple[int, int]): Rozmiar klatek animacji.
+            images (iterable[tuple[str, tuple[int, int]]], optional): Dodatkowe obrazy `(ścieżka, rozmiar)` do wczytania.
+
+        Returns:
+            LoadBatch: Grupa zadań; wynik `"animation"` można przekazać do `AnimatedAsset`.
+    """
+    batch = LoadBatch()
+    batch.submit("animation", load_animation, animation_folder, frame_size, convert=None)
+    batch.submit_image(PHONE_PATH, PHONE_SIZE)
+    for path, size in images:
+        batch.submit_image(path, size)
+    for path in [FEEDING_SOUND_PATH] + SoundBank.list_sounds(SOUND_DIR):
+        batch.submit_sound(path)
+    return batch
 
 
 class GameScene(BaseScene):
@@ -26,13 +65,24 @@ class GameScene(BaseScene):
         food_manager (FoodManager): Menedżer jedzenia w grze.
         cupcake_mode (CupcakeMode): Tryb gry związany z babeczkami.
         audio_manager (AudioManager): Menedżer dźwięków w grze.
-        last_click_time (int): Czas ostatniego kliknięcia myszą.
+        rng (Random): Generator liczb losowych przekazywany logice gry.
+        scene_time (float): Czas gry w milisekundach, który upłynął od utworzenia sceny.
+        last_click_time (float): Czas gry ostatniego kliknięcia myszą.
         double_click_delay (int): Maksymalny czas między kliknięciami dla podwójnego kliknięcia.
         last_click_pos (tuple): Pozycja ostatniego kliknięcia myszą.
         phone_image (Surface): Obraz telefonu wyświetlanego w grze.
         phone_rect (Rect): Prostokąt określający pozycję telefonu na ekranie.
+        dirty_tracker (DirtyRectTracker): Zbiera obszary ekranu zmienione w kolejnych klatkach.
+        previous_center (Vector2): Środek zwierzęcia z poprzedniego kroku symulacji.
+        interpolation (float): Współczynnik interpolacji pozycji zwierzęcia przy rysowaniu.
+        autosave_interval (int): Odstęp między zapisami automatycznymi w milisekundach; `0` wyłącza zapis.
+        autosave_task (Timer | None): Zadanie zapisu automatycznego w zegarze logiki gry lub `None`, gdy zapis
+            jest wyłączony.
     """
-    def __init__(self, animal, food_quantity, playtime):
+
+    autosave_interval = AUTOSAVE_INTERVAL
+
+    def __init__(self, animal, food_quantity, playtime, rng=random):
         """
             Inicjalizuje scenę gry, ustawiając zwierzę, ilość jedzenia, czas zabawy oraz elementy interfejsu.
 
@@ -40,9 +90,12 @@ class GameScene(BaseScene):
                 animal (Animal): Obiekt zwierzęcia w grze.
                 food_quantity (int): Ilość jedzenia dostępnego w grze.
                 playtime (int): Czas zabawy w sekundach.
+                rng (Random, optional): Generator liczb losowych. Domyślnie moduł `random`.
         """
-        self.font = pygame.font.SysFont(None, 24)
+        self.font = FontManager.get(DEFAULT_FONT, 24)
         self.animal = animal
+        self.rng = rng
+        self.scene_time = 0.0
         self.current_audio = None
         self.is_animation = False
         self.animal.use_static_asset()
@@ -50,30 +103,33 @@ class GameScene(BaseScene):
 
         self.background_manager = BackgroundRenderer()
         self.ui = GameUI(self.font)
-        self.food_manager = FoodManager(food_quantity, self.animal)
-        self.cupcake_mode = CupcakeMode()
-        self.audio_manager = AudioManager()
+        self.food_manager = FoodManager(food_quantity, self.animal, rng=rng)
+        self.cupcake_mode = CupcakeMode(rng=rng)
+        self.audio_manager = AudioManager(rng)
 
         self.last_click_time = 0
         self.double_click_delay = 300
         self.last_click_pos = None
 
-        original_phone = pygame.image.load("assets/phone.png")
-        new_width = 60
-        new_height = int((new_width / 362) * 816)
-        self.phone_image = pygame.transform.scale(original_phone, (new_width, new_height))
+        self.phone_image = AssetManager.acquire(PHONE_PATH, PHONE_SIZE)
         self.phone_rect = self.phone_image.get_rect()
         self.phone_rect.bottomleft = (20, SCREEN_HEIGHT - 20)
+        self.dirty_tracker = DirtyRectTracker()
+        self.previous_center = pygame.math.Vector2(self.launch_logic.position.center)
+        self.interpolation = 1.0
+        self.autosave_task = None
+        if self.autosave_interval:
+            self.autosave_task = self.game_logic.scheduler.call_every(self.autosave_interval, self._autosave)
 
     def _initialize_logics(self, playtime):
         initial_rect = self.animal.static_asset.image.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
-        self.launch_logic = LaunchLogic(SCREEN_WIDTH, SCREEN_HEIGHT)
+        self.launch_logic = LaunchLogic(SCREEN_WIDTH, SCREEN_HEIGHT, rng=self.rng)
         self.launch_logic.set_position(initial_rect)
         self.launch_logic.set_animal(self.animal)
-        self.game_logic = GameLogic(self.animal, playtime)
+        self.game_logic = GameLogic(self.animal, playtime, rng=self.rng)
 
     def _is_double_click(self, mouse_pos):
-        current_time = pygame.time.get_ticks()
+        current_time = self.scene_time
         if self.last_click_pos and self.last_click_time:
             time_diff = current_time - self.last_click_time
             distance = pygame.math.Vector2(mouse_pos).distance_to(pygame.math.Vector2(self.last_click_pos))
@@ -87,6 +143,21 @@ class GameScene(BaseScene):
         self.last_click_pos = mouse_pos
         return False
 
+    def on_exit(self):
+        """
+            Usuwa z rejestru scen menu pauzy i zapisu powiązane z tą sceną gry, zwalnia obrazy telefonu i babeczki
+            oraz wyłącza zapis automatyczny.
+        """
+        from src.scenes.pause_menu_scene import PauseMenuScene
+        from src.scenes.save_menu_scene import SaveMenuScene
+        SceneRegistry.evict(PauseMenuScene, self)
+        SceneRegistry.evict(SaveMenuScene, self)
+        AssetManager.release(PHONE_PATH, PHONE_SIZE)
+        self.cupcake_mode.release()
+        if self.autosave_task is not None:
+            self.game_logic.scheduler.cancel(self.autosave_task)
+            self.autosave_task = None
+
     def handle_events(self, events):
         """
             Obsługuje zdarzenia użytkownika, takie jak kliknięcia myszą, ruchy myszą, wprowadzanie klawiszy oraz przeciąganie plików.
@@ -95,7 +166,7 @@ class GameScene(BaseScene):
                 events (list[Event]): Lista zdarzeń do obsłużenia.
 
             Returns:
-                Scene: Nowa scena, jeśli użytkownik wywołał zmianę sceny, w przeciwnym razie `None`.
+                PushScene: Przejście do menu pauzy, jeśli użytkownik je otworzył, w przeciwnym razie `None`.
         """
         for event in events:
             if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
@@ -154,16 +225,20 @@ class GameScene(BaseScene):
 
             Args:
                 screen (Surface): Powierzchnia ekranu, na której scena ma być narysowana.
+
+            Returns:
+                list[Rect]: Obszary ekranu zmienione od poprzedniej klatki.
             """
         self.background_manager.draw(screen, self.animal.static_asset.name)
-        self._draw_animal(screen)
+        self.dirty_tracker.add(self._draw_animal(screen))
         screen.blit(self.phone_image, self.phone_rect)
         
         if self.cupcake_mode.is_active:
-            self.cupcake_mode.draw(screen, self.font)
-            self.ui.cupcake_button.draw(screen)
+            self.dirty_tracker.add(self.cupcake_mode.draw(screen, self.font, self.interpolation))
+            self.dirty_tracker.add(self.ui.cupcake_button.draw(screen))
         else:
             self._draw_normal_mode(screen)
+        return self.dirty_tracker.flush()
 
     def _handle_keydown(self, key):
         if key == pygame.K_ESCAPE:
@@ -171,68 +246,93 @@ class GameScene(BaseScene):
                 self.cupcake_mode.toggle(self.launch_logic.position)
             else:
                 from src.scenes.pause_menu_scene import PauseMenuScene
-                return PauseMenuScene(self)
+                return PushScene(SceneRegistry.get(PauseMenuScene, self))
 
     def _handle_drop_file(self, file_path):
-        if file_path.lower().endswith(('.mp3', '.wav', '.ogg')):
-            self.audio_manager.play_audio(file_path, self.animal)
-            self.is_animation = self.audio_manager.is_animation
+        if file_path.lower().endswith(AUDIO_EXTENSIONS):
+            self.audio_manager.load_audio_async(file_path)
 
     def update(self, dt):
         """
-            Aktualizuje logikę sceny gry, w tym tryb babeczek, animacje, logikę gry oraz interfejs użytkownika.
+            Aktualizuje logikę sceny gry, w tym tryb babeczek, animacje, logikę gry, interfejs użytkownika i odtwarzanie
+            audio. Zapis automatyczny jest zlecany przez zegar logiki gry co `autosave_interval` milisekund.
 
             Args:
                  dt (float): Czas, który upłynął od ostatniej aktualizacji.
         """
-        if self.cupcake_mode.is_active:
-            self.cupcake_mode.update(dt, self.launch_logic.position, self.launch_logic.position)
-            self._update_animation(dt)
-            self._update_bars()
-        else:
-            self._update_normal_mode(dt)
-
-    def _update_normal_mode(self, dt):
-        self._update_launch_logic()
+        self.scene_time += dt
+        self.previous_center = pygame.math.Vector2(self.launch_logic.position.center)
+        step_game(dt, self.game_logic, self.launch_logic, self.food_manager, self.cupcake_mode)
         self._update_animation(dt)
-        self._update_game_logic(dt)
         self._update_bars()
+        if not self.cupcake_mode.is_active:
+            self.ui.update_button_states(self.game_logic, self.food_manager.feed_cooldown)
+            self._handle_mouse_proximity_during_play()
+        self._update_audio()
+
+    def _update_audio(self):
+        # Plik upuszczony w trybie babeczek zaczyna grać od razu, a nie dopiero po wyjściu z tego trybu
+        self.audio_manager.poll_pending(self.animal)
         self.audio_manager.check_audio_finished(self.animal)
         self.is_animation = self.audio_manager.is_animation
-        self.food_manager.update(dt)
-        self.ui.update_button_states(self.game_logic, self.food_manager.feed_cooldown)
-        self._handle_mouse_proximity_during_play()
 
-    def _update_launch_logic(self):
-        pos, vel = self.launch_logic.update()
-        self.launch_logic.set_position(pos)
+    def _autosave(self):
+        # Kopia stanu powstaje w wątku głównym, a kodowanie i zapis pliku odbywają się w tle
+        get_autosave_worker().submit(SaveManager.snapshot(self.animal, self.food_manager, self.game_logic))
+
+    def is_animating(self):
+        """
+            Sprawdza, czy scena wymaga pełnej liczby klatek: w trybie zabawy lub babeczek, gdy zwierzę się porusza
+            lub jest animowane oraz gdy plik audio jest wczytywany w tle.
+
+            Returns:
+                bool: `True`, jeśli scena jest animowana, w przeciwnym razie `False`.
+        """
+        return (self.cupcake_mode.is_active or self.game_logic.launch_mode or self.launch_logic.is_moving()
+                or self.is_animation or self.audio_manager.is_loading)
+
+    def next_deadline(self):
+        """
+            Zwraca czas do najbliższego zadania zegara logiki gry (w tym zapisu automatycznego) lub jedzenia albo
+            do zmiany sekund wyświetlanych na licznikach okresów odnowienia.
+
+            Returns:
+                float | None: Czas w milisekundach lub `None`, jeśli nic nie czeka.
+        """
+        deadlines = [self.game_logic.scheduler.time_until_next(), self.food_manager.scheduler.time_until_next()]
+        if self.game_logic.in_cooldown:
+            deadlines.append(self.game_logic.cooldown_timer % 1000 or 1000)
+        if self.food_manager.feed_cooldown > 0:
+            deadlines.append(self.food_manager.feed_cooldown % 1000 or 1000)
+        deadlines = [deadline for deadline in deadlines if deadline is not None]
+        return min(deadlines) if deadlines else None
+
+    def set_interpolation(self, alpha):
+        """
+            Ustawia współczynnik interpolacji pozycji zwierzęcia pomiędzy poprzednim a bieżącym krokiem symulacji.
+
+            Args:
+                alpha (float): Część kroku symulacji, która upłynęła od ostatniej aktualizacji, w zakresie od 0 do 1.
+        """
+        self.interpolation = alpha
 
     def _update_animation(self, dt):
         if self.is_animation and isinstance(self.animal.current_asset, AnimatedAsset):
             self.animal.current_asset.pos = self.launch_logic.position.topleft
             self.animal.current_asset.update(dt)
 
-    def _update_game_logic(self, dt):
-        prev_launch_mode = self.game_logic.launch_mode
-        self.game_logic.update(dt, self.launch_logic.is_moving())
-
-        if prev_launch_mode and not self.game_logic.launch_mode:
-            center_pos = (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
-            self.launch_logic.position.center = center_pos
-            self.launch_logic.velocity = pygame.math.Vector2(0, 0)
-
     def _update_bars(self):
         self.ui.hunger_bar.set_value(self.animal.hunger_level)
         self.ui.boredom_bar.set_value(self.animal.boredom_level)
 
     def _handle_mouse_proximity_during_play(self):
         if self.game_logic.launch_mode and not self.launch_logic.is_moving():
-            mouse_pos = pygame.mouse.get_pos()
+            mouse_pos = InputManager.mouse_pos()
             if self.launch_logic.position.collidepoint(mouse_pos):
                 self.launch_logic.launch()
 
         if self.game_logic.launch_mode:
-            mouse_pos = pygame.math.Vector2(pygame.mouse.get_pos())
+            mouse_pos = pygame.math.Vector2(InputManager.mouse_pos())
             center_pos = pygame.math.Vector2(self.launch_logic.position.center)
             distance = mouse_pos.distance_to(center_pos)
 
@@ -243,33 +343,45 @@ class GameScene(BaseScene):
                     speed = 15
                     self.launch_logic.velocity = direction * speed
 
+    def _render_offset(self):
+        current = pygame.math.Vector2(self.launch_logic.position.center)
+        offset = (self.previous_center - current) * (1 - self.interpolation)
+        # Teleportacje (np. powrót na środek ekranu) nie są interpolowane
+        if offset.length() > MAX_INTERPOLATION_DISTANCE:
+            return 0, 0
+        return round(offset.x), round(offset.y)
+
     def _draw_animal(self, screen):
+        dx, dy = self._render_offset()
         if self.is_animation and isinstance(self.animal.current_asset, AnimatedAsset):
-            self.animal.current_asset.draw_scaled(screen, ANIMAL_SCALE_FACTOR)
+            x, y = self.launch_logic.position.topleft
+            self.animal.current_asset.pos = (x + dx, y + dy)
+            return self.animal.current_asset.draw_scaled(screen, ANIMAL_SCALE_FACTOR)
         else:
             if hasattr(self.animal.current_asset, 'image'):
                 image = self.animal.current_asset.image
-                w, h = image.get_size()
-                new_w, new_h = int(w * ANIMAL_SCALE_FACTOR), int(h * ANIMAL_SCALE_FACTOR)
-                scaled_image = pygame.transform.scale(image, (new_w, new_h))
-                center = self.launch_logic.position.center
+                scaled_image = scaled_surface_cache.get_scaled(image, ANIMAL_SCALE_FACTOR)
+                center = self.launch_logic.position.move(dx, dy).center
                 new_rect = scaled_image.get_rect(center=center)
-                screen.blit(scaled_image, new_rect)
+                return screen.blit(scaled_image, new_rect)
             else:
-                self.animal.current_asset.draw_scaled(screen, ANIMAL_SCALE_FACTOR)
+                return self.animal.current_asset.draw_scaled(screen, ANIMAL_SCALE_FACTOR)
 
     def _draw_normal_mode(self, screen):
-        self.ui.draw_status_bars(screen)
-        self.ui.draw_animal_info(screen, self.animal.name, self.animal.age, self.launch_logic.position)
-        self.ui.draw_timer_and_status(screen, self.game_logic, self.food_manager.feed_cooldown)
-        self.ui.launch_button.draw(screen)
+        tracker = self.dirty_tracker
+        tracker.add(self.ui.draw_status_bars(screen))
+        tracker.add(self.ui.draw_animal_info(screen, self.animal.name, self.animal.age, self.launch_logic.position))
+        if self.audio_manager.is_loading:
+            tracker.add(self.ui.draw_loading_label(screen, self.launch_logic.position))
+        tracker.add(self.ui.draw_timer_and_status(screen, self.game_logic, self.food_manager.feed_cooldown))
+        tracker.add(self.ui.launch_button.draw(screen))
 
         food_text = f"Food left: {self.food_manager.remaining_food}"
-        food_surface = self.font.render(food_text, True, Colors.WHITE.value)
+        food_surface = render_text(self.font, food_text, True, Colors.WHITE.value)
         food_rect = food_surface.get_rect(midbottom=(self.ui.feed_button.rect.midtop[0], self.ui.feed_button.rect.top - 5))
-        screen.blit(food_surface, food_rect)
+        tracker.add(screen.blit(food_surface, food_rect))
         
-        self.ui.feed_button.draw(screen)
+        tracker.add(self.ui.feed_button.draw(screen))
         self.ui.cupcake_button.set_enabled(not self.game_logic.in_cooldown)
-        self.ui.cupcake_button.draw(screen)
-        self.food_manager.draw(screen)
\ No newline at end of file
+        tracker.add(self.ui.cupcake_button.draw(screen))
+        tracker.add(self.food_manager.draw(screen))
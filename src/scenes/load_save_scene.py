@@ -1,49 +1,66 @@
 import pygame
 from src.entities.animal import Animal
+from src.logic.catch_up import elapsed_since, fast_forward
 from src.settings import Colors, SCREEN_WIDTH, SCREEN_HEIGHT
-from src.scenes.base_scene import BaseScene
+from src.scenes.base_scene import BaseScene, PopScene
 from src.ui.button import Button
-from src.managers.font_manager import FontManager
+from src.managers.font_manager import FontManager, DEFAULT_FONT
 from src.managers.save_manager import SaveManager
-from src.scenes.game_scene import GameScene
+from src.scenes.game_scene import GameScene, preload_game_assets
+from src.scenes.loading_scene import LoadingScene
 from src.utils.animated_asset import AnimatedAsset
 from src.utils.asset import Asset
+from src.utils.text_cache import render_text
+
+# Układ listy zapisów: widoczne są tylko wiersze jednej strony, a przyciski wierszy są używane ponownie przy przewijaniu
+ROWS_PER_PAGE = 5
+ROW_WIDTH = 400
+ROW_HEIGHT = 60
+ROW_SPACING = 20
+LIST_TOP = 100
+ROW_PITCH = ROW_HEIGHT + ROW_SPACING
+
 
 class LoadSaveScene(BaseScene):
     """
     Scena ładowania zapisanej gry, umożliwiająca użytkownikowi wybór zapisu do wczytania.
 
+    Lista zapisów jest przewijana kółkiem myszy, klawiszami strzałek, Page Up/Page Down, Home/End lub przyciskami
+    stron. Dane wierszy pochodzą z indeksu zapisów, a scena ma tylko `ROWS_PER_PAGE` przycisków, którym przy
+    przewijaniu zmieniane są etykiety, więc tekst zapisów spoza ekranu nigdy nie jest renderowany.
+
     Atrybuty:
         font (Font): Czcionka używana do wyświetlania tekstu.
+        page_font (Font): Czcionka numeru strony.
         save_manager (SaveManager): Menedżer zapisów gry.
-        save_files (list[str]): Lista nazw plików zapisów gry.
-        buttons (list[Button]): Lista przycisków odpowiadających zapisom gry.
+        slots (list[SaveSlot]): Wpisy indeksu wszystkich zapisów, od najnowszego.
+        first_row (int): Indeks zapisu wyświetlanego w pierwszym wierszu.
+        rows (list[Button]): Przyciski widocznych wierszy listy.
         back_button (Button): Przycisk powrotu do menu głównego.
+        previous_button (Button): Przycisk poprzedniej strony.
+        next_button (Button): Przycisk następnej strony.
     """
     def __init__(self):
         """
-            Inicjalizuje scenę ładowania zapisów gry, tworząc przyciski dla dostępnych zapisów oraz przycisk powrotu.
+            Inicjalizuje scenę ładowania zapisów gry, tworząc przyciski wierszy listy, stron oraz przycisk powrotu.
         """
-        self.font = FontManager.get_font("Boldins")
+        self.font = FontManager.get("Boldins")
+        self.page_font = FontManager.get(DEFAULT_FONT, 32)
         self.save_manager = SaveManager()
-        self.save_files = self.save_manager.get_recent_saves()
-        self.buttons = []
-        button_width = 400
-        button_height = 60
-        spacing = 20
-        start_y = SCREEN_HEIGHT // 2 - (len(self.save_files) * (button_height + spacing)) // 2
-        
-        for i, save_file in enumerate(self.save_files):
-            y = start_y + i * (button_height + spacing)
-            self.buttons.append(Button(
-                SCREEN_WIDTH // 2 - button_width // 2,
-                y,
-                button_width,
-                button_height,
-                save_file,
+        self.slots = []
+        self.first_row = 0
+        self.rows = [
+            Button(
+                SCREEN_WIDTH // 2 - ROW_WIDTH // 2,
+                LIST_TOP + i * ROW_PITCH,
+                ROW_WIDTH,
+                ROW_HEIGHT,
+                "",
                 font=self.font,
                 color=Colors.BUTTON_PINK.value
-            ))
+            )
+            for i in range(ROWS_PER_PAGE)
+        ]
 
         self.back_button = Button(
             SCREEN_WIDTH // 2 - 100,
@@ -54,62 +71,178 @@ class LoadSaveScene(BaseScene):
             font=self.font,
             color=Colors.BUTTON_PINK.value
         )
+        self.previous_button = Button(self.back_button.rect.left - 70, SCREEN_HEIGHT - 100, 50, 50, "<",
+                                      font=self.font, color=Colors.BUTTON_PINK.value)
+        self.next_button = Button(self.back_button.rect.right + 20, SCREEN_HEIGHT - 100, 50, 50, ">",
+                                  font=self.font, color=Colors.BUTTON_PINK.value)
+        self._changed = True
+        self._refresh_saves()
+
+    def on_enter(self):
+        """
+            Odświeża listę zapisów, które mogły się zmienić od poprzedniej wizyty w scenie.
+        """
+        self._refresh_saves()
+
+    def _refresh_saves(self):
+        self.slots = self.save_manager.get_recent_slots()
+        self.scroll_to(self.first_row)
+
+    @property
+    def visible_rows(self):
+        """
+            Liczba wierszy listy, w których wyświetlany jest zapis.
+
+            Returns:
+                int: Liczba widocznych wierszy.
+        """
+        return max(0, min(ROWS_PER_PAGE, len(self.slots) - self.first_row))
+
+    @property
+    def page_count(self):
+        """
+            Liczba stron listy zapisów.
+
+            Returns:
+                int: Liczba stron, co najmniej 1.
+        """
+        return max(1, -(-len(self.slots) // ROWS_PER_PAGE))
+
+    def scroll_to(self, first_row):
+        """
+            Przewija listę tak, aby zapis o podanym indeksie był w pierwszym wierszu, i przypisuje widocznym
+            wierszom etykiety odpowiadających im zapisów.
+
+            Args:
+                first_row (int): Indeks zapisu; jest ograniczany do zakresu listy.
+        """
+        first_row = max(0, min(first_row, len(self.slots) - ROWS_PER_PAGE))
+        self.first_row = first_row
+        for row, slot in zip(self.rows, self.slots[first_row:first_row + ROWS_PER_PAGE]):
+            row.label = slot.name
+        self.previous_button.set_enabled(first_row > 0)
+        self.next_button.set_enabled(first_row + ROWS_PER_PAGE < len(self.slots))
+        self._changed = True
+
+    def _slot_at(self, mouse_pos):
+        row = (mouse_pos[1] - LIST_TOP) // ROW_PITCH
+        if 0 <= row < self.visible_rows and self.rows[row].is_clicked(mouse_pos):
+            return self.slots[self.first_row + row]
+        return None
 
     def handle_events(self, events):
         """
-            Obsługuje zdarzenia użytkownika, takie jak kliknięcia myszą.
+            Obsługuje zdarzenia użytkownika, takie jak kliknięcia myszą, przewijanie kółkiem myszy i klawisze
+            przewijania listy.
 
             Args:
                 events (list[Event]): Lista zdarzeń do obsłużenia.
 
             Returns:
-                Scene: Nowa scena, jeśli użytkownik wybrał zapis lub kliknął przycisk powrotu, w przeciwnym razie `None`.
+                Scene | PopScene: Scena ładowania wybranego zapisu, powrót do menu po kliknięciu przycisku
+                    powrotu lub `None`.
         """
         for event in events:
-            if event.type == pygame.MOUSEBUTTONDOWN:
-                mouse_pos = pygame.mouse.get_pos()
+            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+                mouse_pos = event.pos
 
                 if self.back_button.is_clicked(mouse_pos):
-                    from src.scenes.menu_scene import MenuScene
-                    return MenuScene()
-
-                for save_file in self.save_files:
-                    button = next(btn for btn in self.buttons if btn.label == save_file)
-                    if button.is_clicked(mouse_pos):
-                        save_data = self.save_manager.load_game(save_file)
-                        if save_data:
-                            return create_game_state(save_data)
+                    return PopScene()
+                if self.previous_button.is_clicked(mouse_pos):
+                    self.scroll_to(self.first_row - ROWS_PER_PAGE)
+                elif self.next_button.is_clicked(mouse_pos):
+                    self.scroll_to(self.first_row + ROWS_PER_PAGE)
+
+                slot = self._slot_at(mouse_pos)
+                if slot is not None:
+                    save_data = self.save_manager.load_game(slot.file)
+                    if save_data:
+                        return load_game_state(save_data)
+            elif event.type == pygame.MOUSEWHEEL:
+                self.scroll_to(self.first_row - event.y)
+            elif event.type == pygame.KEYDOWN:
+                self._handle_keydown(event.key)
         return None
 
+    def _handle_keydown(self, key):
+        if key == pygame.K_UP:
+            self.scroll_to(self.first_row - 1)
+        elif key == pygame.K_DOWN:
+            self.scroll_to(self.first_row + 1)
+        elif key == pygame.K_PAGEUP:
+            self.scroll_to(self.first_row - ROWS_PER_PAGE)
+        elif key == pygame.K_PAGEDOWN:
+            self.scroll_to(self.first_row + ROWS_PER_PAGE)
+        elif key == pygame.K_HOME:
+            self.scroll_to(0)
+        elif key == pygame.K_END:
+            self.scroll_to(len(self.slots))
+
     def draw(self, screen):
         """
-            Rysuje scenę ładowania zapisów gry, w tym tło, tytuł oraz przyciski.
+            Rysuje scenę ładowania zapisów gry, w tym tło, tytuł, widoczne wiersze listy oraz przyciski.
 
             Args:
                 screen (Surface): Powierzchnia ekranu, na której scena ma być narysowana.
+
+            Returns:
+                list[Rect]: Cały ekran po przewinięciu listy, w przeciwnym razie pusta lista.
             """
         overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
         overlay.fill(Colors.BLACK.value)
         overlay.set_alpha(128)
         screen.blit(overlay, (0, 0))
 
-        title = self.font.render("Load Save", True, Colors.WHITE.value)
+        title = render_text(self.font, "Load Save", True, Colors.WHITE.value)
         screen.blit(title, (SCREEN_WIDTH // 2 - title.get_width() // 2, 50))
 
-        for button in self.buttons:
-            button.draw(screen)
+        for row in self.rows[:self.visible_rows]:
+            row.draw(screen)
         self.back_button.draw(screen)
+        if self.page_count > 1:
+            self.previous_button.draw(screen)
+            self.next_button.draw(screen)
+            page = self.first_row // ROWS_PER_PAGE + 1
+            if self.first_row + ROWS_PER_PAGE >= len(self.slots):
+                page = self.page_count
+            page_text = render_text(self.page_font, f"{page} / {self.page_count}", True, Colors.WHITE.value)
+            screen.blit(page_text, (SCREEN_WIDTH - page_text.get_width() - 20, 55))
+
+        if self._changed:
+            self._changed = False
+            return [screen.get_rect()]
+        return []
+
+def load_game_state(save_data):
+    """
+        Zleca wczytanie zasobów zapisanej gry w tle i zwraca scenę ładowania, która po ich wczytaniu odtworzy stan gry.
+
+        Args:
+            save_data (dict): Dane zapisane w pliku.
+
+        Returns:
+            LoadingScene: Scena ładowania przechodząca do sceny gry.
+    """
+    batch = preload_game_assets(
+        save_data.get("animated_asset_path"),
+        save_data.get("animated_asset_size"),
+        images=[(save_data.get("static_asset_path"), save_data.get("static_asset_size"))]
+    )
+    return LoadingScene(batch, lambda assets: create_game_state(save_data, assets))
+
 
-def create_game_state(save_data):
+def create_game_state(save_data, assets=None):
     """
-        Tworzy stan gry na podstawie danych zapisanych w pliku.
+        Tworzy stan gry na podstawie danych zapisanych w pliku i przesuwa go o czas, który upłynął od zapisu.
 
         Args:
             save_data (dict): Dane zapisane w pliku.
+            assets (dict, optional): Zasoby wczytane w tle przez `preload_game_assets`. Domyślnie `None`.
 
         Returns:
             GameScene: Scena gry z odtworzonym stanem.
     """
+    assets = assets or {}
     static_asset = Asset(
         save_data.get("static_asset_path"),
         save_data.get("static_asset_size"),
@@ -120,7 +253,8 @@ def create_game_state(save_data):
     animated_asset = AnimatedAsset(
         folder=save_data.get("animated_asset_path"),
         size=save_data.get("animated_asset_size"),
-        pos=save_data.get("animated_asset_position")
+        pos=save_data.get("animated_asset_position"),
+        animation=assets.get("animation")
     )
 
     animal = Animal(
@@ -140,4 +274,7 @@ def create_game_state(save_data):
     game_scene.game_logic.playtime_remaining = save_data.get("playtime_remaining")
     game_scene.game_logic.in_cooldown = bool(save_data.get("in_cooldown"))
     game_scene.game_logic.cooldown_timer = save_data.get("cooldown_timer")
+    game_scene.food_manager.feed_cooldown = save_data.get("cooldown") or 0
+    if save_data.get("timestamp"):
+        fast_forward(game_scene.game_logic, game_scene.food_manager, elapsed_since(save_data.get("timestamp")))
     return game_scene
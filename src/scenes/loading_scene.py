@@ -0,0 +1,84 @@
+from src.managers.font_manager import FontManager
+from src.scenes.base_scene import BaseScene
+from src.settings import Colors, SCREEN_WIDTH, SCREEN_HEIGHT
+from src.ui.bar import Bar
+from src.utils.text_cache import render_text
+
+
+class LoadingScene(BaseScene):
+    """
+    Scena ładowania wyświetlana, dopóki zasoby wczytywane w tle nie są gotowe.
+
+    Atrybuty:
+        blocking (bool): Flaga klasy wymuszająca czekanie na zasoby w pierwszej obsłudze zdarzeń. Ustawiana podczas
+            nagrywania i odtwarzania sesji, aby moment przełączenia sceny nie zależał od szybkości wczytywania.
+        batch (LoadBatch): Grupa zadań wczytywania, na które czeka scena.
+        on_ready (callable): Funkcja przyjmująca wyniki zadań i zwracająca następną scenę.
+        font (Font): Czcionka używana do wyświetlania tekstu.
+        progress_bar (Bar): Pasek postępu wczytywania.
+    """
+    blocking = False
+
+    def __init__(self, batch, on_ready):
+        """
+            Inicjalizuje scenę ładowania.
+
+            Args:
+                batch (LoadBatch): Grupa zadań wczytywania, na które czeka scena.
+                on_ready (callable): Funkcja przyjmująca wyniki zadań i zwracająca następną scenę.
+        """
+        self.batch = batch
+        self.on_ready = on_ready
+        self.font = FontManager.get("Boldins")
+        self.progress_bar = Bar(SCREEN_WIDTH // 2 - 150, SCREEN_HEIGHT // 2 + 20, 300, 20,
+                                Colors.BUTTON_PINK.value, Colors.WHITE.value)
+        self.progress_bar.set_value(0)
+
+    def handle_events(self, events):
+        """
+            Przełącza na następną scenę, gdy wszystkie zasoby zostały wczytane.
+
+            Args:
+                events (list[Event]): Lista zdarzeń do obsłużenia.
+
+            Returns:
+                Scene: Następna scena, jeśli wczytywanie zostało zakończone, w przeciwnym razie `None`.
+        """
+        if LoadingScene.blocking:
+            self.batch.wait()
+        if self.batch.done():
+            return self.on_ready(self.batch.finish())
+        return None
+
+    def update(self, dt):
+        """
+            Aktualizuje pasek postępu wczytywania.
+
+            Args:
+                dt (float): Czas, który upłynął od ostatniej aktualizacji.
+        """
+        self.progress_bar.set_value(self.batch.progress() * self.progress_bar.max_value)
+
+    def is_animating(self):
+        """
+            Scena ładowania sprawdza postęp wczytywania w każdej klatce.
+
+            Returns:
+                bool: Zawsze `True`.
+        """
+        return True
+
+    def draw(self, screen):
+        """
+            Rysuje napis i pasek postępu wczytywania.
+
+            Args:
+                screen (Surface): Powierzchnia ekranu, na której scena ma być narysowana.
+
+            Returns:
+                list[Rect]: Obszar paska postępu.
+        """
+        screen.fill(Colors.DARK_GRAY.value)
+        title = render_text(self.font, "Loading...", True, Colors.WHITE.value)
+        screen.blit(title, title.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 30)))
+        return [self.progress_bar.draw(screen, rounded=True)]
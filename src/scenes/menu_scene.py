@@ -1,11 +1,13 @@
 import pygame
 
 from src.settings import Colors, SCREEN_WIDTH, SCREEN_HEIGHT
-from src.scenes.base_scene import BaseScene
+from src.scenes.base_scene import BaseScene, PushScene
 from src.ui.button import Button
-from src.scenes.character_creation_scene import CharacterCreationScene
+from src.managers.asset_manager import AssetManager
 from src.managers.font_manager import FontManager
-from src.scenes.load_save_scene import LoadSaveScene
+from src.scenes.scene_registry import SceneRegistry
+
+LOGO_PATH = "assets/logo.png"
 
 
 class MenuScene(BaseScene):
@@ -13,24 +15,30 @@ class MenuScene(BaseScene):
     Scena menu głównego, umożliwiająca użytkownikowi wybór opcji takich jak rozpoczęcie gry, wczytanie zapisu lub zakończenie aplikacji.
 
     Atrybuty:
-        logo (Surface): Obraz logo wyświetlany na ekranie menu.
+        logo_size (tuple[int, int]): Rozmiar logo dopasowany do ekranu.
+        logo (Surface): Obraz logo wyświetlany na ekranie menu; scena zatrzymuje go do czasu usunięcia z rejestru
+            scen, więc powrót do menu nie wczytuje go ponownie.
         buttons (list[Button]): Lista przycisków dostępnych w menu głównym.
     """
     def __init__(self):
         """
             Inicjalizuje scenę menu głównego, ustawiając logo oraz przyciski.
         """
-        self.logo = pygame.image.load("assets/logo.png")
         scale_factor = min(SCREEN_WIDTH / 831, SCREEN_HEIGHT / 157) * 0.9
-        new_width = int(831 * scale_factor)
-        new_height = int(157 * scale_factor)
-        self.logo = pygame.transform.scale(self.logo, (new_width, new_height))
+        self.logo_size = (int(831 * scale_factor), int(157 * scale_factor))
+        self.logo = AssetManager.acquire(LOGO_PATH, self.logo_size)
         self.buttons = [
-            Button(SCREEN_WIDTH // 2 - 100, SCREEN_HEIGHT // 2 - 100, 200, 50, "Start Game", font=FontManager.get_font("Boldins"), color=Colors.BUTTON_PINK.value),
-            Button(SCREEN_WIDTH // 2 - 100, SCREEN_HEIGHT // 2, 200, 50, "Load Save", font=FontManager.get_font("Boldins"), color=Colors.BUTTON_PINK.value),
-            Button(SCREEN_WIDTH // 2 - 100, SCREEN_HEIGHT // 2 + 100, 200, 50, "Exit", font=FontManager.get_font("Boldins"), color=Colors.BUTTON_PINK.value)
+            Button(SCREEN_WIDTH // 2 - 100, SCREEN_HEIGHT // 2 - 100, 200, 50, "Start Game", font=FontManager.get("Boldins"), color=Colors.BUTTON_PINK.value),
+            Button(SCREEN_WIDTH // 2 - 100, SCREEN_HEIGHT // 2, 200, 50, "Load Save", font=FontManager.get("Boldins"), color=Colors.BUTTON_PINK.value),
+            Button(SCREEN_WIDTH // 2 - 100, SCREEN_HEIGHT // 2 + 100, 200, 50, "Exit", font=FontManager.get("Boldins"), color=Colors.BUTTON_PINK.value)
         ]
 
+    def on_discard(self):
+        """
+            Zwalnia obraz logo po usunięciu sceny z rejestru scen.
+        """
+        AssetManager.release(LOGO_PATH, self.logo_size)
+
     def handle_events(self, events):
         """
             Obsługuje zdarzenia użytkownika, takie jak kliknięcia myszą.
@@ -39,17 +47,20 @@ class MenuScene(BaseScene):
                 events (list[Event]): Lista zdarzeń do obsłużenia.
 
             Returns:
-                Scene: Nowa scena, jeśli użytkownik wybrał opcję z menu, w przeciwnym razie `None`.
+                PushScene: Przejście do wybranej sceny, jeśli użytkownik wybrał opcję z menu, w przeciwnym razie `None`.
         """
         for event in events:
             if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                 mouse_pos = event.pos
                 for button in self.buttons:
                     if button.is_clicked(mouse_pos):
+                        # Sceny gry są importowane dopiero po wybraniu opcji, aby nie opóźniać pierwszej klatki menu
                         if button.label == "Start Game":
-                            return CharacterCreationScene()
+                            from src.scenes.character_creation_scene import CharacterCreationScene
+                            return PushScene(SceneRegistry.get(CharacterCreationScene))
                         elif button.label == "Load Save":
-                            return LoadSaveScene()
+                            from src.scenes.load_save_scene import LoadSaveScene
+                            return PushScene(SceneRegistry.get(LoadSaveScene))
                         elif button.label == "Exit":
                             pygame.quit()
                             exit()
@@ -60,9 +71,13 @@ class MenuScene(BaseScene):
 
             Args:
                 screen (Surface): Powierzchnia ekranu, na której scena ma być narysowana.
+
+            Returns:
+                list[Rect]: Pusta lista, ponieważ zawartość sceny nie zmienia się między klatkami.
         """
         screen.fill(Colors.PINK_MENU.value)
         screen.blit(self.logo, (SCREEN_WIDTH // 2 - self.logo.get_width() // 2, 50))
 
         for button in self.buttons:
-            button.draw(screen)
\ No newline at end of file
+            button.draw(screen)
+        return []
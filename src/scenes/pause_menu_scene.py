@@ -1,18 +1,23 @@
 import pygame
 from src.settings import Colors, SCREEN_WIDTH, SCREEN_HEIGHT
-from src.scenes.base_scene import BaseScene
+from src.scenes.base_scene import BaseScene, PopScene, ReplaceScene
 from src.ui.button import Button
 from src.managers.font_manager import FontManager
 from src.scenes.save_menu_scene import SaveMenuScene
+from src.scenes.scene_registry import SceneRegistry
+from src.utils.text_cache import render_text
 
 class PauseMenuScene(BaseScene):
     """
     Scena menu pauzy, umożliwiająca użytkownikowi wstrzymanie gry, zapisanie stanu gry lub zakończenie rozgrywki.
+    Jest nakładką rysowaną nad wstrzymaną sceną gry.
 
     Atrybuty:
         game_scene (GameScene): Obiekt sceny gry, który został wstrzymany.
         buttons (list[Button]): Lista przycisków dostępnych w menu pauzy.
     """
+    is_overlay = True
+
     def __init__(self, game_scene):
         """
             Inicjalizuje scenę menu pauzy, ustawiając przyciski oraz odniesienie do wstrzymanej sceny gry.
@@ -23,13 +28,13 @@ class PauseMenuScene(BaseScene):
         self.game_scene = game_scene
         self.buttons = [
             Button(SCREEN_WIDTH // 2 - 100, SCREEN_HEIGHT // 2 - 100, 200, 50, 
-                  "Resume Game", font=FontManager.get_font("Boldins"), 
+                  "Resume Game", font=FontManager.get("Boldins"), 
                   color=Colors.BUTTON_PINK.value),
             Button(SCREEN_WIDTH // 2 - 100, SCREEN_HEIGHT // 2, 200, 50, 
-                  "Save Game", font=FontManager.get_font("Boldins"), 
+                  "Save Game", font=FontManager.get("Boldins"), 
                   color=Colors.BUTTON_PINK.value),
             Button(SCREEN_WIDTH // 2 - 100, SCREEN_HEIGHT // 2 + 100, 200, 50, 
-                  "Quit Game", font=FontManager.get_font("Boldins"), 
+                  "Quit Game", font=FontManager.get("Boldins"), 
                   color=Colors.BUTTON_PINK.value)
         ]
 
@@ -41,7 +46,7 @@ class PauseMenuScene(BaseScene):
                 events (list[Event]): Lista zdarzeń do obsłużenia.
 
             Returns:
-                Scene: Nowa scena, jeśli użytkownik wybrał opcję z menu pauzy, w przeciwnym razie `None`.
+                Scene | PopScene | ReplaceScene: Przejście wybrane w menu pauzy lub `None`.
             """
         for event in events:
             if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
@@ -49,16 +54,16 @@ class PauseMenuScene(BaseScene):
                 for button in self.buttons:
                     if button.is_clicked(mouse_pos):
                         if button.label == "Resume Game":
-                            return self.game_scene
+                            return PopScene()
                         elif button.label == "Save Game":
-                            return SaveMenuScene(self.game_scene)
+                            return ReplaceScene(SceneRegistry.get(SaveMenuScene, self.game_scene))
                         elif button.label == "Quit Game":
                             from src.scenes.menu_scene import MenuScene
-                            return MenuScene()
+                            return SceneRegistry.get(MenuScene)
             
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
-                    return self.game_scene
+                    return PopScene()
 
     def draw(self, screen):
         """
@@ -66,16 +71,20 @@ class PauseMenuScene(BaseScene):
 
             Args:
                 screen (Surface): Powierzchnia ekranu, na której scena ma być narysowana.
+
+            Returns:
+                list[Rect]: Pusta lista, ponieważ zawartość sceny nie zmienia się między klatkami.
          """
         overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
         overlay.set_alpha(128)
         overlay.fill(Colors.DARK_GRAY.value)
         screen.blit(overlay, (0, 0))
 
-        title_font = FontManager.get_font("Boldins")
-        title = title_font.render("PAUSED", True, Colors.WHITE.value)
+        title_font = FontManager.get("Boldins")
+        title = render_text(title_font, "PAUSED", True, Colors.WHITE.value)
         title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 200))
         screen.blit(title, title_rect)
 
         for button in self.buttons:
-            button.draw(screen) 
\ No newline at end of file
+            button.draw(screen)
+        return []
@@ -1,19 +1,25 @@
 import pygame
 from src.settings import Colors, SCREEN_WIDTH, SCREEN_HEIGHT
-from src.scenes.base_scene import BaseScene
+from src.scenes.base_scene import BaseScene, PopScene
 from src.ui.button import Button
 from src.managers.font_manager import FontManager
 from src.managers.save_manager import SaveManager
+from src.utils.text_cache import render_text
 
 class SaveMenuScene(BaseScene):
     """
     Scena menu zapisu gry, umożliwiająca użytkownikowi zapisanie aktualnego stanu gry lub powrót do rozgrywki.
+    Jest nakładką rysowaną nad wstrzymaną sceną gry.
 
     Atrybuty:
         game_scene (GameScene): Obiekt sceny gry, której stan ma zostać zapisany.
         save_manager (SaveManager): Menedżer odpowiedzialny za zapisywanie stanu gry.
         buttons (list[Button]): Lista przycisków dostępnych w menu zapisu.
+        show_success (bool): Flaga wskazująca, czy wyświetlić komunikat o udanym zapisie.
     """
+
+    is_overlay = True
+
     def __init__(self, game_scene):
         """
             Inicjalizuje scenę menu zapisu gry, ustawiając przyciski oraz odniesienie do sceny gry.
@@ -23,18 +29,25 @@ class SaveMenuScene(BaseScene):
         """
         self.game_scene = game_scene
         self.save_manager = SaveManager()
+        self.show_success = False
         button_width, button_height = 200, 50
         button_x = SCREEN_WIDTH // 2 - button_width // 2
         
         self.buttons = [
             Button(button_x, SCREEN_HEIGHT // 2 - 50, button_width, button_height,
-                  "Save Game", font=FontManager.get_font("Boldins"),
+                  "Save Game", font=FontManager.get("Boldins"),
                   color=Colors.BUTTON_PINK.value),
             Button(button_x, SCREEN_HEIGHT // 2 + 50, button_width, button_height,
-                  "Back to Game", font=FontManager.get_font("Boldins"),
+                  "Back to Game", font=FontManager.get("Boldins"),
                   color=Colors.BUTTON_PINK.value)
         ]
 
+    def on_enter(self):
+        """
+            Ukrywa komunikat o zapisie z poprzedniej wizyty w menu.
+        """
+        self.show_success = False
+
     def handle_events(self, events):
         """
             Obsługuje zdarzenia użytkownika, takie jak kliknięcia myszą oraz naciśnięcia klawiszy.
@@ -43,7 +56,7 @@ class SaveMenuScene(BaseScene):
                 events (list[Event]): Lista zdarzeń do obsłużenia.
 
             Returns:
-                Scene: Nowa scena, jeśli użytkownik wybrał opcję z menu zapisu, w przeciwnym razie `None`.
+                PopScene: Powrót do gry, jeśli użytkownik go wybrał, w przeciwnym razie `None`.
          """
 
         for event in events:
@@ -54,11 +67,11 @@ class SaveMenuScene(BaseScene):
                         if button.label == "Save Game":
                             self._save_current_game()
                         elif button.label == "Back to Game":
-                            return self.game_scene
+                            return PopScene()
             
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
-                    return self.game_scene
+                    return PopScene()
 
     def _save_current_game(self):
         success = self.save_manager.save_game(
@@ -75,21 +88,25 @@ class SaveMenuScene(BaseScene):
 
             Args:
                 screen (Surface): Powierzchnia ekranu, na której scena ma być narysowana.
+
+            Returns:
+                list[Rect]: Obszar komunikatu o zapisie, jeśli jest wyświetlany, w przeciwnym razie pusta lista.
         """
         overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
         overlay.set_alpha(128)
         overlay.fill(Colors.DARK_GRAY.value)
         screen.blit(overlay, (0, 0))
 
-        title_font = FontManager.get_font("Boldins")
-        title = title_font.render("SAVE GAME", True, Colors.WHITE.value)
+        title_font = FontManager.get("Boldins")
+        title = render_text(title_font, "SAVE GAME", True, Colors.WHITE.value)
         title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 150))
         screen.blit(title, title_rect)
 
         for button in self.buttons:
             button.draw(screen)
 
-        if hasattr(self, 'show_success') and self.show_success:
-            success_text = title_font.render("Game Saved Successfully!", True, Colors.GREEN.value)
+        if self.show_success:
+            success_text = render_text(title_font, "Game Saved Successfully!", True, Colors.GREEN.value)
             success_rect = success_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 150))
-            screen.blit(success_text, success_rect) 
\ No newline at end of file
+            return [screen.blit(success_text, success_rect)]
+        return []
@@ -0,0 +1,93 @@
+import pygame
+from src.settings import SCENE_CACHE_MAX_BYTES
+from src.utils.lru_cache import LRUCache
+
+
+def scene_bytes(scene):
+    """
+        Szacuje pamięć zajmowaną przez powierzchnie, do których odwołuje się scena, np. obrazy przycisków i postaci.
+
+        Args:
+            scene (Scene): Scena.
+
+        Returns:
+            int: Przybliżony rozmiar pikseli w bajtach.
+    """
+    seen = set()
+    pending = [(value, 0) for value in vars(scene).values()]
+    total = 0
+    while pending:
+        value, depth = pending.pop()
+        if id(value) in seen:
+            continue
+        seen.add(id(value))
+        if isinstance(value, pygame.Surface):
+            total += value.get_width() * value.get_height() * value.get_bytesize()
+        elif isinstance(value, (list, tuple)):
+            pending.extend((item, depth) for item in value)
+        elif isinstance(value, dict):
+            pending.extend((item, depth) for item in value.values())
+        elif depth < 2 and hasattr(value, "__dict__") and not isinstance(value, type):
+            pending.extend((item, depth + 1) for item in vars(value).values())
+    return total
+
+
+class SceneRegistry:
+    """
+    Rejestr scen wielokrotnego użytku, dzięki któremu przechodzenie między menu nie tworzy nowych obiektów.
+
+    Sceny są kluczowane klasą i argumentami konstruktora, a najdawniej używane są usuwane po przekroczeniu limitu
+    `SCENE_CACHE_MAX_BYTES` szacowanego przez `scene_bytes`. Scena usunięta z rejestru, która jest jeszcze na stosie
+    scen, działa dalej - przy kolejnym użyciu zostanie po prostu utworzona od nowa. Przy usunięciu z rejestru
+    wywoływana jest metoda `on_discard` sceny, więc sceny mogą zatrzymywać zasoby (np. obrazy) przez cały czas pobytu
+    w rejestrze, a nie pobierać ich przy każdym wejściu.
+
+    Atrybuty:
+        _scenes (LRUCache): Sceny według klucza `(klasa, argumenty)`.
+    """
+
+    _scenes = LRUCache(
+        max_bytes=SCENE_CACHE_MAX_BYTES, size_of=scene_bytes, on_remove=lambda scene: scene.on_discard()
+    )
+
+    @staticmethod
+    def get(scene_class, *args):
+        """
+            Zwraca zapamiętaną scenę lub tworzy ją i zapamiętuje.
+
+            Args:
+                scene_class (type): Klasa sceny.
+                *args: Hashowalne argumenty konstruktora sceny, będące częścią klucza.
+
+            Returns:
+                Scene: Scena klasy `scene_class`.
+        """
+        return SceneRegistry._scenes.get_or_create((scene_class, args), lambda: scene_class(*args))
+
+    @staticmethod
+    def evict(scene_class, *args):
+        """
+            Usuwa scenę z rejestru, np. gdy obiekt przekazany jej w argumentach przestaje być używany.
+
+            Args:
+                scene_class (type): Klasa sceny.
+                *args: Argumenty konstruktora sceny.
+        """
+        SceneRegistry._scenes.pop((scene_class, args))
+
+    @staticmethod
+    def clear():
+        """
+            Usuwa wszystkie sceny z rejestru.
+        """
+        SceneRegistry._scenes.clear()
+
+    @staticmethod
+    def stats():
+        """
+            Zwraca statystyki rejestru scen.
+
+            Returns:
+                dict: Statystyki pamięci podręcznej `LRUCache`.
+        """
+        return SceneRegistry._scenes.stats()
@@ -5,6 +5,8 @@ Stałe:
     SCREEN_WIDTH (int): Szerokość ekranu gry.
     SCREEN_HEIGHT (int): Wysokość ekranu gry.
     FPS (int): Liczba klatek na sekundę.
+    SIM_STEP_MS (float): Stały krok symulacji w milisekundach.
+    MAX_SIM_STEPS (int): Maksymalna liczba kroków symulacji wykonywanych w jednej klatce.
     FOOD_COOLDOWN_DURATION (int): Czas odnowienia karmienia w milisekundach.
     AGE_INTERVAL (int): Interwał czasu zwiększania wieku w milisekundach.
     CUPCAKE_SPAWN_DELAY (int): Opóźnienie pojawienia się babeczki w milisekundach.
@@ -16,6 +18,22 @@ Stałe:
     SPEED_TIMER (int): Licznik czasu dla prędkości.
     SPEED_INTERVAL (int): Interwał czasu zwiększania prędkości w milisekundach.
     SPEED_INCREMENT (int): Wartość zwiększenia prędkości.
+    SCALED_CACHE_MAX_BYTES (int): Limit pamięci podręcznej przeskalowanych powierzchni w bajtach.
+    DIRTY_RECT_RENDERING (bool): Czy odświeżać tylko zmienione obszary ekranu zamiast całego ekranu.
+    TEXT_CACHE_MAX_ENTRIES (int): Maksymalna liczba napisów w pamięci podręcznej wyrenderowanego tekstu.
+    ASSET_LOADER_WORKERS (int): Liczba wątków wczytujących zasoby w tle.
+    BAKED_ASSET_CACHE (bool): Czy zapisywać przeskalowane obrazy na dysku i wczytywać je bez dekodowania.
+    BAKED_CACHE_DIR (str): Katalog z wypieczonymi obrazami.
+    SOUND_BANK_MAX_BYTES (int): Limit pamięci zdekodowanych efektów dźwiękowych w bajtach.
+    SOUND_CHANNELS (int): Liczba kanałów miksera zarezerwowanych dla banku dźwięków.
+    MAX_DROPPED_AUDIO_BYTES (int): Maksymalny rozmiar przeciągniętego pliku audio w bajtach.
+    CUPCAKE_STORAGE (str): Magazyn babeczek: `"list"` (lista pozycji) lub `"pool"` (tablice NumPy).
+    CUPCAKE_STORM (bool): Flaga włączająca bezkońcowy tryb "cupcake storm" z tysiącami babeczek.
+    STORM_SPAWN_DELAY (float): Opóźnienie pojawienia się babeczki w trybie "cupcake storm" w milisekundach.
+    IDLE_MAX_WAIT (int): Maksymalny czas w milisekundach, przez który pętla gry czeka na zdarzenia na statycznym ekranie.
+    BACKGROUND_FPS (int): Liczba klatek na sekundę, gdy okno gry nie jest aktywne.
+    SCENE_CACHE_MAX_BYTES (int): Limit pamięci scen przechowywanych do ponownego użycia w bajtach.
+    AUTOSAVE_INTERVAL (int): Odstęp między zapisami automatycznymi w milisekundach; `0` wyłącza zapis automatyczny.
 
 Enumy:
     Colors (Enum): Enum zawierający predefiniowane kolory używane w grze.
@@ -24,6 +42,8 @@ Enumy:
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
 FPS = 60
+SIM_STEP_MS = 1000 / 60
+MAX_SIM_STEPS = 5
 FOOD_COOLDOWN_DURATION = 90000
 AGE_INTERVAL = 60000
 CUPCAKE_SPAWN_DELAY = 3000
@@ -35,6 +55,22 @@ FALL_SPEED = 200
 SPEED_TIMER = 0
 SPEED_INTERVAL = 10000
 SPEED_INCREMENT = 50
+SCALED_CACHE_MAX_BYTES = 32 * 1024 * 1024
+DIRTY_RECT_RENDERING = False
+TEXT_CACHE_MAX_ENTRIES = 256
+ASSET_LOADER_WORKERS = 2
+BAKED_ASSET_CACHE = True
+BAKED_CACHE_DIR = ".cache/baked"
+SOUND_BANK_MAX_BYTES = 16 * 1024 * 1024
+SOUND_CHANNELS = 8
+MAX_DROPPED_AUDIO_BYTES = 64 * 1024 * 1024
+CUPCAKE_STORAGE = "list"
+CUPCAKE_STORM = False
+STORM_SPAWN_DELAY = 1
+IDLE_MAX_WAIT = 1000
+BACKGROUND_FPS = 5
+SCENE_CACHE_MAX_BYTES = 16 * 1024 * 1024
+AUTOSAVE_INTERVAL = 60000
 
 from enum import Enum
 class Colors(Enum):
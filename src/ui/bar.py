@@ -53,6 +53,9 @@ class Bar:
             Args:
                 screen (Surface): Powierzchnia ekranu, na której pasek ma być narysowany.
                 rounded (bool, optional): Określa, czy rogi paska mają być zaokrąglone. Domyślnie `False`.
+
+            Returns:
+                Rect: Obszar ekranu zajmowany przez pasek.
         """
         if rounded:
             pygame.draw.rect(screen, self.border_color, (self.x, self.y, self.width, self.height), border_radius=10, width=2)
@@ -63,4 +66,5 @@ class Bar:
         if rounded:
             pygame.draw.rect(screen, self.color, (self.x, self.y, fill_width, self.height), border_radius=10)
         else:
-            pygame.draw.rect(screen, self.color, (self.x, self.y, fill_width, self.height))
\ No newline at end of file
+            pygame.draw.rect(screen, self.color, (self.x, self.y, fill_width, self.height))
+        return pygame.Rect(self.x, self.y, self.width, self.height)
@@ -1,5 +1,7 @@
 import pygame
+from src.managers.font_manager import FontManager, DEFAULT_FONT
 from src.settings import Colors
+from src.utils.text_cache import render_text
 
 class Button:
     """
@@ -8,7 +10,9 @@ class Button:
     Atrybuty:
         rect (Rect): Prostokąt określający pozycję i rozmiar przycisku.
         label (str): Tekst wyświetlany na przycisku.
-        font (Font): Czcionka używana do renderowania tekstu na przycisku.
+        font (Font): Czcionka używana do renderowania tekstu na przycisku; domyślna czcionka w rozmiarze `font_size`
+            jest pobierana z `FontManager` dopiero przy pierwszym użyciu.
+        font_size (int): Rozmiar domyślnej czcionki, używany, gdy nie podano czcionki.
         text_surface (Surface): Powierzchnia zawierająca wyrenderowany tekst przycisku.
         bg_color (tuple[int, int, int]): Kolor tła przycisku.
         x (int): Pozycja X przycisku na ekranie.
@@ -35,13 +39,23 @@ class Button:
         """
         self.rect = pygame.Rect(x, y, width, height)
         self.label = label
-        self.font = font or pygame.font.SysFont(None, font_size)
-        self.text_surface = self.font.render(label, True, Colors.WHITE.value)
+        self._font = font
+        self.font_size = font_size
         self.bg_color = color
         self.x = x
         self.y = y
         self.enabled = True
 
+    @property
+    def font(self):
+        if self._font is None:
+            self._font = FontManager.get(DEFAULT_FONT, self.font_size)
+        return self._font
+
+    @property
+    def text_surface(self):
+        return render_text(self.font, self.label, True, Colors.WHITE.value)
+
     def set_enabled(self, enabled):
         """
             Ustawia stan aktywności przycisku.
@@ -57,19 +71,23 @@ class Button:
 
             Args:
                 screen (Surface): Powierzchnia ekranu, na której przycisk ma być narysowany.
+
+            Returns:
+                Rect: Obszar ekranu zajmowany przez przycisk.
          """
         bg_color = self.bg_color if self.enabled else (100, 100, 100)
         text_color = Colors.WHITE.value if self.enabled else (180, 180, 180)
 
-        pygame.draw.rect(screen, bg_color, self.rect, border_radius=10)
-        text_surface = self.font.render(self.label, True, text_color)
-        screen.blit(
+        button_rect = pygame.draw.rect(screen, bg_color, self.rect, border_radius=10)
+        text_surface = render_text(self.font, self.label, True, text_color)
+        text_rect = screen.blit(
             text_surface,
             (
                 self.rect.centerx - text_surface.get_width() // 2,
                 self.rect.centery - text_surface.get_height() // 2
             )
         )
+        return button_rect.union(text_rect)
 
     def is_clicked(self, mouse_pos):
         """
@@ -0,0 +1,40 @@
+class DirtyRectTracker:
+    """
+    Zbiera prostokąty narysowane w bieżącej klatce i wyznacza obszary ekranu wymagające odświeżenia.
+
+    Obszary z poprzedniej klatki są dołączane do wyniku, aby elementy, które się przesunęły lub zniknęły, zostały zamazane.
+
+    Atrybuty:
+        _previous (list[Rect]): Prostokąty narysowane w poprzedniej klatce.
+        _current (list[Rect]): Prostokąty narysowane w bieżącej klatce.
+    """
+    def __init__(self):
+        self._previous = []
+        self._current = []
+
+    def add(self, rect):
+        """
+            Rejestruje narysowany prostokąt lub listę prostokątów.
+
+            Args:
+                rect (Rect | list[Rect] | None): Obszar zmieniony w bieżącej klatce. Wartość `None` jest pomijana.
+        """
+        if rect is None:
+            return
+        if isinstance(rect, list):
+            for item in rect:
+                self.add(item)
+        else:
+            self._current.append(rect)
+
+    def flush(self):
+        """
+            Kończy klatkę i zwraca obszary do odświeżenia.
+
+            Returns:
+                list[Rect]: Prostokąty z poprzedniej i bieżącej klatki.
+        """
+        dirty = self._previous + self._current
+        self._previous = self._current
+        self._current = []
+        return dirty
@@ -1,6 +1,7 @@
 from src.settings import Colors, SCREEN_WIDTH, SCREEN_HEIGHT
 from src.ui.bar import Bar
 from src.ui.button import Button
+from src.utils.text_cache import render_text
 
 
 def get_bar_positions():
@@ -65,14 +66,18 @@ class GameUI:
 
             Args:
                 screen (Surface): Powierzchnia ekranu, na której paski mają być narysowane.
+
+            Returns:
+                list[Rect]: Obszary ekranu zajmowane przez paski i ich etykiety.
         """
-        hunger_label = self.font.render("Hunger", True, Colors.TEXT_COLOR.value)
-        screen.blit(hunger_label, (self.hunger_bar.x - 90, self.hunger_bar.y + 2))
-        self.hunger_bar.draw(screen, rounded=True)
+        hunger_label = render_text(self.font, "Hunger", True, Colors.TEXT_COLOR.value)
+        rects = [screen.blit(hunger_label, (self.hunger_bar.x - 90, self.hunger_bar.y + 2))]
+        rects.append(self.hunger_bar.draw(screen, rounded=True))
 
-        boredom_label = self.font.render("Boredom", True, Colors.TEXT_COLOR.value)
-        screen.blit(boredom_label, (self.boredom_bar.x - 90, self.boredom_bar.y + 2))
-        self.boredom_bar.draw(screen, rounded=True)
+        boredom_label = render_text(self.font, "Boredom", True, Colors.TEXT_COLOR.value)
+        rects.append(screen.blit(boredom_label, (self.boredom_bar.x - 90, self.boredom_bar.y + 2)))
+        rects.append(self.boredom_bar.draw(screen, rounded=True))
+        return rects
 
     def draw_animal_info(self, screen, animal_name, animal_age, position):
         """
@@ -83,15 +88,32 @@ class GameUI:
                 animal_name (str): Imię zwierzęcia.
                 animal_age (int): Wiek zwierzęcia.
                 position (Rect): Pozycja zwierzęcia na ekranie.
+
+            Returns:
+                list[Rect]: Obszary ekranu zajmowane przez imię i wiek zwierzęcia.
         """
-        name_label = self.font.render(animal_name, True, Colors.TEXT_COLOR.value)
+        name_label = render_text(self.font, animal_name, True, Colors.TEXT_COLOR.value)
         asset_x = position.centerx - name_label.get_width() // 2
         asset_y = position.bottom + 50
-        screen.blit(name_label, (asset_x, asset_y))
+        name_rect = screen.blit(name_label, (asset_x, asset_y))
 
-        age_label = self.font.render(f"Age: {animal_age}", True, Colors.TEXT_COLOR.value)
+        age_label = render_text(self.font, f"Age: {animal_age}", True, Colors.TEXT_COLOR.value)
         age_rect = age_label.get_rect(center=(SCREEN_WIDTH // 2, 10))
-        screen.blit(age_label, age_rect)
+        return [name_rect, screen.blit(age_label, age_rect)]
+
+    def draw_loading_label(self, screen, position):
+        """
+            Rysuje pod imieniem zwierzęcia napis informujący o wczytywaniu pliku audio.
+
+            Args:
+                screen (Surface): Powierzchnia ekranu, na której napis ma być narysowany.
+                position (Rect): Pozycja zwierzęcia na ekranie.
+
+            Returns:
+                Rect: Obszar ekranu zajmowany przez napis.
+        """
+        label = render_text(self.font, "Loading...", True, Colors.TEXT_COLOR.value)
+        return screen.blit(label, label.get_rect(midtop=(position.centerx, position.bottom + 75)))
 
     def draw_timer_and_status(self, screen, game_logic, feed_cooldown):
         """
@@ -101,41 +123,46 @@ class GameUI:
                 screen (Surface): Powierzchnia ekranu, na której licznik i status mają być narysowane.
                 game_logic (GameLogic): Logika gry, zawierająca informacje o trybie gry.
                 feed_cooldown (int): Czas pozostały do możliwości karmienia.
+
+            Returns:
+                list[Rect]: Obszary ekranu zajmowane przez narysowane napisy.
         """
+        rects = []
         y_offset = 20
 
         if game_logic.launch_mode:
             seconds_left = max(0, int(game_logic.playtime_remaining / 1000))
             timer_text = f"Time Left: {seconds_left}s"
-            y_offset = self._draw_status_text(screen, timer_text, Colors.TEXT_COLOR.value, y_offset)
+            y_offset = self._draw_status_text(screen, rects, timer_text, Colors.TEXT_COLOR.value, y_offset)
 
             status_text = "Playtime mode: ON"
             status_color = Colors.GREEN.value
-            y_offset = self._draw_status_text(screen, status_text, status_color, y_offset + 5)
+            y_offset = self._draw_status_text(screen, rects, status_text, status_color, y_offset + 5)
 
         elif game_logic.in_cooldown:
             cooldown_seconds = max(0, int(game_logic.cooldown_timer / 1000) + 1)
             cooldown_text = f"Cooldown: {cooldown_seconds}s"
-            y_offset = self._draw_status_text(screen, cooldown_text, Colors.RED.value, y_offset)
+            y_offset = self._draw_status_text(screen, rects, cooldown_text, Colors.RED.value, y_offset)
 
             status_text = "Playtime mode: OFF"
             status_color = Colors.RED.value
-            y_offset = self._draw_status_text(screen, status_text, status_color, y_offset + 5)
+            y_offset = self._draw_status_text(screen, rects, status_text, status_color, y_offset + 5)
 
         else:
             status_text = "Playtime Mode: OFF"
             status_color = Colors.RED.value
-            y_offset = self._draw_status_text(screen, status_text, status_color, y_offset)
+            y_offset = self._draw_status_text(screen, rects, status_text, status_color, y_offset)
 
         if feed_cooldown > 0:
             seconds_left = max(0, int(feed_cooldown / 1000) + 1)
             feed_cooldown_text = f"Feed Cooldown: {seconds_left}s"
-            self._draw_status_text(screen, feed_cooldown_text, Colors.RED.value, y_offset + 10)
+            self._draw_status_text(screen, rects, feed_cooldown_text, Colors.RED.value, y_offset + 10)
+        return rects
 
-    def _draw_status_text(self, screen, text, color, y_offset):
-        surface = self.font.render(text, True, color)
+    def _draw_status_text(self, screen, rects, text, color, y_offset):
+        surface = render_text(self.font, text, True, color)
         rect = surface.get_rect(topright=(SCREEN_WIDTH - 20, y_offset))
-        screen.blit(surface, rect)
+        rects.append(screen.blit(surface, rect))
         return rect.bottom
 
     def draw_food_info(self, screen, remaining_food):
@@ -145,12 +172,16 @@ class GameUI:
             Args:
                 screen (Surface): Powierzchnia ekranu, na której informacje mają być narysowane.
                 remaining_food (int): Ilość pozostałego jedzenia.
+
+            Returns:
+                Rect | None: Obszar ekranu zajmowany przez napis lub `None`, jeśli nic nie narysowano.
         """
         if remaining_food is not None:
             text = f"Food left: {remaining_food}"
-            label_surface = self.font.render(text, True, Colors.TEXT_COLOR.value)
+            label_surface = render_text(self.font, text, True, Colors.TEXT_COLOR.value)
             label_rect = label_surface.get_rect(center=(self.feed_button.rect.centerx, self.feed_button.rect.top-20))
-            screen.blit(label_surface, label_rect)
+            return screen.blit(label_surface, label_rect)
+        return None
 
     def update_button_states(self, game_logic, feed_cooldown):
         """
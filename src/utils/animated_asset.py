@@ -1,5 +1,86 @@
 import os
-import pygame
+import re
+from bisect import bisect_right
+from src.managers.asset_manager import convert_surface, load_image
+from src.utils.sprite_atlas import load_atlas
+from src.utils.surface_cache import scaled_surface_cache
+
+FRAME_DELAY_PATTERN = re.compile(r"delay-(\d+(?:\.\d+)?)s")
+DEFAULT_FRAME_DELAY = 60
+
+
+def parse_frame_delay(filename, default_delay):
+    """
+        Odczytuje czas trwania klatki z nazwy pliku, np. `frame_00_delay-0.45s.png`.
+
+        Args:
+            filename (str): Nazwa pliku klatki.
+            default_delay (float): Czas trwania w milisekundach, jeśli nazwa pliku go nie zawiera.
+
+        Returns:
+            float: Czas trwania klatki w milisekundach.
+    """
+    match = FRAME_DELAY_PATTERN.search(filename)
+    if match:
+        delay = float(match.group(1)) * 1000
+        if delay > 0:
+            return delay
+    return default_delay
+
+
+def load_animation(folder, size, convert="alpha"):
+    """
+        Wczytuje klatki animacji z atlasu, jeśli został zbudowany, a w przeciwnym razie z osobnych plików w folderze.
+
+        Funkcja może być wywoływana w wątku roboczym z `convert=None`; konwersję wykonuje się wtedy
+        w wątku głównym przez `convert_animation`.
+
+        Args:
+            folder (str): Ścieżka do folderu zawierającego pliki klatek animacji.
+            size (tuple[int, int]): Rozmiar każdej klatki animacji (szerokość, wysokość).
+            convert (str, optional): Tryb konwersji klatek: `"alpha"`, `"opaque"` lub `None`. Domyślnie `"alpha"`.
+
+        Returns:
+            tuple[Surface | None, list[Surface], list[float]]: Obraz atlasu (lub `None`), klatki oraz ich czasy trwania w milisekundach.
+    """
+    atlas = load_atlas(folder, size)
+    if atlas is not None:
+        atlas_image, frames, frame_files = atlas
+        delays = [parse_frame_delay(f, DEFAULT_FRAME_DELAY) for f in frame_files]
+        return convert_animation((atlas_image, frames, delays), convert)
+
+    frames = []
+    delays = []
+    try:
+        frame_files = sorted([f for f in os.listdir(folder) if f.endswith('.png')])
+        for frame_file in frame_files:
+            frames.append(load_image(os.path.join(folder, frame_file), size, convert))
+            delays.append(parse_frame_delay(frame_file, DEFAULT_FRAME_DELAY))
+    except Exception as e:
+        print(f"Error loading animation frames: {e}")
+    return None, frames, delays
+
+
+def convert_animation(animation, convert="alpha"):
+    """
+        Konwertuje wczytaną animację do formatu ekranu, zachowując klatki jako podpowierzchnie atlasu.
+
+        Args:
+            animation (tuple): Wynik funkcji `load_animation`.
+            convert (str, optional): Tryb konwersji: `"alpha"`, `"opaque"` lub `None`. Domyślnie `"alpha"`.
+
+        Returns:
+            tuple[Surface | None, list[Surface], list[float]]: Skonwertowana animacja.
+    """
+    atlas, frames, delays = animation
+    if atlas is None:
+        return None, [convert_surface(frame, convert) for frame in frames], delays
+    converted = convert_surface(atlas, convert)
+    if converted is atlas:
+        return animation
+    frames = [converted.subsurface((frame.get_offset(), frame.get_size())) for frame in frames]
+    return converted, frames, delays
+
 
 class AnimatedAsset:
     """
@@ -10,11 +91,13 @@ class AnimatedAsset:
         size (tuple[int, int]): Rozmiar każdej klatki animacji (szerokość, wysokość).
         pos (tuple[int, int]): Pozycja zasobu na ekranie (X, Y).
         frames (list[Surface]): Lista klatek animacji.
+        atlas (Surface, optional): Wspólny obraz atlasu, jeśli klatki są jego podpowierzchniami. Domyślnie `None`.
         current_frame (int): Indeks aktualnie wyświetlanej klatki animacji.
-        animation_speed (int): Prędkość animacji w milisekundach.
-        animation_timer (int): Licznik czasu animacji.
+        frame_delays (list[float]): Czas trwania każdej klatki w milisekundach.
+        frame_end_times (list[float]): Skumulowane czasy końca kolejnych klatek w milisekundach.
+        elapsed_time (float): Czas, który upłynął od początku bieżącego cyklu animacji.
     """
-    def __init__(self, folder, size, pos):
+    def __init__(self, folder, size, pos, animation=None):
         """
             Inicjalizuje animacje.
 
@@ -22,45 +105,46 @@ class AnimatedAsset:
                 folder (str): Ścieżka do folderu zawierającego pliki klatek animacji.
                 size (tuple[int, int]): Rozmiar każdej klatki animacji (szerokość, wysokość).
                 pos (tuple[int, int]): Pozycja zasobu na ekranie (X, Y).
+                animation (tuple, optional): Animacja wczytana wcześniej przez `load_animation`, np. w tle.
+                    Domyślnie `None`, co oznacza wczytanie klatek z dysku.
         """
         self.folder = folder
         self.size = size
         self.pos = pos
-        self.frames = []
         self.current_frame = 0
-        self.animation_speed = 60
-        self.animation_timer = 0
-        self._load_frames()
+        self.frame_end_times = []
+        self.elapsed_time = 0
+        if animation is None:
+            animation = load_animation(folder, size)
+        else:
+            animation = convert_animation(animation)
+        self.atlas, self.frames, self.frame_delays = animation
+        self._build_timeline()
 
-    def _load_frames(self):
+    def _build_timeline(self):
         """
-            Ładuje klatki animacji z folderu.
-
-            Raises:
-                Exception: W przypadku błędu podczas ładowania klatek animacji.
-            """
-        try:
-            frame_files = sorted([f for f in os.listdir(self.folder) if f.endswith('.png')])
-            for frame_file in frame_files:
-                frame_path = os.path.join(self.folder, frame_file)
-                frame = pygame.image.load(frame_path).convert_alpha()
-                frame = pygame.transform.scale(frame, self.size)
-                self.frames.append(frame)
-        except Exception as e:
-            print(f"Error loading animation frames: {e}")
+            Wyznacza skumulowane czasy końca klatek, używane do wyszukiwania binarnego bieżącej klatki.
+        """
+        self.frame_delays = self.frame_delays[:len(self.frames)]
+        self.frame_end_times = []
+        total = 0
+        for delay in self.frame_delays:
+            total += delay
+            self.frame_end_times.append(total)
 
     def update(self, dt):
         """
             Aktualizuje stan animacji na podstawie upływu czasu.
 
+            Bieżąca klatka jest wyznaczana z całkowitego czasu animacji, więc nierówne lub duże wartości `dt`
+            nie spowalniają ani nie przyspieszają odtwarzania.
+
             Args:
                 dt (int): Czas, który upłynął od ostatniej aktualizacji w milisekundach.
             """
         if len(self.frames) > 1:
-            self.animation_timer += dt
-            if self.animation_timer >= self.animation_speed:
-                self.animation_timer = 0
-                self.current_frame = (self.current_frame + 1) % len(self.frames)
+            self.elapsed_time = (self.elapsed_time + dt) % self.frame_end_times[-1]
+            self.current_frame = min(bisect_right(self.frame_end_times, self.elapsed_time), len(self.frames) - 1)
 
     def draw(self, screen):
         """
@@ -68,9 +152,13 @@ class AnimatedAsset:
 
             Args:
                 screen (Surface): Powierzchnia ekranu, na której klatka ma być narysowana.
+
+            Returns:
+                Rect | None: Obszar ekranu zajmowany przez klatkę lub `None`, jeśli brak klatek.
         """
         if self.frames:
-            screen.blit(self.frames[self.current_frame], self.pos)
+            return screen.blit(self.frames[self.current_frame], self.pos)
+        return None
 
     def draw_scaled(self, screen, scale_factor):
         """
@@ -79,15 +167,16 @@ class AnimatedAsset:
             Args:
                 screen (Surface): Powierzchnia ekranu, na której klatka ma być narysowana.
                 scale_factor (float): Współczynnik skalowania klatki.
+
+            Returns:
+                Rect | None: Obszar ekranu zajmowany przez klatkę lub `None`, jeśli brak klatek.
         """
         if not self.frames:
-            return
+            return None
 
         frame = self.frames[self.current_frame]
-        w, h = frame.get_size()
-        new_size = (int(w * scale_factor), int(h * scale_factor))
-        scaled_frame = pygame.transform.scale(frame, new_size)
+        scaled_frame = scaled_surface_cache.get_scaled(frame, scale_factor, self.current_frame)
 
         rect = scaled_frame.get_rect()
         rect.topleft = self.pos
-        screen.blit(scaled_frame, rect)
+        return screen.blit(scaled_frame, rect)
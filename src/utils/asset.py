@@ -1,4 +1,5 @@
-import pygame
+from src.managers.asset_manager import AssetManager
+from src.managers.font_manager import FontManager, DEFAULT_FONT
 
 class Asset:
     """
@@ -36,18 +37,23 @@ class Asset:
         self.font_size = font_size
         self.font_color = font_color
 
-        self.image = pygame.image.load(path)
-        self.image = pygame.transform.scale(self.image, size)
+        self.image = AssetManager.acquire(path, size)
 
         self.label_surface = None
         self.label_position = None
 
+    def release(self):
+        """
+           Zwalnia odwołanie do współdzielonego obrazu zasobu w menedżerze zasobów.
+        """
+        AssetManager.release(self.path, self.size)
+
     def initialize_label(self):
         """
            Inicjalizuje etykietę tekstową dla zasobu, jeśli nie została wcześniej utworzona.
         """
         if self.label and not self.label_surface:
-            font = pygame.font.SysFont(None, self.font_size)
+            font = FontManager.get(DEFAULT_FONT, self.font_size)
             self.label_surface = font.render(self.label, True, self.font_color)
             self.label_position = (
                 self.position[0] + self.image.get_width() // 2 - self.label_surface.get_width() // 2,
@@ -60,8 +66,12 @@ class Asset:
 
             Args:
                 screen (Surface): Powierzchnia ekranu, na której zasób ma być narysowany.
+
+            Returns:
+                Rect: Obszar ekranu zajmowany przez zasób wraz z etykietą.
         """
-        screen.blit(self.image, self.position)
+        rect = screen.blit(self.image, self.position)
         if self.label:
             self.initialize_label()
-            screen.blit(self.label_surface, self.label_position)
+            rect = rect.union(screen.blit(self.label_surface, self.label_position))
+        return rect
@@ -0,0 +1,111 @@
+import hashlib
+import mmap
+import os
+import struct
+import threading
+import pygame
+from src.settings import BAKED_CACHE_DIR
+
+BAKED_MAGIC = b"BAKE"
+BAKED_VERSION = 1
+BAKED_FORMAT = "RGBA"
+HEADER = struct.Struct("<4sH4sIIqq")
+
+
+def baked_path(path, size):
+    """
+        Zwraca ścieżkę pliku w katalogu wypieczonych zasobów dla danego obrazu i rozmiaru.
+
+        Args:
+            path (str): Ścieżka do źródłowego pliku graficznego.
+            size (tuple[int, int] | None): Docelowy rozmiar obrazu lub `None` dla rozmiaru oryginalnego.
+
+        Returns:
+            str: Ścieżka do pliku z surowymi pikselami.
+    """
+    key = f"{os.path.normpath(path)}|{size}".encode("utf-8")
+    return os.path.join(BAKED_CACHE_DIR, hashlib.sha1(key).hexdigest() + ".bin")
+
+
+def load_baked(path, size):
+    """
+        Wczytuje wypieczony obraz przez mapowanie pliku w pamięć, bez dekodowania i skalowania.
+
+        Wpis jest ignorowany, jeśli czas modyfikacji lub rozmiar pliku źródłowego nie zgadza się z nagłówkiem.
+
+        Args:
+            path (str): Ścieżka do źródłowego pliku graficznego.
+            size (tuple[int, int] | None): Docelowy rozmiar obrazu.
+
+        Returns:
+            Surface | None: Powierzchnia oparta na zmapowanym pliku lub `None`, jeśli wpis nie istnieje lub jest nieaktualny.
+    """
+    try:
+        source = os.stat(path)
+        with open(baked_path(path, size), 'rb') as f:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+    except (OSError, ValueError):
+        return None
+
+    if len(data) < HEADER.size:
+        return None
+    magic, version, fmt, width, height, mtime_ns, source_size = HEADER.unpack_from(data)
+    if (magic, version, fmt) != (BAKED_MAGIC, BAKED_VERSION, BAKED_FORMAT.encode("ascii")):
+        return None
+    if mtime_ns != source.st_mtime_ns or source_size != source.st_size:
+        return None
+    if len(data) != HEADER.size + width * height * 4:
+        return None
+    return pygame.image.frombuffer(memoryview(data)[HEADER.size:], (width, height), BAKED_FORMAT)
+
+
+def bake(path, size, surface):
+    """
+        Zapisuje piksele obrazu w katalogu wypieczonych zasobów razem z nagłówkiem opisującym plik źródłowy.
+
+        Błędy zapisu (np. brak uprawnień) są ignorowane, ponieważ pamięć podręczna jest tylko optymalizacją.
+
+        Args:
+            path (str): Ścieżka do źródłowego pliku graficznego.
+            size (tuple[int, int] | None): Docelowy rozmiar obrazu.
+            surface (Surface): Przeskalowana powierzchnia do zapisania.
+    """
+    target = baked_path(path, size)
+    temp = f"{target}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        source = os.stat(path)
+        width, height = surface.get_size()
+        header = HEADER.pack(BAKED_MAGIC, BAKED_VERSION, BAKED_FORMAT.encode("ascii"),
+                             width, height, source.st_mtime_ns, source.st_size)
+        os.makedirs(BAKED_CACHE_DIR, exist_ok=True)
+        with open(temp, 'wb') as f:
+            f.write(header)
+            f.write(pygame.image.tobytes(surface, BAKED_FORMAT))
+        os.replace(temp, target)
+    except OSError as e:
+        print(f"Error baking asset {path}: {e}")
+        if os.path.exists(temp):
+            os.remove(temp)
+
+
+def load_scaled_image(path, size=None):
+    """
+        Zwraca obraz w docelowym rozmiarze, korzystając z wypieczonej kopii, a w razie jej braku dekodując
+        plik źródłowy i wypiekając wynik na przyszłość.
+
+        Args:
+            path (str): Ścieżka do źródłowego pliku graficznego.
+            size (tuple[int, int], optional): Docelowy rozmiar obrazu. Domyślnie `None` (rozmiar oryginalny).
+
+        Returns:
+            Surface: Nieskonwertowana powierzchnia obrazu.
+    """
+    size = tuple(size) if size is not None else None
+    image = load_baked(path, size)
+    if image is not None:
+        return image
+    image = pygame.image.load(path)
+    if size is not None:
+        image = pygame.transform.scale(image, size)
+    bake(path, size, image)
+    return image
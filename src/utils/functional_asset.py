@@ -68,6 +68,10 @@ class FunctionalAsset(Asset):
 
             Args:
                 screen (Surface): Powierzchnia ekranu, na której zasób ma być narysowany.
+
+            Returns:
+                Rect: Obszar ekranu zajmowany przez zasób.
         """
         self.position = (self.rect.x, self.rect.y)
-        super().draw(screen)
+        return super().draw(screen)
+
@@ -0,0 +1,158 @@
+from collections import OrderedDict
+
+
+class LRUCache:
+    """
+    Pamięć podręczna z usuwaniem najdawniej używanych wpisów (LRU) i limitem pamięci.
+
+    Atrybuty:
+        max_entries (int, optional): Maksymalna liczba wpisów. `None` oznacza brak limitu.
+        max_bytes (int, optional): Maksymalny łączny rozmiar wpisów w bajtach. `None` oznacza brak limitu.
+        size_of (callable): Funkcja zwracająca rozmiar wartości w bajtach.
+        hits (int): Liczba trafień w pamięci podręcznej.
+        misses (int): Liczba chybień w pamięci podręcznej.
+        evictions (int): Liczba usuniętych wpisów.
+        current_bytes (int): Aktualny łączny rozmiar wpisów w bajtach.
+        on_remove (callable | None): Funkcja wywoływana z wartością każdego wpisu usuniętego z pamięci podręcznej.
+    """
+    def __init__(self, max_entries=None, max_bytes=None, size_of=None, on_remove=None):
+        """
+            Inicjalizuje pustą pamięć podręczną.
+
+            Args:
+                max_entries (int, optional): Maksymalna liczba wpisów. Domyślnie `None`.
+                max_bytes (int, optional): Maksymalny łączny rozmiar wpisów w bajtach. Domyślnie `None`.
+                size_of (callable, optional): Funkcja zwracająca rozmiar wartości w bajtach. Domyślnie każdy wpis ma rozmiar 0.
+                on_remove (callable, optional): Funkcja wywoływana z wartością wpisu usuniętego przez limit, `pop`,
+                    `clear` lub zastąpionego inną wartością, np. aby zwolnić zasoby wpisu. Domyślnie `None`.
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.size_of = size_of or (lambda value: 0)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.current_bytes = 0
+        self.on_remove = on_remove
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key, default=None):
+        """
+            Pobiera wartość z pamięci podręcznej i oznacza ją jako ostatnio używaną.
+
+            Args:
+                key (Hashable): Klucz wpisu.
+                default (Any, optional): Wartość zwracana przy chybieniu. Domyślnie `None`.
+
+            Returns:
+                Any: Zapisana wartość lub `default`, jeśli wpisu nie ma.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def put(self, key, value):
+        """
+            Zapisuje wartość w pamięci podręcznej, usuwając najstarsze wpisy po przekroczeniu limitów.
+
+            Args:
+                key (Hashable): Klucz wpisu.
+                value (Any): Wartość do zapisania.
+        """
+        if key in self._entries:
+            old_value, old_size = self._entries.pop(key)
+            self.current_bytes -= old_size
+            if old_value is not value:
+                self._removed(old_value)
+        size = self.size_of(value)
+        self._entries[key] = (value, size)
+        self.current_bytes += size
+        self._evict()
+
+    def get_or_create(self, key, factory):
+        """
+            Pobiera wartość z pamięci podręcznej lub tworzy ją za pomocą `factory` i zapisuje.
+
+            Args:
+                key (Hashable): Klucz wpisu.
+                factory (callable): Funkcja bez argumentów tworząca wartość przy chybieniu.
+
+            Returns:
+                Any: Zapisana lub nowo utworzona wartość.
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+        self.misses += 1
+        value = factory()
+        self.put(key, value)
+        return value
+
+    def pop(self, key, default=None):
+        """
+            Usuwa wpis z pamięci podręcznej.
+
+            Args:
+                key (Hashable): Klucz wpisu.
+                default (Any, optional): Wartość zwracana, jeśli wpisu nie ma. Domyślnie `None`.
+
+            Returns:
+                Any: Usunięta wartość lub `default`.
+        """
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return default
+        self.current_bytes -= entry[1]
+        self._removed(entry[0])
+        return entry[0]
+
+    def clear(self):
+        """
+            Usuwa wszystkie wpisy. Liczniki trafień i chybień pozostają bez zmian.
+        """
+        values = [value for value, _ in self._entries.values()]
+        self._entries.clear()
+        self.current_bytes = 0
+        for value in values:
+            self._removed(value)
+
+    def stats(self):
+        """
+            Zwraca statystyki pamięci podręcznej.
+
+            Returns:
+                dict: Liczba wpisów, rozmiar w bajtach oraz liczniki trafień, chybień i usunięć.
+        """
+        return {
+            "entries": len(self._entries),
+            "bytes": self.current_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def _evict(self):
+        while self._entries and (
+            (self.max_entries is not None and len(self._entries) > self.max_entries)
+            or (self.max_bytes is not None and self.current_bytes > self.max_bytes)
+        ):
+            _, (value, size) = self._entries.popitem(last=False)
+            self.current_bytes -= size
+            self.evictions += 1
+            self._removed(value)
+
+    def _removed(self, value):
+        if self.on_remove is not None:
+            self.on_remove(value)
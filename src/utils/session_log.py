@@ -0,0 +1,273 @@
+import hashlib
+import struct
+import pygame
+
+MAGIC = b"BMKS"
+VERSION = 3
+# Wersje zapisu sesji, które można odtworzyć; wersja 2 dodaje czas zaplanowanego oczekiwania do klatek,
+# a wersja 3 zdarzenia kółka myszy
+SUPPORTED_VERSIONS = (1, 2, 3)
+HEADER = struct.Struct("<4sBQ")
+FRAME = struct.Struct("<HHH")
+# Klatka w wersji 1: czas trwania i liczba zdarzeń; pętla gry nie czekała wtedy na zdarzenia
+FRAME_V1 = struct.Struct("<HH")
+MAX_FRAME_DT = 0xFFFF
+FRAME_TAG = b"F"
+END_TAG = b"E"
+
+POSITION = struct.Struct("<hh")
+BUTTON = struct.Struct("<hhB")
+KEY = struct.Struct("<IH")
+LENGTH = struct.Struct("<H")
+
+# Kody zapisywanych typów zdarzeń; pozostałe zdarzenia nie wpływają na stan gry i nie są zapisywane
+EVENT_CODES = {
+    pygame.QUIT: 0,
+    pygame.MOUSEMOTION: 1,
+    pygame.MOUSEBUTTONDOWN: 2,
+    pygame.MOUSEBUTTONUP: 3,
+    pygame.KEYDOWN: 4,
+    pygame.KEYUP: 5,
+    pygame.DROPFILE: 6,
+    pygame.WINDOWFOCUSLOST: 7,
+    pygame.MOUSEWHEEL: 8,
+}
+EVENT_TYPES = {code: event_type for event_type, code in EVENT_CODES.items()}
+
+
+def _pack_text(text):
+    data = text.encode("utf-8")[:0xFFFF]
+    return LENGTH.pack(len(data)) + data
+
+
+def _unpack_text(data, offset):
+    (length,) = LENGTH.unpack_from(data, offset)
+    offset += LENGTH.size
+    return data[offset:offset + length].decode("utf-8", errors="replace"), offset + length
+
+
+def encode_event(event):
+    """
+        Koduje zdarzenie do postaci binarnej.
+
+        Args:
+            event (Event): Zdarzenie Pygame.
+
+        Returns:
+            bytes | None: Zakodowane zdarzenie lub `None`, jeśli zdarzenie nie jest zapisywane.
+    """
+    code = EVENT_CODES.get(event.type)
+    if code is None:
+        return None
+    data = bytes((code,))
+    if event.type == pygame.MOUSEMOTION:
+        data += POSITION.pack(*event.pos)
+    elif event.type in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP):
+        data += BUTTON.pack(*event.pos, event.button)
+    elif event.type in (pygame.KEYDOWN, pygame.KEYUP):
+        data += KEY.pack(event.key, event.mod)
+        if event.type == pygame.KEYDOWN:
+            data += _pack_text(event.unicode)
+    elif event.type == pygame.DROPFILE:
+        data += _pack_text(event.file)
+    elif event.type == pygame.MOUSEWHEEL:
+        data += POSITION.pack(event.x, event.y)
+    return data
+
+
+def decode_event(data, offset):
+    """
+        Dekoduje zdarzenie zapisane przez `encode_event`.
+
+        Args:
+            data (bytes): Dane zapisu sesji.
+            offset (int): Położenie początku zdarzenia w danych.
+
+        Returns:
+            tuple[Event, int]: Zdarzenie Pygame oraz położenie końca zdarzenia w danych.
+    """
+    event_type = EVENT_TYPES[data[offset]]
+    offset += 1
+    attributes = {}
+    if event_type == pygame.MOUSEMOTION:
+        attributes["pos"] = POSITION.unpack_from(data, offset)
+        offset += POSITION.size
+    elif event_type in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP):
+        x, y, button = BUTTON.unpack_from(data, offset)
+        attributes.update(pos=(x, y), button=button)
+        offset += BUTTON.size
+    elif event_type in (pygame.KEYDOWN, pygame.KEYUP):
+        key, mod = KEY.unpack_from(data, offset)
+        attributes.update(key=key, mod=mod)
+        offset += KEY.size
+        if event_type == pygame.KEYDOWN:
+            attributes["unicode"], offset = _unpack_text(data, offset)
+    elif event_type == pygame.DROPFILE:
+        attributes["file"], offset = _unpack_text(data, offset)
+    elif event_type == pygame.MOUSEWHEEL:
+        x, y = POSITION.unpack_from(data, offset)
+        attributes.update(x=x, y=y)
+        offset += POSITION.size
+    return pygame.event.Event(event_type, attributes), offset
+
+
+def describe_state(scene):
+    """
+        Zwraca stan logiki sceny, który powinien być identyczny po odtworzeniu sesji.
+
+        Args:
+            scene (Scene): Aktywna scena.
+
+        Returns:
+            dict: Nazwa sceny oraz, dla sceny gry, stan zwierzęcia, jedzenia i trybu babeczek.
+    """
+    state = {"scene": type(scene).__name__}
+    game_logic = getattr(scene, "game_logic", None)
+    if game_logic is None:
+        return state
+    animal = game_logic.animal
+    food_manager = scene.food_manager
+    cupcake_mode = scene.cupcake_mode
+    state.update(
+        name=animal.name,
+        age=animal.age,
+        hunger=animal.hunger_level,
+        boredom=animal.boredom_level,
+        position=tuple(scene.launch_logic.position),
+        velocity=tuple(scene.launch_logic.velocity),
+        launch_mode=game_logic.launch_mode,
+        in_cooldown=game_logic.in_cooldown,
+        remaining_food=food_manager.remaining_food,
+        feed_cooldown=food_manager.feed_cooldown,
+        food_position=tuple(food_manager.food_item.rect) if food_manager.food_item else None,
+        cupcake_mode=cupcake_mode.is_active,
+        cupcakes_collected=cupcake_mode.collected_cupcakes,
+        cupcakes_on_screen=len(cupcake_mode.cupcakes),
+    )
+    return state
+
+
+def state_digest(state):
+    """
+        Oblicza skrót stanu zwróconego przez `describe_state`.
+
+        Args:
+            state (dict): Stan sceny.
+
+        Returns:
+            bytes: 20-bajtowy skrót SHA-1 dokładnej reprezentacji stanu.
+    """
+    return hashlib.sha1(repr(sorted(state.items())).encode("utf-8")).digest()
+
+
+class SessionRecorder:
+    """
+    Zapisuje sesję gry do zwięzłego pliku binarnego: ziarno generatora liczb losowych, a dla każdej klatki
+    czas jej trwania, czas zaplanowanego oczekiwania na zdarzenia i zdarzenia wejściowe. Na końcu pliku zapisywany
+    jest skrót stanu gry.
+
+    Atrybuty:
+        seed (int): Ziarno generatora liczb losowych użyte w sesji.
+        frames (int): Liczba zapisanych klatek.
+        file (BufferedWriter): Plik zapisu sesji.
+    """
+    def __init__(self, path, seed):
+        """
+            Otwiera plik zapisu i zapisuje nagłówek.
+
+            Args:
+                path (str): Ścieżka do pliku zapisu sesji.
+                seed (int): Ziarno generatora liczb losowych użyte w sesji.
+        """
+        self.seed = seed
+        self.frames = 0
+        self.file = open(path, "wb")
+        self.file.write(HEADER.pack(MAGIC, VERSION, seed))
+
+    def record(self, dt, events, planned_wait=0):
+        """
+            Zapisuje jedną klatkę.
+
+            Args:
+                dt (int): Czas trwania klatki w milisekundach.
+                events (list[Event]): Zdarzenia z tej klatki.
+                planned_wait (int, optional): Czas zaplanowanego oczekiwania przekazany do `SceneManager.update`.
+                    Domyślnie `0`.
+        """
+        encoded = [data for data in map(encode_event, events) if data is not None]
+        self.file.write(FRAME_TAG + FRAME.pack(min(int(dt), MAX_FRAME_DT), min(int(planned_wait), MAX_FRAME_DT),
+                                               len(encoded)))
+        self.file.write(b"".join(encoded))
+        self.frames += 1
+
+    def close(self, scene=None):
+        """
+            Zamyka plik zapisu, zapisując skrót stanu aktywnej sceny.
+
+            Args:
+                scene (Scene, optional): Aktywna scena w chwili zakończenia sesji. Domyślnie `None` - skrót nie jest
+                    zapisywany.
+        """
+        if self.file.closed:
+            return
+        if scene is not None:
+            self.file.write(END_TAG + state_digest(describe_state(scene)))
+        self.file.close()
+
+
+class SessionLog:
+    """
+    Sesja gry wczytana z pliku zapisanego przez `SessionRecorder`.
+
+    Atrybuty:
+        seed (int): Ziarno generatora liczb losowych użyte w sesji.
+        frames (list[tuple[int, int, list[Event]]]): Czas trwania, czas zaplanowanego oczekiwania i zdarzenia
+            kolejnych klatek.
+        digest (bytes | None): Skrót stanu gry na końcu sesji lub `None`, jeśli sesja nie została poprawnie zamknięta.
+    """
+    def __init__(self, seed, frames, digest=None):
+        self.seed = seed
+        self.frames = frames
+        self.digest = digest
+
+    @staticmethod
+    def load(path):
+        """
+            Wczytuje zapis sesji. Niepełna ostatnia klatka (np. po awarii gry) jest pomijana.
+
+            Args:
+                path (str): Ścieżka do pliku zapisu sesji.
+
+            Returns:
+                SessionLog: Wczytana sesja.
+        """
+        with open(path, "rb") as f:
+            data = f.read()
+        magic, version, seed = HEADER.unpack_from(data, 0)
+        if magic != MAGIC or version not in SUPPORTED_VERSIONS:
+            raise ValueError(f"Not a session log: {path}")
+        offset = HEADER.size
+        frames = []
+        digest = None
+        try:
+            while offset < len(data):
+                tag = data[offset:offset + 1]
+                offset += 1
+                if tag == END_TAG:
+                    digest = data[offset:offset + 20]
+                    break
+                if version == 1:
+                    dt, count = FRAME_V1.unpack_from(data, offset)
+                    planned_wait = 0
+                    offset += FRAME_V1.size
+                else:
+                    dt, planned_wait, count = FRAME.unpack_from(data, offset)
+                    offset += FRAME.size
+                events = []
+                for _ in range(count):
+                    event, offset = decode_event(data, offset)
+                    events.append(event)
+                frames.append((dt, planned_wait, events))
+        except (struct.error, IndexError, KeyError):
+            pass
+        return SessionLog(seed, frames, digest)
@@ -0,0 +1,118 @@
+import glob
+import json
+import math
+import os
+import sys
+import pygame
+from src.managers.asset_manager import load_image
+
+
+def atlas_paths(folder):
+    """
+        Zwraca ścieżki pliku atlasu i tabeli klatek dla folderu z klatkami animacji.
+
+        Args:
+            folder (str): Ścieżka do folderu z klatkami animacji.
+
+        Returns:
+            tuple[str, str]: Ścieżka do obrazu atlasu oraz do pliku JSON z tabelą klatek.
+    """
+    base = os.path.normpath(folder)
+    return f"{base}_atlas.png", f"{base}_atlas.json"
+
+
+def build_atlas(folder, frame_size=None):
+    """
+        Pakuje wszystkie klatki animacji z folderu do jednego obrazu w układzie siatki i zapisuje tabelę klatek.
+
+        Args:
+            folder (str): Ścieżka do folderu z klatkami animacji.
+            frame_size (tuple[int, int], optional): Rozmiar komórki atlasu. Domyślnie rozmiar pierwszej klatki.
+
+        Returns:
+            tuple[str, str]: Ścieżki do zapisanego obrazu atlasu oraz tabeli klatek.
+    """
+    frame_files = sorted(f for f in os.listdir(folder) if f.endswith('.png'))
+    if not frame_files:
+        raise ValueError(f"No frames found in {folder}")
+
+    frames = [pygame.image.load(os.path.join(folder, f)) for f in frame_files]
+    cell_w, cell_h = frame_size or frames[0].get_size()
+    columns = math.ceil(math.sqrt(len(frames)))
+    rows = math.ceil(len(frames) / columns)
+
+    atlas = pygame.Surface((columns * cell_w, rows * cell_h), pygame.SRCALPHA)
+    table = []
+    for i, (frame_file, frame) in enumerate(zip(frame_files, frames)):
+        if frame.get_size() != (cell_w, cell_h):
+            frame = pygame.transform.scale(frame, (cell_w, cell_h))
+        x, y = (i % columns) * cell_w, (i // columns) * cell_h
+        atlas.blit(frame, (x, y))
+        table.append({"file": frame_file, "rect": [x, y, cell_w, cell_h]})
+
+    image_path, table_path = atlas_paths(folder)
+    pygame.image.save(atlas, image_path)
+    with open(table_path, 'w') as f:
+        json.dump({"frame_size": [cell_w, cell_h], "columns": columns, "rows": rows, "frames": table}, f, indent=1)
+    return image_path, table_path
+
+
+def load_atlas(folder, size):
+    """
+        Wczytuje atlas klatek animacji przeskalowany tak, aby każda klatka miała podany rozmiar.
+
+        Atlas jest pomijany, jeśli nie istnieje, brakuje którejś z klatek wymienionych w tabeli lub tabela jest
+        starsza niż folder z klatkami albo najnowszy z plików tych klatek. Czas folderu zmienia się tylko przy
+        dodaniu lub usunięciu klatki, dlatego edycja istniejącej klatki jest wykrywana po czasie jej pliku.
+
+        Args:
+            folder (str): Ścieżka do folderu z klatkami animacji.
+            size (tuple[int, int]): Docelowy rozmiar każdej klatki.
+
+        Returns:
+            tuple[Surface, list[Surface], list[str]] | None: Obraz atlasu, lista klatek jako podpowierzchni atlasu
+            oraz nazwy plików źródłowych klatek, lub `None`, jeśli atlas jest niedostępny.
+    """
+    image_path, table_path = atlas_paths(folder)
+    try:
+        table_mtime = os.path.getmtime(table_path)
+        with open(table_path) as f:
+            table = json.load(f)
+        frame_paths = [os.path.join(folder, entry["file"]) for entry in table["frames"]]
+        sources_mtime = max([os.path.getmtime(folder)] + [os.path.getmtime(path) for path in frame_paths])
+        if table_mtime < sources_mtime:
+            return None
+        width, height = size
+        atlas = load_image(image_path, (table["columns"] * width, table["rows"] * height), None)
+    except (OSError, ValueError, pygame.error):
+        return None
+
+    cell_w, cell_h = table["frame_size"]
+    frames = []
+    files = []
+    for entry in table["frames"]:
+        x, y = entry["rect"][:2]
+        frames.append(atlas.subsurface((x // cell_w * width, y // cell_h * height, width, height)))
+        files.append(entry["file"])
+    return atlas, frames, files
+
+
+def main(argv):
+    """
+        Buduje atlasy dla wszystkich folderów z klatkami postaci.
+
+        Użycie: `python -m src.utils.sprite_atlas [szerokość wysokość]`
+
+        Args:
+            argv (list[str]): Argumenty wiersza poleceń; opcjonalnie rozmiar komórki atlasu.
+    """
+    frame_size = (int(argv[0]), int(argv[1])) if len(argv) >= 2 else None
+    pygame.init()
+    for folder in sorted(glob.glob("assets/characters/*_frames")):
+        image_path, _ = build_atlas(folder, frame_size)
+        print(f"{folder} -> {image_path}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
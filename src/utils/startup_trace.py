@@ -0,0 +1,118 @@
+import builtins
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+# Ustawienie zmiennej środowiskowej STARTUP_TRACE=1 włącza pomiar czasu uruchamiania gry
+ENABLED = os.environ.get("STARTUP_TRACE", "") not in ("", "0")
+CATEGORIES = ("import", "font", "asset")
+SLOWEST_SPANS = 8
+
+
+class StartupTrace:
+    """
+    Mierzy czas od uruchomienia gry do pierwszej wyświetlonej klatki i dzieli go na importy modułów, ładowanie
+    czcionek i dekodowanie obrazów. Raport jest wypisywany na standardowe wyjście błędów po pierwszej klatce.
+
+    Czas każdej kategorii liczony jest bez zagnieżdżonych pomiarów (np. import wywołany w trakcie ładowania czcionki
+    liczy się jako import), więc suma kategorii i pozostałego czasu jest równa czasowi do pierwszej klatki.
+    Mierzony jest tylko wątek główny - wczytywanie zasobów w tle nie opóźnia pierwszej klatki. Gdy pomiar jest
+    wyłączony, `span` nic nie robi, a importy nie są przechwytywane.
+
+    Atrybuty:
+        enabled (bool): Flaga wskazująca, czy pomiar jest włączony.
+        start (float): Czas rozpoczęcia pomiaru w sekundach (`time.perf_counter`).
+        totals (dict[str, float]): Czas własny każdej kategorii w sekundach.
+        spans (list[tuple[str, str, float]]): Kategoria, nazwa i czas trwania zewnętrznych pomiarów w sekundach.
+    """
+
+    enabled = ENABLED
+    start = time.perf_counter()
+    totals = dict.fromkeys(CATEGORIES, 0.0)
+    spans = []
+    _stack = []
+    _original_import = None
+
+    @staticmethod
+    def install():
+        """
+            Zaczyna przechwytywać importy modułów, jeśli pomiar jest włączony. Należy wywołać ją przed importem
+            pozostałych modułów gry.
+        """
+        if not StartupTrace.enabled or StartupTrace._original_import is not None:
+            return
+        StartupTrace._original_import = builtins.__import__
+        builtins.__import__ = StartupTrace._timed_import
+
+    @staticmethod
+    def _timed_import(name, globals=None, locals=None, fromlist=(), level=0):
+        original = StartupTrace._original_import
+        # Moduły już zaimportowane i importy względne nie są mierzone, aby nie spowalniać gorącej ścieżki
+        if level or name in sys.modules:
+            return original(name, globals, locals, fromlist, level)
+        with StartupTrace.span("import", name):
+            return original(name, globals, locals, fromlist, level)
+
+    @staticmethod
+    @contextmanager
+    def span(category, name):
+        """
+            Mierzy czas wykonania bloku kodu.
+
+            Args:
+                category (str): Kategoria pomiaru: `"import"`, `"font"` lub `"asset"`.
+                name (str): Nazwa mierzonej operacji (np. nazwa modułu lub ścieżka pliku).
+        """
+        if not StartupTrace.enabled or threading.current_thread() is not threading.main_thread():
+            yield
+            return
+        frame = [time.perf_counter(), 0.0]
+        StartupTrace._stack.append(frame)
+        try:
+            yield
+        finally:
+            StartupTrace._stack.pop()
+            duration = time.perf_counter() - frame[0]
+            StartupTrace.totals[category] += duration - frame[1]
+            if StartupTrace._stack:
+                StartupTrace._stack[-1][1] += duration
+            else:
+                StartupTrace.spans.append((category, name, duration))
+
+    @staticmethod
+    def first_frame(stream=None):
+        """
+            Kończy pomiar po wyświetleniu pierwszej klatki i wypisuje raport. Kolejne wywołania nic nie robią.
+
+            Args:
+                stream (TextIO, optional): Strumień, do którego wypisywany jest raport. Domyślnie `sys.stderr`.
+        """
+        if not StartupTrace.enabled:
+            return
+        StartupTrace.enabled = False
+        if StartupTrace._original_import is not None:
+            builtins.__import__ = StartupTrace._original_import
+            StartupTrace._original_import = None
+        print(StartupTrace.report(), file=stream or sys.stderr)
+
+    @staticmethod
+    def report():
+        """
+            Tworzy raport z podziałem czasu do pierwszej klatki.
+
+            Returns:
+                str: Raport w postaci tekstu.
+        """
+        elapsed = time.perf_counter() - StartupTrace.start
+        lines = [f"startup: first frame after {elapsed * 1000:.1f} ms"]
+        for category in CATEGORIES:
+            lines.append(f"  {category:<8}{StartupTrace.totals[category] * 1000:8.1f} ms")
+        other = elapsed - sum(StartupTrace.totals.values())
+        lines.append(f"  {'other':<8}{other * 1000:8.1f} ms")
+        lines.append("slowest:")
+        slowest = sorted(StartupTrace.spans, key=lambda span: span[2], reverse=True)[:SLOWEST_SPANS]
+        for category, name, duration in slowest:
+            lines.append(f"  {duration * 1000:8.1f} ms  {category:<8}{name}")
+        return "\n".join(lines)
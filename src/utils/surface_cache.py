@@ -0,0 +1,81 @@
+import pygame
+from src.settings import SCALED_CACHE_MAX_BYTES
+from src.utils.lru_cache import LRUCache
+
+
+def surface_bytes(surface):
+    """
+        Oblicza rozmiar pikseli powierzchni w bajtach.
+
+        Args:
+            surface (Surface): Powierzchnia, której rozmiar jest obliczany.
+
+        Returns:
+            int: Rozmiar danych pikseli w bajtach.
+    """
+    return surface.get_pitch() * surface.get_height()
+
+
+class ScaledSurfaceCache:
+    """
+    Pamięć podręczna przeskalowanych powierzchni, dzięki której skalowanie odbywa się raz, a nie w każdej klatce.
+
+    Wpisy są kluczowane powierzchnią źródłową, indeksem klatki i współczynnikiem skali.
+
+    Atrybuty:
+        cache (LRUCache): Pamięć podręczna z limitem rozmiaru w bajtach.
+    """
+    def __init__(self, max_bytes=SCALED_CACHE_MAX_BYTES):
+        """
+            Inicjalizuje pamięć podręczną przeskalowanych powierzchni.
+
+            Args:
+                max_bytes (int, optional): Maksymalny łączny rozmiar przeskalowanych powierzchni w bajtach.
+        """
+        self.cache = LRUCache(max_bytes=max_bytes, size_of=surface_bytes)
+
+    def get_scaled(self, surface, scale_factor, frame_index=0):
+        """
+            Zwraca powierzchnię przeskalowaną o podany współczynnik, skalując ją tylko przy pierwszym użyciu.
+
+            Args:
+                surface (Surface): Powierzchnia źródłowa.
+                scale_factor (float): Współczynnik skalowania.
+                frame_index (int, optional): Indeks klatki animacji, z której pochodzi powierzchnia. Domyślnie 0.
+
+            Returns:
+                Surface: Przeskalowana powierzchnia.
+        """
+        key = (surface, frame_index, scale_factor)
+        return self.cache.get_or_create(key, lambda: _scale(surface, scale_factor))
+
+    @property
+    def hits(self):
+        return self.cache.hits
+
+    @property
+    def misses(self):
+        return self.cache.misses
+
+    def stats(self):
+        """
+            Zwraca statystyki pamięci podręcznej.
+
+            Returns:
+                dict: Liczba wpisów, rozmiar w bajtach oraz liczniki trafień, chybień i usunięć.
+        """
+        return self.cache.stats()
+
+    def clear(self):
+        """
+            Usuwa wszystkie przeskalowane powierzchnie.
+        """
+        self.cache.clear()
+
+
+def _scale(surface, scale_factor):
+    w, h = surface.get_size()
+    return pygame.transform.scale(surface, (int(w * scale_factor), int(h * scale_factor)))
+
+
+scaled_surface_cache = ScaledSurfaceCache()
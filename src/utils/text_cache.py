@@ -0,0 +1,72 @@
+from src.settings import TEXT_CACHE_MAX_ENTRIES
+from src.utils.lru_cache import LRUCache
+
+
+class TextCache:
+    """
+    Pamięć podręczna wyrenderowanych napisów, dzięki której niezmienny tekst jest rasteryzowany tylko raz.
+
+    Wpisy są kluczowane czcionką, tekstem, flagą wygładzania i kolorem. Zwracane powierzchnie są współdzielone
+    i nie powinny być modyfikowane.
+
+    Atrybuty:
+        cache (LRUCache): Pamięć podręczna z limitem liczby wpisów.
+    """
+    def __init__(self, max_entries=TEXT_CACHE_MAX_ENTRIES):
+        """
+            Inicjalizuje pamięć podręczną napisów.
+
+            Args:
+                max_entries (int, optional): Maksymalna liczba przechowywanych napisów.
+        """
+        self.cache = LRUCache(max_entries=max_entries)
+
+    def render(self, font, text, antialias, color):
+        """
+            Zwraca wyrenderowany napis, renderując go tylko przy pierwszym użyciu.
+
+            Args:
+                font (Font): Czcionka używana do renderowania.
+                text (str): Tekst do wyrenderowania.
+                antialias (bool): Czy wygładzać krawędzie znaków.
+                color (tuple[int, int, int]): Kolor tekstu w formacie RGB.
+
+            Returns:
+                Surface: Powierzchnia z wyrenderowanym tekstem.
+        """
+        key = (font, text, antialias, tuple(color))
+        return self.cache.get_or_create(key, lambda: font.render(text, antialias, color))
+
+    def stats(self):
+        """
+            Zwraca statystyki pamięci podręcznej.
+
+            Returns:
+                dict: Liczba wpisów oraz liczniki trafień, chybień i usunięć.
+        """
+        return self.cache.stats()
+
+    def clear(self):
+        """
+            Usuwa wszystkie wyrenderowane napisy.
+        """
+        self.cache.clear()
+
+
+text_cache = TextCache()
+
+
+def render_text(font, text, antialias, color):
+    """
+        Renderuje napis przez współdzieloną pamięć podręczną napisów.
+
+        Args:
+            font (Font): Czcionka używana do renderowania.
+            text (str): Tekst do wyrenderowania.
+            antialias (bool): Czy wygładzać krawędzie znaków.
+            color (tuple[int, int, int]): Kolor tekstu w formacie RGB.
+
+        Returns:
+            Surface: Powierzchnia z wyrenderowanym tekstem.
+    """
+    return text_cache.render(font, text, antialias, color)
@@ -0,0 +1,116 @@
+import random
+from datetime import datetime, timedelta
+import pytest
+from src.entities.animal import Animal
+from src.logic.catch_up import EXACT_SAMPLE_LIMIT, elapsed_since, fast_forward, sample_need_increase
+from src.logic.food_manager import FoodManager
+from src.logic.game_logic import GameLogic, NEED_INCREASE_RANGE
+from src.managers.save_codec import TIMESTAMP_FORMAT
+
+LOW, HIGH = NEED_INCREASE_RANGE
+
+
+def create_game(seed=0, playtime=30):
+    animal = Animal(static_asset=None, name="test")
+    rng = random.Random(seed)
+    return GameLogic(animal, playtime, rng=rng), FoodManager(3, animal, rng=rng)
+
+
+def deterministic_state(game_logic, food_manager):
+    return (
+        game_logic.animal.age,
+        game_logic.launch_mode,
+        game_logic.in_cooldown,
+        round(game_logic.playtime_remaining, 6),
+        round(game_logic.cooldown_timer, 6),
+        round(game_logic.boredom_timer, 6),
+        round(game_logic.hunger_timer, 6),
+        round(game_logic.age_timer, 6),
+        round(food_manager.feed_cooldown, 6),
+        food_manager.remaining_food,
+    )
+
+
+def test_idle_catch_up_keeps_timer_phase():
+    game_logic, food_manager = create_game()
+
+    fast_forward(game_logic, food_manager, 5500)
+
+    assert game_logic.hunger_timer == pytest.approx(500)
+    assert game_logic.boredom_timer == pytest.approx(500)
+    assert game_logic.age_timer == pytest.approx(5500)
+    assert 5 * LOW <= game_logic.animal.hunger_level <= 5 * HIGH
+    assert 5 * LOW <= game_logic.animal.boredom_level <= 5 * HIGH
+
+
+@pytest.mark.parametrize("elapsed", [0, 999, 61_000, 185_000, 3_600_000])
+def test_fast_forward_matches_stepping_through_play_and_cooldown(elapsed):
+    stepped = create_game()
+    skipped = create_game()
+    for game_logic, food_manager in (stepped, skipped):
+        game_logic.toggle_launch_mode()
+        game_logic.playtime_remaining = 12_000
+        food_manager.feed_cooldown = 20_000
+        food_manager.remaining_food = 0
+
+    remaining = elapsed
+    while remaining > 0:
+        dt = min(100, remaining)
+        stepped[0].update(dt, False)
+        stepped[1].update(dt)
+        remaining -= dt
+    fast_forward(*skipped, elapsed)
+
+    assert deterministic_state(*skipped) == deterministic_state(*stepped)
+
+
+def test_fast_forward_defaults_to_game_logic_rng():
+    first = create_game(seed=7)
+    second = create_game(seed=7)
+
+    fast_forward(*first, 10_000)
+    fast_forward(*second, 10_000)
+
+    assert first[0].animal.hunger_level == second[0].animal.hunger_level
+    assert first[0].animal.boredom_level == second[0].animal.boredom_level
+
+
+def test_fast_forward_ignores_negative_elapsed_time():
+    game_logic, food_manager = create_game()
+    before = deterministic_state(game_logic, food_manager)
+
+    fast_forward(game_logic, food_manager, -1000)
+
+    assert deterministic_state(game_logic, food_manager) == before
+
+
+@pytest.mark.parametrize("ticks", [1, EXACT_SAMPLE_LIMIT, EXACT_SAMPLE_LIMIT + 1, 60])
+def test_sample_need_increase_stays_within_possible_range(ticks):
+    rng = random.Random(ticks)
+    for _ in range(200):
+        level = sample_need_increase(10, ticks, rng)
+        assert 10 + ticks * LOW <= level <= min(100, 10 + ticks * HIGH)
+
+
+def test_sample_need_increase_saturates_without_drawing():
+    class NoRandom:
+        def uniform(self, *args):
+            raise AssertionError("rng should not be used")
+
+        gauss = uniform
+
+    assert sample_need_increase(99, 10, NoRandom()) == 100
+    assert sample_need_increase(42, 0, NoRandom()) == 42
+
+
+def test_elapsed_since_accepts_epoch_and_legacy_timestamps():
+    now = datetime(2024, 5, 1, 12, 0, 0)
+    saved = now - timedelta(minutes=3)
+
+    assert elapsed_since(saved.timestamp(), now) == pytest.approx(180_000)
+    assert elapsed_since(saved.strftime(TIMESTAMP_FORMAT), now) == pytest.approx(180_000)
+
+
+@pytest.mark.parametrize("timestamp", [None, "not a date", 4_102_444_800.0])
+def test_elapsed_since_is_zero_for_missing_invalid_or_future_timestamps(timestamp):
+    assert elapsed_since(timestamp, datetime(2024, 5, 1)) == 0
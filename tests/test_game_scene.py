@@ -0,0 +1,66 @@
+import random
+import pygame
+import pytest
+from src.entities.animal import Animal
+from src.main import load_fonts
+from src.scenes import game_scene as game_scene_module
+from src.scenes.game_scene import GameScene
+from src.utils.animated_asset import AnimatedAsset
+from src.utils.asset import Asset
+
+CHARACTER_SIZE = (150, 150)
+AUTOSAVE_INTERVAL = 250
+
+
+class RecordingWorker:
+    def __init__(self):
+        self.snapshots = []
+
+    def submit(self, snapshot):
+        self.snapshots.append(snapshot)
+
+
+@pytest.fixture
+def worker(monkeypatch):
+    worker = RecordingWorker()
+    monkeypatch.setattr(game_scene_module, "get_autosave_worker", lambda: worker)
+    return worker
+
+
+@pytest.fixture
+def game_scene(monkeypatch, worker):
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    load_fonts()
+    monkeypatch.setattr(GameScene, "autosave_interval", AUTOSAVE_INTERVAL)
+    animal = Animal(
+        static_asset=Asset("assets/characters/hello_kitty.png", CHARACTER_SIZE, (0, 0)),
+        animated_asset=AnimatedAsset("assets/characters/hellokitty_frames", CHARACTER_SIZE, (0, 0)),
+        name="test",
+    )
+    scene = GameScene(animal, 3, 30, rng=random.Random(7))
+    yield scene
+    scene.on_exit()
+    pygame.quit()
+
+
+def test_autosave_keeps_leftover_time(game_scene, worker):
+    # 63 kroków po 16 ms to 1008 ms: zapisy powinny nastąpić w 250, 500, 750 i 1000 ms
+    for _ in range(63):
+        game_scene.update(16)
+
+    assert len(worker.snapshots) == 4
+    assert worker.snapshots[-1]["name"] == "test"
+
+
+def test_next_deadline_includes_autosave(game_scene):
+    assert game_scene.next_deadline() == AUTOSAVE_INTERVAL
+    game_scene.update(100)
+    assert game_scene.next_deadline() == pytest.approx(AUTOSAVE_INTERVAL - 100)
+
+
+def test_exit_cancels_autosave(game_scene, worker):
+    game_scene.on_exit()
+    game_scene.game_logic.scheduler.advance(AUTOSAVE_INTERVAL * 4)
+
+    assert worker.snapshots == []
@@ -0,0 +1,58 @@
+import random
+import pygame
+import pytest
+from src.entities.animal import Animal
+from src.headless import HeadlessSimulation
+from src.main import load_fonts
+from src.scenes.game_scene import GameScene
+from src.utils.animated_asset import AnimatedAsset
+from src.utils.asset import Asset
+
+SEED = 11
+CHARACTER_PATH = "assets/characters/hello_kitty.png"
+CHARACTER_SIZE = (150, 150)
+
+
+@pytest.fixture
+def game_scene(monkeypatch):
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    load_fonts()
+    monkeypatch.setattr(GameScene, "autosave_interval", 0)
+    animal = Animal(
+        static_asset=Asset(CHARACTER_PATH, CHARACTER_SIZE, (0, 0)),
+        animated_asset=AnimatedAsset("assets/characters/hellokitty_frames", CHARACTER_SIZE, (0, 0)),
+        name="test",
+    )
+    scene = GameScene(animal, 3, 30, rng=random.Random(SEED))
+    yield scene
+    scene.on_exit()
+    pygame.quit()
+
+
+def state(launch_logic, game_logic):
+    return (
+        launch_logic.position.topleft,
+        tuple(launch_logic.exact_position),
+        tuple(launch_logic.velocity),
+        game_logic.launch_mode,
+        game_logic.animal.boredom_level,
+        game_logic.animal.hunger_level,
+    )
+
+
+def test_headless_simulation_matches_game_scene(game_scene):
+    simulation = HeadlessSimulation(rng=random.Random(SEED))
+    simulation.launch_logic.set_position(game_scene.launch_logic.position.copy())
+    for game_logic, launch_logic in ((game_scene.game_logic, game_scene.launch_logic),
+                                     (simulation.game_logic, simulation.launch_logic)):
+        game_logic.toggle_launch_mode()
+        launch_logic.launch()
+
+    for _ in range(600):
+        game_scene.update(16)
+        simulation.step(16)
+
+    assert state(simulation.launch_logic, simulation.game_logic) == \
+        state(game_scene.launch_logic, game_scene.game_logic)
+    assert simulation.launch_logic.exact_position != pygame.math.Vector2(simulation.launch_logic.position.topleft)
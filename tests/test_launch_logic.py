@@ -0,0 +1,44 @@
+import random
+import pygame
+from src.logic.game_step import step_game
+from src.logic.launch_logic import LaunchLogic
+from src.headless import HeadlessSimulation
+
+
+class NoDrift(random.Random):
+    def uniform(self, a, b):
+        return 0.0
+
+
+def create_launch_logic(velocity):
+    launch_logic = LaunchLogic(10_000, 10_000, rng=NoDrift())
+    launch_logic.set_position(pygame.Rect(100, 100, 10, 10))
+    launch_logic.velocity = pygame.math.Vector2(velocity, 0)
+    return launch_logic
+
+
+def test_fractional_velocity_accumulates_over_steps():
+    launch_logic = create_launch_logic(1.4)
+    expected = 100.0
+    for _ in range(10):
+        expected += launch_logic.velocity.x
+        launch_logic.update()
+
+    assert launch_logic.exact_position.x == expected
+    assert launch_logic.position.x == round(expected)
+    assert launch_logic.position.x > 100 + 10
+
+
+def test_step_game_keeps_sub_pixel_position():
+    simulation = HeadlessSimulation(rng=random.Random(3))
+    launch_logic = simulation.launch_logic
+    launch_logic.rng = NoDrift()
+    launch_logic.velocity = pygame.math.Vector2(1.4, 0)
+    start = launch_logic.position.x
+
+    for _ in range(5):
+        step_game(16, simulation.game_logic, launch_logic, simulation.food_manager, simulation.cupcake_mode)
+
+    # 1.4 + 1.372 + ... (tłumienie 0.98 na krok) daje ponad 6.5 piksela, a nie 5 pikseli po zaokrąglaniu w każdym kroku
+    assert launch_logic.exact_position.x - start > 6.5
+    assert launch_logic.position.x == round(launch_logic.exact_position.x)
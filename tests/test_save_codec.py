@@ -0,0 +1,128 @@
+import os
+from datetime import datetime
+import pytest
+from src.managers.save_codec import (HEADER, MAGIC, TIMESTAMP_FORMAT, VERSION, decode_legacy_save, decode_save,
+                                     encode_save, write_atomic)
+
+SAVE_DATA = {
+    "name": "Kitty Żółw",
+    "age": 3,
+    "hunger_level": 42.5,
+    "boredom_level": 17.25,
+    "quantity": 3,
+    "remaining": 1,
+    "cooldown": 1500.0,
+    "playtime": 30,
+    "playtime_remaining": 12000.0,
+    "in_cooldown": True,
+    "cooldown_timer": 2500.0,
+    "timestamp": 1714557600.5,
+    "static_asset_size": (150, 150),
+    "static_asset_position": (10, 20),
+    "animated_asset_size": (200, 180),
+    "animated_asset_position": (30, 40),
+    "static_asset_path": "assets/characters/kitty.png",
+    "animated_asset_path": "assets/animations/kitty",
+    "label": None,
+}
+
+LEGACY_SAVE = """name=Kitty
+age=3
+hunger_level=42.5
+boredom_level=17.25
+quantity=3
+remaining=1
+cooldown=1500.0
+playtime=30
+playtime_remaining=12000.0
+in_cooldown=1
+cooldown_timer=2500.0
+
+timestamp=2024-05-01 12:00:00
+static_asset_path=assets/characters/kitty.png
+static_asset_size=150,150
+static_asset_position=10,20
+animated_asset_path=assets/animations/kitty
+animated_asset_size=200,180
+animated_asset_position=30,40
+label=None
+"""
+
+
+def test_round_trip_preserves_every_field():
+    payload = encode_save(SAVE_DATA)
+
+    assert payload.startswith(MAGIC)
+    assert decode_save(payload) == SAVE_DATA
+
+
+def test_round_trip_keeps_empty_string_distinct_from_none():
+    data = dict(SAVE_DATA, label="", name="")
+
+    decoded = decode_save(encode_save(data))
+
+    assert decoded["label"] == ""
+    assert decoded["name"] == ""
+
+
+def test_legacy_text_save_is_migrated():
+    data = decode_legacy_save(LEGACY_SAVE.encode("utf-8"))
+
+    assert data["label"] is None
+    assert data["timestamp"] == datetime.strptime("2024-05-01 12:00:00", TIMESTAMP_FORMAT).timestamp()
+    assert data["static_asset_size"] == (150, 150)
+    assert decode_save(LEGACY_SAVE.encode("utf-8")) == data
+    # Przy następnym zapisie starszy zapis trafia do formatu binarnego bez utraty danych
+    assert decode_save(encode_save(data)) == dict(data, in_cooldown=True)
+
+
+def test_legacy_save_with_invalid_timestamp_has_no_timestamp():
+    data = decode_legacy_save(b"name=Kitty\ntimestamp=yesterday\n")
+
+    assert data == {"name": "Kitty", "timestamp": None}
+
+
+@pytest.mark.parametrize("cut", [HEADER.size + 3, -3])
+def test_truncated_save_raises_value_error(cut):
+    with pytest.raises(ValueError):
+        decode_save(encode_save(SAVE_DATA)[:cut])
+
+
+def test_unsupported_version_raises_value_error():
+    payload = encode_save(SAVE_DATA)
+    payload = HEADER.pack(MAGIC, VERSION + 1) + payload[HEADER.size:]
+
+    with pytest.raises(ValueError, match="Unsupported save version"):
+        decode_save(payload)
+
+
+def test_too_long_string_field_raises_value_error():
+    with pytest.raises(ValueError):
+        encode_save(dict(SAVE_DATA, name="x" * 0x10000))
+
+
+def test_write_atomic_replaces_file_and_leaves_no_temporary_file(tmp_path):
+    path = os.path.join(tmp_path, "kitty.meow")
+    write_atomic(path, b"old")
+
+    write_atomic(path, b"new", sync=False)
+
+    with open(path, "rb") as f:
+        assert f.read() == b"new"
+    assert os.listdir(tmp_path) == ["kitty.meow"]
+
+
+def test_write_atomic_keeps_previous_file_when_write_fails(tmp_path, monkeypatch):
+    path = os.path.join(tmp_path, "kitty.meow")
+    write_atomic(path, b"old")
+
+    def fail(*args):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(os, "replace", fail)
+    with pytest.raises(OSError):
+        write_atomic(path, b"new")
+
+    with open(path, "rb") as f:
+        assert f.read() == b"old"
+    assert os.listdir(tmp_path) == ["kitty.meow"]
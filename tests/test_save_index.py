@@ -0,0 +1,138 @@
+import os
+import pytest
+from src.managers.save_codec import encode_save, write_atomic
+from src.managers.save_index import INDEX_FILE, SaveIndex, SaveSlot
+from tests.test_save_codec import SAVE_DATA
+
+
+def write_save(save_dir, name, timestamp, index=None):
+    data = dict(SAVE_DATA, name=name, timestamp=timestamp)
+    file = f"{name}.meow"
+    write_atomic(os.path.join(save_dir, file), encode_save(data), sync=False)
+    if index is not None:
+        index.update(SaveSlot.from_save(file, data))
+    return file
+
+
+def touch_directory(save_dir):
+    # Czas modyfikacji katalogu ma ograniczoną rozdzielczość; zmiana poza indeksem musi być widoczna w teście
+    stamp = os.stat(save_dir).st_mtime_ns + 1_000_000_000
+    os.utime(save_dir, ns=(stamp, stamp))
+
+
+@pytest.fixture
+def save_dir(tmp_path):
+    return str(tmp_path)
+
+
+def test_missing_index_is_rebuilt_from_save_files(save_dir):
+    write_save(save_dir, "older", 100.0)
+    write_save(save_dir, "newer", 200.0)
+
+    index = SaveIndex(save_dir)
+
+    assert [slot.file for slot in index.recent()] == ["newer.meow", "older.meow"]
+    assert index.recent()[0].name == "newer"
+    assert index.rebuilds == 1
+    assert os.path.exists(os.path.join(save_dir, INDEX_FILE))
+
+
+def test_fresh_index_is_read_without_rebuilding(save_dir):
+    write_save(save_dir, "kitty", 100.0)
+    SaveIndex(save_dir).recent()
+
+    index = SaveIndex(save_dir)
+
+    assert [slot.file for slot in index.recent()] == ["kitty.meow"]
+    assert index.rebuilds == 0
+
+
+def test_updates_keep_index_fresh(save_dir):
+    index = SaveIndex(save_dir)
+    index.recent()
+    write_save(save_dir, "kitty", 100.0, index)
+    write_save(save_dir, "puppy", 200.0, index)
+
+    assert [slot.file for slot in index.recent()] == ["puppy.meow", "kitty.meow"]
+    assert index.rebuilds == 1
+    assert SaveIndex(save_dir).get("kitty.meow").timestamp == 100.0
+
+
+def test_changes_from_another_index_object_are_reloaded(save_dir):
+    reader = SaveIndex(save_dir)
+    reader.recent()
+    writer = SaveIndex(save_dir)
+
+    write_save(save_dir, "kitty", 100.0, writer)
+
+    assert reader.get("kitty.meow") is not None
+    assert reader.rebuilds == 1
+
+
+def test_changes_from_another_index_object_are_reloaded_within_one_directory_tick(save_dir, monkeypatch):
+    monkeypatch.setattr(SaveIndex, "_directory_stamp", lambda self: 1_000_000_000)
+    reader = SaveIndex(save_dir)
+    reader.recent()
+    writer = SaveIndex(save_dir)
+
+    write_save(save_dir, "kitty", 100.0, writer)
+
+    assert [slot.file for slot in reader.recent()] == ["kitty.meow"]
+    assert reader.rebuilds == 1
+
+
+def test_file_added_outside_the_index_marks_it_stale(save_dir):
+    index = SaveIndex(save_dir)
+    write_save(save_dir, "kitty", 100.0, index)
+    index.recent()
+
+    write_save(save_dir, "copied", 300.0)
+    touch_directory(save_dir)
+
+    assert [slot.file for slot in index.recent()] == ["copied.meow", "kitty.meow"]
+    assert index.rebuilds == 2
+
+
+def test_removed_entry_is_dropped(save_dir):
+    index = SaveIndex(save_dir)
+    file = write_save(save_dir, "kitty", 100.0, index)
+
+    os.remove(os.path.join(save_dir, file))
+    index.remove(file)
+
+    assert index.recent() == []
+    assert SaveIndex(save_dir).recent() == []
+
+
+def test_corrupted_index_is_rebuilt(save_dir):
+    write_save(save_dir, "kitty", 100.0, SaveIndex(save_dir))
+    index_path = os.path.join(save_dir, INDEX_FILE)
+    stat = os.stat(index_path)
+    with open(index_path, "wb") as f:
+        f.write(b"MEOI\x01garbage")
+    os.utime(index_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    index = SaveIndex(save_dir)
+
+    assert [slot.file for slot in index.recent()] == ["kitty.meow"]
+    assert index.rebuilds == 1
+
+
+def test_rebuild_skips_unreadable_saves(save_dir):
+    write_save(save_dir, "kitty", 100.0)
+    with open(os.path.join(save_dir, "broken.meow"), "wb") as f:
+        f.write(b"MEOW\x01")
+
+    index = SaveIndex(save_dir)
+
+    assert [slot.file for slot in index.recent()] == ["kitty.meow"]
+
+
+def test_legacy_save_is_indexed_with_its_timestamp(save_dir):
+    with open(os.path.join(save_dir, "old.meow"), "w") as f:
+        f.write("name=Old Kitty\nage=4\ntimestamp=2024-05-01 12:00:00\nlabel=None\n")
+
+    slot = SaveIndex(save_dir).get("old.meow")
+
+    assert (slot.name, slot.age, slot.character) == ("Old Kitty", 4, "")
+    assert slot.timestamp > 0
@@ -0,0 +1,95 @@
+import os
+import threading
+import pytest
+from src.managers.autosave import AutosaveWorker
+from src.managers.save_manager import SaveManager
+from tests.test_save_codec import SAVE_DATA
+
+
+@pytest.fixture
+def save_manager(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return SaveManager()
+
+
+def snapshot(name, timestamp):
+    return dict(SAVE_DATA, name=name, timestamp=timestamp)
+
+
+def saved_files():
+    return sorted(file for file in os.listdir("saves") if file.endswith(".meow"))
+
+
+def test_save_over_limit_evicts_oldest(save_manager):
+    save_manager.max_saves = 2
+    for timestamp, name in enumerate(["first", "second", "third"]):
+        assert save_manager.write_snapshot(snapshot(name, timestamp))
+
+    assert saved_files() == ["second.meow", "third.meow"]
+    assert save_manager.get_recent_saves() == ["third.meow", "second.meow"]
+
+
+def test_overwriting_a_save_does_not_evict(save_manager):
+    save_manager.max_saves = 2
+    save_manager.write_snapshot(snapshot("first", 1))
+    save_manager.write_snapshot(snapshot("second", 2))
+
+    save_manager.write_snapshot(snapshot("first", 3))
+
+    assert saved_files() == ["first.meow", "second.meow"]
+
+
+def test_write_without_eviction_keeps_every_save(save_manager):
+    save_manager.max_saves = 2
+    for timestamp, name in enumerate(["first", "second", "third"]):
+        save_manager.write_snapshot(snapshot(name, timestamp), evict=False)
+
+    assert saved_files() == ["first.meow", "second.meow", "third.meow"]
+
+
+def test_autosave_never_evicts(save_manager):
+    save_manager.max_saves = 1
+    save_manager.write_snapshot(snapshot("manual", 1))
+
+    def create_save_manager():
+        manager = SaveManager()
+        manager.max_saves = 1
+        return manager
+
+    worker = AutosaveWorker(create_save_manager)
+    worker.submit(snapshot("autosaved", 2))
+
+    assert worker.flush(5)
+    assert worker.written == 1
+    assert saved_files() == ["autosaved.meow", "manual.meow"]
+
+
+def test_autosave_and_main_thread_share_a_consistent_index(save_manager):
+    worker = AutosaveWorker()
+    stop = threading.Event()
+    errors = []
+
+    def read_index():
+        reader = SaveManager()
+        while not stop.is_set():
+            try:
+                reader.get_recent_slots()
+            except Exception as e:
+                errors.append(e)
+
+    reader_thread = threading.Thread(target=read_index)
+    reader_thread.start()
+    try:
+        for i in range(100):
+            worker.submit(snapshot(f"pet{i % 10}", i))
+            if i % 10 == 0:
+                save_manager.write_snapshot(snapshot(f"manual{i}", i))
+        assert worker.flush(10)
+    finally:
+        stop.set()
+        reader_thread.join()
+
+    assert errors == []
+    assert worker.failed == 0
+    assert sorted(slot.file for slot in SaveManager().get_recent_slots()) == saved_files()
+    assert len(saved_files()) == 20
@@ -0,0 +1,51 @@
+import pygame
+import pytest
+from src.main import load_fonts
+from src.managers.asset_manager import AssetManager
+from src.managers.scene_manager import SceneManager
+from src.scenes.base_scene import BaseScene
+from src.scenes.menu_scene import LOGO_PATH, MenuScene
+from src.scenes.scene_registry import SceneRegistry
+
+
+class OtherScene(BaseScene):
+    pass
+
+
+@pytest.fixture
+def registry():
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    load_fonts()
+    SceneRegistry.clear()
+    AssetManager.evict_unused()
+    yield SceneRegistry
+    SceneRegistry.clear()
+    AssetManager.evict_unused()
+    pygame.quit()
+
+
+def logo_entries():
+    return [entry for key, entry in AssetManager._entries.items() if key[0] == LOGO_PATH]
+
+
+def test_menu_round_trips_load_logo_once(registry):
+    loads_before = AssetManager.loads
+    manager = SceneManager(registry.get(MenuScene))
+    for _ in range(3):
+        manager.switch_scene(OtherScene())
+        manager.switch_scene(registry.get(MenuScene))
+
+    assert AssetManager.loads == loads_before + 1
+    assert [entry[1] for entry in logo_entries()] == [1]
+
+
+def test_discarded_menu_releases_logo(registry):
+    menu = registry.get(MenuScene)
+    manager = SceneManager(menu)
+    manager.switch_scene(OtherScene())
+
+    registry.evict(MenuScene)
+    AssetManager.evict_unused()
+
+    assert logo_entries() == []
@@ -0,0 +1,110 @@
+import pytest
+from src.logic.scheduler import Scheduler
+
+
+def test_repeating_timer_carries_overshoot_into_next_period():
+    scheduler = Scheduler()
+    calls = []
+    timer = scheduler.call_every(1000, lambda: calls.append(scheduler.now))
+
+    scheduler.advance(1300)
+    assert calls == [1000]
+    assert scheduler.elapsed(timer) == 300
+
+    scheduler.advance(700)
+    assert calls == [1000, 2000]
+    assert scheduler.remaining(timer) == 1000
+
+
+def test_large_step_fires_repeating_timer_once_per_period():
+    scheduler = Scheduler()
+    calls = []
+    scheduler.call_every(100, lambda: calls.append(scheduler.now))
+
+    assert scheduler.advance(350) == 3
+    assert calls == [100, 200, 300]
+    assert scheduler.now == 350
+
+
+def test_timers_fire_in_due_order_and_fifo_for_equal_due_times():
+    scheduler = Scheduler()
+    calls = []
+    scheduler.call_later(50, lambda: calls.append("b"))
+    scheduler.call_later(20, lambda: calls.append("a"))
+    scheduler.call_later(50, lambda: calls.append("c"))
+
+    scheduler.advance(100)
+    assert calls == ["a", "b", "c"]
+
+
+def test_one_shot_timer_fires_once():
+    scheduler = Scheduler()
+    calls = []
+    timer = scheduler.call_later(10, lambda: calls.append(1))
+
+    scheduler.advance(100)
+    scheduler.advance(100)
+    assert calls == [1]
+    assert not timer.active
+    assert scheduler.remaining(timer) == 0
+
+
+def test_cancelled_timer_does_not_fire():
+    scheduler = Scheduler()
+    calls = []
+    timer = scheduler.call_every(10, lambda: calls.append(1))
+    scheduler.cancel(timer)
+
+    assert scheduler.advance(100) == 0
+    assert scheduler.time_until_next() is None
+
+
+def test_pause_keeps_remaining_time_until_resume():
+    scheduler = Scheduler()
+    calls = []
+    timer = scheduler.call_every(1000, lambda: calls.append(scheduler.now))
+
+    scheduler.advance(400)
+    scheduler.pause(timer)
+    scheduler.advance(5000)
+    assert calls == []
+    assert scheduler.remaining(timer) == 600
+
+    scheduler.resume(timer)
+    scheduler.advance(600)
+    assert calls == [6000]
+
+
+def test_set_remaining_keeps_paused_timer_paused():
+    scheduler = Scheduler()
+    timer = scheduler.call_every(1000, lambda: None)
+    scheduler.pause(timer)
+
+    scheduler.set_remaining(timer, 250)
+    assert scheduler.advance(1000) == 0
+    assert scheduler.remaining(timer) == 250
+
+
+def test_reschedule_moves_due_time_and_skips_stale_entry():
+    scheduler = Scheduler()
+    calls = []
+    timer = scheduler.call_later(100, lambda: calls.append(scheduler.now))
+
+    scheduler.reschedule(timer, 300)
+    assert scheduler.time_until_next() == 300
+    scheduler.advance(1000)
+    assert calls == [300]
+
+
+def test_callback_can_schedule_timer_due_in_same_advance():
+    scheduler = Scheduler()
+    calls = []
+    scheduler.call_later(10, lambda: scheduler.call_later(10, lambda: calls.append(scheduler.now)))
+
+    scheduler.advance(50)
+    assert calls == [20]
+
+
+def test_call_every_rejects_non_positive_interval():
+    with pytest.raises(ValueError):
+        Scheduler().call_every(0, lambda: None)
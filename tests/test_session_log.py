@@ -0,0 +1,85 @@
+import os
+import pygame
+import pytest
+from src.utils.session_log import (END_TAG, FRAME, FRAME_TAG, FRAME_V1, HEADER, MAGIC, VERSION, SessionLog,
+                                   SessionRecorder, encode_event)
+
+DIGEST = bytes(range(20))
+
+
+def write_log(tmp_path, version, frames, digest=DIGEST):
+    parts = [HEADER.pack(MAGIC, version, 1234)]
+    for dt, planned_wait, events in frames:
+        encoded = [encode_event(event) for event in events]
+        if version == 1:
+            parts.append(FRAME_TAG + FRAME_V1.pack(dt, len(encoded)))
+        else:
+            parts.append(FRAME_TAG + FRAME.pack(dt, planned_wait, len(encoded)))
+        parts.extend(encoded)
+    if digest is not None:
+        parts.append(END_TAG + digest)
+    path = os.path.join(tmp_path, f"v{version}.bin")
+    with open(path, "wb") as f:
+        f.write(b"".join(parts))
+    return path
+
+
+def describe(frames):
+    return [(dt, planned_wait, [(event.type, event.dict) for event in events]) for dt, planned_wait, events in frames]
+
+
+def test_recorder_round_trip(tmp_path):
+    path = os.path.join(tmp_path, "session.bin")
+    events = [
+        pygame.event.Event(pygame.MOUSEMOTION, pos=(10, 20)),
+        pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(-5, 600), button=1),
+        pygame.event.Event(pygame.KEYDOWN, key=pygame.K_a, mod=0, unicode="ą"),
+        pygame.event.Event(pygame.KEYUP, key=pygame.K_a, mod=0),
+        pygame.event.Event(pygame.DROPFILE, file="assets/audio/miau.mp3"),
+        pygame.event.Event(pygame.MOUSEWHEEL, x=0, y=-2),
+        pygame.event.Event(pygame.VIDEOEXPOSE),
+    ]
+    recorder = SessionRecorder(path, 1234)
+    recorder.record(16, events)
+    recorder.record(100000, [], planned_wait=250)
+    recorder.close()
+
+    log = SessionLog.load(path)
+
+    assert log.seed == 1234
+    assert log.digest is None
+    assert describe(log.frames) == describe([(16, 0, events[:-1]), (0xFFFF, 250, [])])
+
+
+@pytest.mark.parametrize("version", [1, 2, VERSION])
+def test_supported_versions_load(tmp_path, version):
+    click = pygame.event.Event(pygame.MOUSEBUTTONUP, pos=(1, 2), button=3)
+    path = write_log(tmp_path, version, [(16, 40, [click]), (17, 0, [])])
+
+    log = SessionLog.load(path)
+
+    planned_wait = 0 if version == 1 else 40
+    assert describe(log.frames) == describe([(16, planned_wait, [click]), (17, 0, [])])
+    assert log.digest == DIGEST
+
+
+def test_truncated_last_frame_is_dropped(tmp_path):
+    path = write_log(tmp_path, VERSION, [(16, 0, []), (17, 0, [pygame.event.Event(pygame.MOUSEMOTION, pos=(1, 1))])],
+                     digest=None)
+    with open(path, "rb+") as f:
+        f.truncate(os.path.getsize(path) - 2)
+
+    log = SessionLog.load(path)
+
+    assert [frame[0] for frame in log.frames] == [16]
+    assert log.digest is None
+
+
+@pytest.mark.parametrize("header", [HEADER.pack(b"NOPE", VERSION, 0), HEADER.pack(MAGIC, VERSION + 1, 0)])
+def test_unknown_files_are_rejected(tmp_path, header):
+    path = os.path.join(tmp_path, "session.bin")
+    with open(path, "wb") as f:
+        f.write(header)
+
+    with pytest.raises(ValueError):
+        SessionLog.load(path)
@@ -0,0 +1,55 @@
+import os
+import pygame
+import pytest
+from src.utils.sprite_atlas import atlas_paths, build_atlas, load_atlas
+
+FRAME_SIZE = (4, 4)
+
+
+@pytest.fixture
+def frames_folder(tmp_path):
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    folder = tmp_path / "cat_frames"
+    folder.mkdir()
+    for i, color in enumerate([(255, 0, 0), (0, 255, 0)]):
+        frame = pygame.Surface(FRAME_SIZE, pygame.SRCALPHA)
+        frame.fill(color)
+        pygame.image.save(frame, str(folder / f"frame_{i}.png"))
+    build_atlas(str(folder))
+    yield str(folder)
+    pygame.quit()
+
+
+def age_atlas(folder, seconds):
+    # Czas modyfikacji ma ograniczoną rozdzielczość, więc atlas jest jawnie cofany w czasie
+    for path in atlas_paths(folder):
+        mtime = os.path.getmtime(path) - seconds
+        os.utime(path, (mtime, mtime))
+
+
+def test_fresh_atlas_is_loaded(frames_folder):
+    loaded = load_atlas(frames_folder, FRAME_SIZE)
+
+    assert loaded is not None
+    assert loaded[2] == ["frame_0.png", "frame_1.png"]
+
+
+def test_edited_frame_makes_atlas_stale(frames_folder):
+    age_atlas(frames_folder, 10)
+    folder_mtime = os.path.getmtime(frames_folder) - 20
+
+    # Edycja klatki w miejscu nie zmienia czasu modyfikacji folderu
+    frame = pygame.Surface(FRAME_SIZE, pygame.SRCALPHA)
+    frame.fill((0, 0, 255))
+    pygame.image.save(frame, os.path.join(frames_folder, "frame_1.png"))
+    os.utime(frames_folder, (folder_mtime, folder_mtime))
+
+    assert load_atlas(frames_folder, FRAME_SIZE) is None
+
+
+def test_missing_frame_makes_atlas_stale(frames_folder):
+    os.remove(os.path.join(frames_folder, "frame_0.png"))
+    age_atlas(frames_folder, -10)
+
+    assert load_atlas(frames_folder, FRAME_SIZE) is None